@@ -3,7 +3,16 @@
 from dataclasses import dataclass, field
 from typing import Any, cast
 
-from core.messages import Msg
+from core.messages import (
+    AcceptMsg,
+    AssignmentConfirmedMsg,
+    DeliveryBatchConfirmedMsg,
+    DeliveryConfirmedMsg,
+    Msg,
+    PickupConfirmedMsg,
+    ProposalMsg,
+    RejectMsg,
+)
 from core.packages.package import Package
 from core.types import AgentID, NegotiationStatus, NodeID, PackageID, PackageStatus, SiteID
 from world.world import World
@@ -139,18 +148,20 @@ class Broker:
     def _process_inbox(self, world: World) -> None:
         """Process all messages in inbox."""
         for msg in self.inbox:
-            if msg.typ == "accept":
+            if isinstance(msg, AcceptMsg):
                 self._handle_accept_message(msg, world)
-            elif msg.typ == "reject":
+            elif isinstance(msg, RejectMsg):
                 self._handle_reject_message(msg, world)
-            elif msg.typ == "delivery_confirmed":
+            elif isinstance(msg, DeliveryBatchConfirmedMsg):
+                self._handle_delivery_batch_confirmation(msg, world)
+            elif isinstance(msg, DeliveryConfirmedMsg):
                 self._handle_delivery_confirmation(msg, world)
-            elif msg.typ == "pickup_confirmed":
+            elif isinstance(msg, PickupConfirmedMsg):
                 self._handle_pickup_confirmation(msg, world)
 
-    def _handle_accept_message(self, msg: Msg, _world: World) -> None:
+    def _handle_accept_message(self, msg: AcceptMsg, _world: World) -> None:
         """Handle acceptance of a pickup proposal."""
-        package_id = PackageID(msg.body.get("package_id", ""))
+        package_id = msg.package_id
 
         # Verify this is for the active negotiation
         if self.active_negotiation is None or self.active_negotiation.package_id != package_id:
@@ -159,9 +170,9 @@ class Broker:
         # Mark negotiation as accepted
         self.active_negotiation.status = NegotiationStatus.ACCEPTED
 
-    def _handle_reject_message(self, msg: Msg, _world: World) -> None:
+    def _handle_reject_message(self, msg: RejectMsg, _world: World) -> None:
         """Handle rejection of a pickup proposal."""
-        package_id = PackageID(msg.body.get("package_id", ""))
+        package_id = msg.package_id
 
         # Verify this is for the active negotiation
         if self.active_negotiation is None or self.active_negotiation.package_id != package_id:
@@ -171,12 +182,22 @@ class Broker:
         self.active_negotiation.current_truck_idx += 1
         self.active_negotiation.responses_received += 1
 
-    def _handle_delivery_confirmation(self, msg: Msg, world: World) -> None:
+    def _handle_delivery_confirmation(self, msg: DeliveryConfirmedMsg, world: World) -> None:
         """Handle confirmation that a package was delivered."""
-        package_id = PackageID(msg.body.get("package_id", ""))
-        delivery_tick = msg.body.get("delivery_tick", world.tick)
-        on_time = msg.body.get("on_time", True)
+        self._settle_delivery(msg.package_id, msg.delivery_tick, msg.on_time, world)
 
+    def _handle_delivery_batch_confirmation(
+        self, msg: DeliveryBatchConfirmedMsg, world: World
+    ) -> None:
+        """Handle confirmation that several packages were delivered at one site."""
+        delivery_tick = msg.delivery_tick
+        for package_id, on_time in msg.packages:
+            self._settle_delivery(package_id, delivery_tick, on_time, world)
+
+    def _settle_delivery(
+        self, package_id: PackageID, delivery_tick: int, on_time: bool, world: World
+    ) -> None:
+        """Pay out a delivered package, applying the late penalty if needed."""
         # Get package to calculate payment
         package = world.packages.get(package_id)
         if package is None:
@@ -211,9 +232,9 @@ class Broker:
         if package_id in self.assigned_packages:
             del self.assigned_packages[package_id]
 
-    def _handle_pickup_confirmation(self, msg: Msg, world: World) -> None:
+    def _handle_pickup_confirmation(self, msg: PickupConfirmedMsg, world: World) -> None:
         """Handle confirmation that a package was picked up."""
-        package_id = PackageID(msg.body.get("package_id", ""))
+        package_id = msg.package_id
         agent_id = msg.src
 
         # Emit pickup event
@@ -427,19 +448,16 @@ class Broker:
             return
 
         # Create proposal message
-        proposal = Msg(
+        proposal = ProposalMsg(
             src=self.id,
             dst=truck_id,
-            typ="proposal",
-            body={
-                "package_id": str(neg.package_id),
-                "origin_site_id": str(package.origin_site),
-                "destination_site_id": str(package.destination_site),
-                "package_size": package.size,
-                "package_value": package.value_currency,
-                "pickup_deadline_tick": package.pickup_deadline_tick,
-                "delivery_deadline_tick": package.delivery_deadline_tick,
-            },
+            package_id=neg.package_id,
+            origin_site_id=package.origin_site,
+            destination_site_id=package.destination_site,
+            package_size=package.size,
+            package_value=package.value_currency,
+            pickup_deadline_tick=package.pickup_deadline_tick,
+            delivery_deadline_tick=package.delivery_deadline_tick,
         )
 
         self.outbox.append(proposal)
@@ -452,18 +470,15 @@ class Broker:
         self.assigned_packages[package_id] = truck_id
 
         # Send assignment confirmation to truck
-        confirmation = Msg(
+        confirmation = AssignmentConfirmedMsg(
             src=self.id,
             dst=truck_id,
-            typ="assignment_confirmed",
-            body={
-                "package_id": str(package_id),
-                "origin_site_id": str(package.origin_site),
-                "destination_site_id": str(package.destination_site),
-                "package_size": package.size,
-                "pickup_deadline_tick": package.pickup_deadline_tick,
-                "delivery_deadline_tick": package.delivery_deadline_tick,
-            },
+            package_id=package_id,
+            origin_site_id=package.origin_site,
+            destination_site_id=package.destination_site,
+            package_size=package.size,
+            pickup_deadline_tick=package.pickup_deadline_tick,
+            delivery_deadline_tick=package.delivery_deadline_tick,
         )
 
         self.outbox.append(confirmation)
@@ -494,7 +509,7 @@ class Broker:
                 expired_in_queue.append(package_id)
                 continue
 
-            if package.is_expired(current_tick):
+            if current_tick >= package.pickup_deadline_tick:
                 # Apply fine
                 fine = package.value_currency * PICKUP_EXPIRY_FINE_MULTIPLIER
                 self.balance_ducats -= fine
@@ -540,8 +555,8 @@ class Broker:
         )
 
         for node_id_raw, node in world.graph.nodes.items():
-            for building in node.buildings:
-                if isinstance(building, Site) and building.id == site_id:
+            for building in node.get_buildings_by_type(Site):
+                if building.id == site_id:
                     logger.debug(f"_get_site_node: Found site {site_id} at node {node_id_raw}")
                     return cast(NodeID, node_id_raw)
 
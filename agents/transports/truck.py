@@ -1,6 +1,8 @@
 """Truck transport agent for autonomous navigation through the graph network."""
 
 import random
+from bisect import bisect_left
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any, cast
 
@@ -8,7 +10,15 @@ from core.buildings.gas_station import GasStation
 from core.buildings.parking import Parking
 from core.buildings.site import Site
 from core.delivery.task import DeliveryTask
-from core.messages import Msg
+from core.messages import (
+    AcceptMsg,
+    AssignmentConfirmedMsg,
+    DeliveryBatchConfirmedMsg,
+    Msg,
+    PickupConfirmedMsg,
+    ProposalMsg,
+    RejectMsg,
+)
 from core.types import (
     AgentID,
     BuildingID,
@@ -20,7 +30,6 @@ from core.types import (
     TaskStatus,
     TaskType,
 )
-from world.sim.dto.truck_dto import TruckStateDTO, TruckWatchFieldsDTO
 from world.world import World
 
 # Fuel consumption constants
@@ -30,8 +39,70 @@ FUEL_CONSUMPTION_FACTOR_PER_TONNE: float = 1.5  # Additional L/100km per tonne o
 FUELING_RATE_L_PER_S: float = 0.833  # ~50 liters per minute (realistic pump rate)
 BASE_TRUCK_WEIGHT_TONNES: float = 5.0  # Empty truck weight in tonnes
 
+# Shared empty tried-building set: trucks that have never been turned away hold this
+# instead of allocating their own, and it doubles as the search-cache key part
+_NO_TRIED_BUILDINGS: frozenset[BuildingID] = frozenset()
+
+# Tachograph constants
+MAX_DRIVING_TIME_S: float = 8.0 * 3600  # Driving time before overtime penalties apply
+# Overtime fines: up to each limit (hours, inclusive) the matching fine applies; past the
+# last limit the final fine applies
+_OVERTIME_PENALTY_LIMITS_H: tuple[float, ...] = (1.0, 2.0)
+_OVERTIME_PENALTY_DUCATS: tuple[float, ...] = (100.0, 200.0, 500.0)
+
+
+# Every FULL_DIFF_INTERVAL-th emitted diff carries the complete state, so a client that
+# missed a delta (e.g. a signal dropped on a full queue) catches up without reconnecting
+FULL_DIFF_INTERVAL: int = 60
+
+# serialize_diff payload keys of the watch-field tuple (TruckWatchFieldsDTO order) and of
+# the remaining TruckStateDTO fields, which are tracked in a second tuple
+_WATCH_PAYLOAD_KEYS: tuple[str, ...] = (
+    "current_node",
+    "current_edge",
+    "current_speed_kph",
+    "route",
+    "route_start_node",
+    "route_end_node",
+    "loaded_packages",
+    "current_building_id",
+)
+_OTHER_PAYLOAD_KEYS: tuple[str, ...] = (
+    "max_speed_kph",
+    "capacity",
+    "driving_time_s",
+    "resting_time_s",
+    "is_resting",
+    "balance_ducats",
+    "risk_factor",
+    "is_seeking_parking",
+    "is_seeking_idle_parking",
+    "original_destination",
+    "fuel_tank_capacity_l",
+    "current_fuel_l",
+    "co2_emitted_kg",
+    "is_seeking_gas_station",
+    "is_fueling",
+)
+
+
+def _required_rest_s(driving_time_s: float) -> float:
+    """Return the rest time in seconds required after ``driving_time_s`` of driving.
+
+    Up to 6h the rest matches the driving time; from 6h to 8h it grows linearly
+    from 6h to 10h of rest (slope 2).
+    """
+    if driving_time_s <= 6.0 * 3600:
+        return driving_time_s
+    return 2.0 * driving_time_s - 6.0 * 3600
+
+
+def _overtime_penalty_ducats(overtime_hours: float) -> float:
+    """Return the tachograph fine for ``overtime_hours`` past the driving limit."""
+    return _OVERTIME_PENALTY_DUCATS[bisect_left(_OVERTIME_PENALTY_LIMITS_H, overtime_hours)]
 
-@dataclass
+
+@dataclass(slots=True)
 class Truck:
     """Transport agent that moves through the graph following computed routes.
 
@@ -45,12 +116,24 @@ class Truck:
     inbox: list[Msg] = field(default_factory=list)
     outbox: list[Msg] = field(default_factory=list)
     tags: dict[str, Any] = field(default_factory=dict)
-    _last_serialized_watch_state: TruckWatchFieldsDTO | None = field(default=None, init=False)
+    # Watch fields from the last emitted diff, laid out in TruckWatchFieldsDTO order
+    _last_serialized_watch_state: tuple[Any, ...] | None = field(default=None, init=False)
+    # Non-watch fields from the last emitted diff, laid out in _OTHER_PAYLOAD_KEYS order
+    _last_serialized_other_state: tuple[Any, ...] | None = field(
+        default=None, init=False, repr=False
+    )
+    # Deltas emitted since the last complete diff
+    _diffs_since_full: int = field(default=0, init=False, repr=False)
 
     # Truck-specific fields
     max_speed_kph: float = 100.0  # Maximum speed capability
     capacity: float = 24.0  # Cargo capacity (unitless, 4-45)
-    loaded_packages: list[PackageID] = field(default_factory=list)  # Currently loaded packages
+    # Currently loaded packages, in load order (dict for O(1) membership and removal)
+    loaded_packages: dict[PackageID, None] = field(default_factory=dict)
+    # Running total of loaded package sizes; None until recomputed from the world
+    _loaded_size: float | None = field(default=None, init=False, repr=False)
+    # (loaded size, fuel L/km) for the last computed consumption rate
+    _fuel_rate_cache: tuple[float, float] | None = field(default=None, init=False, repr=False)
     current_speed_kph: float = 0.0  # Actual current speed (limited by edge max_speed)
     current_node: NodeID | None = None  # If at a node
     current_edge: EdgeID | None = None  # If on an edge
@@ -74,7 +157,10 @@ class Truck:
     is_seeking_parking: bool = False  # Flag for active parking search (for rest)
     is_seeking_idle_parking: bool = False  # Flag for seeking parking when idle (no tasks)
     original_destination: NodeID | None = None  # Preserved destination when diverting to parking
-    _tried_parkings: set[BuildingID] = field(default_factory=set, init=False, repr=False)
+    # Parkings found full during the current search; replaced rather than mutated
+    _tried_parkings: frozenset[BuildingID] = field(
+        default=_NO_TRIED_BUILDINGS, init=False, repr=False
+    )
 
     # Fuel system fields
     fuel_tank_capacity_l: float = 500.0  # Maximum fuel tank capacity in liters
@@ -83,7 +169,15 @@ class Truck:
     is_seeking_gas_station: bool = False  # Flag for active gas station search
     is_fueling: bool = False  # Flag for when truck is at a gas station fueling
     fueling_liters_needed: float = 0.0  # Liters needed to fill tank when fueling started
-    _tried_gas_stations: set[BuildingID] = field(default_factory=set, init=False, repr=False)
+    # Gas stations found full during the current search; replaced rather than mutated
+    _tried_gas_stations: frozenset[BuildingID] = field(
+        default=_NO_TRIED_BUILDINGS, init=False, repr=False
+    )
+    # Last gas station search as (search inputs, (building ID, route)); a truck that has
+    # not left its node repeats the same search until one of the inputs changes
+    _last_gas_station_search: (
+        tuple[tuple[Any, ...], tuple[BuildingID | None, tuple[NodeID, ...] | None]] | None
+    ) = field(default=None, init=False, repr=False)
 
     # Delivery system fields
     delivery_queue: list[DeliveryTask] = field(default_factory=list)  # Ordered sites to visit
@@ -92,10 +186,18 @@ class Truck:
     is_unloading: bool = False  # Currently unloading packages at a site
     loading_progress_s: float = 0.0  # Time spent loading/unloading
     loading_target_s: float = 0.0  # Total time needed for current operation
+    # The single IN_PROGRESS task (pickup or delivery) being handled at a site, if any
+    current_delivery_task: DeliveryTask | None = field(default=None, init=False, repr=False)
     _pending_proposal: dict[str, Any] | None = field(
         default=None, init=False, repr=False
     )  # Current proposal being evaluated
 
+    # Memoized tuple snapshots for serialization, rebuilt only when the source list changes
+    _route_snapshot_src: list[NodeID] | None = field(default=None, init=False, repr=False)
+    _route_snapshot: tuple[NodeID, ...] = field(default=(), init=False, repr=False)
+    _loaded_snapshot_src: dict[PackageID, None] | None = field(default=None, init=False, repr=False)
+    _loaded_snapshot: tuple[PackageID, ...] = field(default=(), init=False, repr=False)
+
     def perceive(self, world: World) -> None:
         """Optional: pull local info into cached fields.
 
@@ -112,53 +214,33 @@ class Truck:
         Returns:
             Total weight in tonnes (base weight + cargo weight)
         """
-        # Base truck weight
-        total_weight = BASE_TRUCK_WEIGHT_TONNES
-
-        # Add weight from loaded packages (for now, packages don't have weight)
-        # This can be extended when packages have weight attributes
-        for pkg_id in self.loaded_packages:
-            package = world.packages.get(pkg_id)
-            if package is not None:
-                # Assume package size maps to weight (1 unit size = 0.1 tonnes)
-                total_weight += package.size * 0.1
-
-        return total_weight
+        # Base truck weight plus cargo (packages have no weight yet, so assume
+        # package size maps to weight: 1 unit size = 0.1 tonnes)
+        return BASE_TRUCK_WEIGHT_TONNES + self.get_total_loaded_size(world) * 0.1
 
     def _calculate_fuel_consumption_l_per_km(self, world: World) -> float:
         """Calculate fuel consumption rate based on current weight.
 
+        The rate only depends on the loaded size, so it is recomputed only when the
+        load changed since the last call.
+
         Returns:
             Fuel consumption in liters per kilometer
         """
-        weight_tonnes = self.get_current_weight_tonnes(world)
+        loaded_size = self.get_total_loaded_size(world)
+        cached = self._fuel_rate_cache
+        if cached is not None and cached[0] == loaded_size:
+            return cached[1]
+
         # Base consumption + additional consumption per tonne of cargo
-        cargo_weight = weight_tonnes - BASE_TRUCK_WEIGHT_TONNES
+        # (1 unit size = 0.1 tonnes, see get_current_weight_tonnes)
+        cargo_weight = loaded_size * 0.1
         consumption_per_100km = (
             BASE_FUEL_CONSUMPTION_L_PER_100KM + cargo_weight * FUEL_CONSUMPTION_FACTOR_PER_TONNE
         )
-        return consumption_per_100km / 100.0  # Convert to per km
-
-    def _consume_fuel_and_emit_co2(self, world: World, distance_traveled_m: float) -> None:
-        """Consume fuel and emit CO2 based on distance traveled.
-
-        Args:
-            world: World instance
-            distance_traveled_m: Distance traveled in meters this tick
-        """
-        if distance_traveled_m <= 0:
-            return
-
-        distance_km = distance_traveled_m / 1000.0
-        fuel_consumption_l_per_km = self._calculate_fuel_consumption_l_per_km(world)
-        fuel_consumed_l = distance_km * fuel_consumption_l_per_km
-
-        # Consume fuel
-        self.current_fuel_l = max(0.0, self.current_fuel_l - fuel_consumed_l)
-
-        # Calculate and emit CO2
-        co2_emitted = fuel_consumed_l * CO2_KG_PER_LITER_DIESEL
-        self.co2_emitted_kg += co2_emitted
+        rate = consumption_per_100km / 100.0  # Convert to per km
+        self._fuel_rate_cache = (loaded_size, rate)
+        return rate
 
     def _should_seek_gas_station(self) -> bool:
         """Determine if truck should start seeking a gas station based on fuel level.
@@ -172,15 +254,16 @@ class Truck:
         if self.is_fueling or self.is_seeking_gas_station or self.is_resting:
             return False
 
-        # Calculate fuel percentage
-        fuel_percentage = self.current_fuel_l / self.fuel_tank_capacity_l
-
-        # Threshold: 30% to 15% based on risk_factor (higher risk = lower threshold)
+        # Threshold: 30% to 15% based on risk_factor (higher risk = lower threshold),
+        # compared in liters so the common well-fueled case skips the division
+        fuel_l = self.current_fuel_l
+        capacity_l = self.fuel_tank_capacity_l
         threshold = 0.30 - (self.risk_factor * 0.15)
-
-        if fuel_percentage > threshold:
+        if fuel_l > threshold * capacity_l:
             return False
 
+        fuel_percentage = fuel_l / capacity_l
+
         # Linear probability increase as fuel drops below threshold
         min_threshold = 0.10  # Must seek at 10% regardless of risk
         if fuel_percentage <= min_threshold:
@@ -206,9 +289,16 @@ class Truck:
             self._handle_fueling(world)
             return
 
-        # Handle resting state (second highest priority)
+        # Handle resting state (second highest priority). The rest timer is inlined on the
+        # hot path; the full handler only runs when rest completes or a route is still due
         if self.is_resting:
-            self._handle_resting(world)
+            resting_time_s = self.resting_time_s + world.dt_s
+            if resting_time_s < self.required_rest_s and (
+                self.route or self.original_destination is None
+            ):
+                self.resting_time_s = resting_time_s
+            else:
+                self._handle_resting(world)
             return
 
         # Handle loading state (at site loading packages)
@@ -216,9 +306,11 @@ class Truck:
             self._handle_loading(world)
             return
 
-        # Handle unloading state (at site unloading packages)
+        # Handle unloading state (at site unloading packages), timer inlined on the hot path
         if self.is_unloading:
-            self._handle_unloading(world)
+            self.loading_progress_s += world.dt_s
+            if self.loading_progress_s >= self.loading_target_s:
+                self._complete_unloading(world)
             return
 
         # Process broker messages (proposals, assignments)
@@ -240,7 +332,7 @@ class Truck:
                 self.leave_parking(world)
 
         # Check for overtime penalties (apply once per violation)
-        if self.driving_time_s > 8 * 3600:
+        if self.driving_time_s > MAX_DRIVING_TIME_S:
             self._apply_tachograph_penalty(world)
 
         # Decide if should seek gas station based on fuel level (priority over parking)
@@ -335,7 +427,7 @@ class Truck:
                                 break
                             except ValueError:
                                 # Parking full, add to tried list
-                                self._tried_parkings.add(building.id)
+                                self._tried_parkings |= {building.id}
 
                     if not parked:
                         # Parking full or not found - try next parking
@@ -352,7 +444,7 @@ class Truck:
                             self.is_seeking_parking = False
                             self.destination = self.original_destination
                             self.original_destination = None
-                            self._tried_parkings.clear()
+                            self._tried_parkings = _NO_TRIED_BUILDINGS
                 return
 
             # Handle idle parking arrival (park but don't rest)
@@ -372,7 +464,7 @@ class Truck:
                                 break
                             except ValueError:
                                 # Parking full, add to tried list
-                                self._tried_parkings.add(building.id)
+                                self._tried_parkings |= {building.id}
 
                     if not parked:
                         # Parking full or not found - try next parking
@@ -387,7 +479,7 @@ class Truck:
                         else:
                             # No more parkings available - give up seeking
                             self.is_seeking_idle_parking = False
-                            self._tried_parkings.clear()
+                            self._tried_parkings = _NO_TRIED_BUILDINGS
                 return
 
             # Check if we've arrived at a delivery task site
@@ -546,18 +638,30 @@ class Truck:
 
         # Calculate distance traveled this tick
         # Convert kph to m/s: kph * 1000 / 3600
-        distance_traveled_m = self.current_speed_kph * (1000.0 / 3600.0) * world.dt_s
-        self.edge_progress_m += distance_traveled_m
-
-        # Consume fuel and emit CO2 for this tick
-        self._consume_fuel_and_emit_co2(world, distance_traveled_m)
+        dt_s = world.dt_s
+        distance_traveled_m = self.current_speed_kph * (1000.0 / 3600.0) * dt_s
+        edge_progress_m = self.edge_progress_m + distance_traveled_m
+        self.edge_progress_m = edge_progress_m
+
+        # Consume fuel and emit CO2 for this tick. This is the only place fuel is burned;
+        # reuse the cached rate while the running loaded size still matches it
+        if distance_traveled_m > 0.0:
+            cached = self._fuel_rate_cache
+            if cached is not None and cached[0] == self._loaded_size:
+                rate_l_per_km = cached[1]
+            else:
+                rate_l_per_km = self._calculate_fuel_consumption_l_per_km(world)
+            fuel_consumed_l = distance_traveled_m * 0.001 * rate_l_per_km
+            fuel_l = self.current_fuel_l - fuel_consumed_l
+            self.current_fuel_l = fuel_l if fuel_l > 0.0 else 0.0
+            self.co2_emitted_kg += fuel_consumed_l * CO2_KG_PER_LITER_DIESEL
 
         # Track driving time (tachograph)
         if not self.is_resting:
-            self.driving_time_s += world.dt_s
+            self.driving_time_s += dt_s
 
         # Check if edge is complete
-        if self.edge_progress_m >= edge.length_m:
+        if edge_progress_m >= edge.length_m:
             # Arrive at next node
             self.current_node = edge.to_node
             self.current_edge = None
@@ -618,13 +722,12 @@ class Truck:
         if node is None:
             raise ValueError(f"Node {target_node_id} not found in the world graph")
 
-        for building in node.get_buildings():
-            if building.id == building_id:
-                if isinstance(building, Parking):
-                    return building
-                raise ValueError(f"Building {building_id} is not a parking facility")
-
-        raise ValueError(f"Parking {building_id} not found on node {target_node_id}")
+        building = node.get_building(building_id)
+        if building is None:
+            raise ValueError(f"Parking {building_id} not found on node {target_node_id}")
+        if not isinstance(building, Parking):
+            raise ValueError(f"Building {building_id} is not a parking facility")
+        return building
 
     # --- Gas station methods ---
 
@@ -684,13 +787,12 @@ class Truck:
         if node is None:
             raise ValueError(f"Node {target_node_id} not found in the world graph")
 
-        for building in node.get_buildings():
-            if building.id == building_id:
-                if isinstance(building, GasStation):
-                    return building
-                raise ValueError(f"Building {building_id} is not a gas station")
-
-        raise ValueError(f"Gas station {building_id} not found on node {target_node_id}")
+        building = node.get_building(building_id)
+        if building is None:
+            raise ValueError(f"Gas station {building_id} not found on node {target_node_id}")
+        if not isinstance(building, GasStation):
+            raise ValueError(f"Building {building_id} is not a gas station")
+        return building
 
     def _find_closest_gas_station(
         self, world: World
@@ -706,6 +808,40 @@ class Truck:
         if self.current_node is None:
             return None, None
 
+        # Without any gas station the search would settle the whole graph for nothing,
+        # and a low-fuel truck retries it every tick
+        if not world.graph.get_building_nodes(GasStation):
+            return None, None
+
+        range_km = self.current_fuel_l / self._calculate_fuel_consumption_l_per_km(world)
+        max_cost = self._fuel_range_cost_h(world, range_km)
+        search_key = (
+            world.graph,
+            world.graph.version,
+            self.current_node,
+            self.destination,
+            self.max_speed_kph,
+            self._tried_gas_stations,
+            max_cost,
+        )
+        last_search = self._last_gas_station_search
+        if last_search is not None and last_search[0] == search_key:
+            cached_id, cached_route = last_search[1]
+            return cached_id, list(cached_route) if cached_route is not None else None
+
+        # On graphs whose roads are never shorter than the straight line between their
+        # nodes, no gas station inside the fuel range as the crow flies means none is
+        # reachable by road either
+        graph = world.graph
+        node = graph.get_node(self.current_node)
+        if (
+            node is not None
+            and graph.roads_cover_straight_line()
+            and not graph.has_building_within(GasStation, node.x, node.y, range_km * 1000.0)
+        ):
+            self._last_gas_station_search = (search_key, (None, None))
+            return None, None
+
         # Import here to avoid circular dependency
         from world.routing.criteria import BuildingTypeCriteria
 
@@ -720,20 +856,42 @@ class Truck:
                 world.graph,
                 self.max_speed_kph,
                 criteria,
+                max_cost,
             )
         else:
             # No destination - use simple closest search
             node_id, matched_item, route = world.router.find_closest_node(
-                self.current_node, world.graph, self.max_speed_kph, criteria
+                self.current_node, world.graph, self.max_speed_kph, criteria, max_cost
             )
 
         if node_id is None or matched_item is None or route is None:
+            self._last_gas_station_search = (search_key, (None, None))
             return None, None
 
         # Extract building ID from matched item (which is the GasStation instance)
         gas_station = matched_item
+        self._last_gas_station_search = (search_key, (gas_station.id, tuple(route)))
         return gas_station.id, route
 
+    def _fuel_range_cost_h(self, world: World, range_km: float) -> float | None:
+        """Bound the gas station search to nodes the remaining fuel can reach.
+
+        Route cost is travel time, so a node reachable within the fuel range costs at
+        most the range driven at the slowest speed the truck may meet on the graph.
+        Gas stations beyond that bound are unreachable and not searched for.
+
+        Args:
+            world: World instance providing the graph
+            range_km: Distance the remaining fuel lasts
+
+        Returns:
+            Cost bound in hours, or None if the graph has no edges
+        """
+        min_speed_kph: float | None = world.graph.get_min_edge_speed_kph()
+        if min_speed_kph is None:
+            return None
+        return range_km / min(min_speed_kph, self.max_speed_kph)
+
     def _try_enter_gas_station(self, world: World) -> bool:
         """Try to enter a gas station at the current node.
 
@@ -758,7 +916,7 @@ class Truck:
                     return True
                 except ValueError:
                     # Gas station full (race condition), add to tried list
-                    self._tried_gas_stations.add(building.id)
+                    self._tried_gas_stations |= {building.id}
             else:
                 # Gas station is full - wait here
                 # Unlike parking, we wait instead of looking for another
@@ -780,7 +938,7 @@ class Truck:
             self.destination = self.original_destination
             if not self.is_seeking_parking:
                 self.original_destination = None
-            self._tried_gas_stations.clear()
+            self._tried_gas_stations = _NO_TRIED_BUILDINGS
             return False
 
     def _handle_fueling(self, world: World) -> None:
@@ -844,7 +1002,7 @@ class Truck:
             self.is_fueling = False
             self.fueling_liters_needed = 0.0
             self.is_seeking_gas_station = False
-            self._tried_gas_stations.clear()
+            self._tried_gas_stations = _NO_TRIED_BUILDINGS
 
             # Restore original destination
             if self.original_destination is not None:
@@ -859,17 +1017,23 @@ class Truck:
     def get_total_loaded_size(self, world: World) -> float:
         """Calculate total size of all loaded packages.
 
+        The total is kept up to date by load/unload calls that pass the package size;
+        the world is only consulted when a size was not given.
+
         Args:
             world: World instance to look up package sizes
 
         Returns:
             Total size of loaded packages
         """
-        total = 0.0
-        for pkg_id in self.loaded_packages:
-            package = world.packages.get(pkg_id)
-            if package is not None:
-                total += package.size
+        total = self._loaded_size
+        if total is None:
+            total = 0.0
+            for pkg_id in self.loaded_packages:
+                package = world.packages.get(pkg_id)
+                if package is not None:
+                    total += package.size
+            self._loaded_size = total
         return total
 
     def can_load_package(self, world: World, package_id: PackageID) -> bool:
@@ -889,56 +1053,84 @@ class Truck:
         current_load = self.get_total_loaded_size(world)
         return current_load + package.size <= self.capacity
 
-    def load_package(self, package_id: PackageID) -> None:
-        """Add a package to the loaded packages list.
+    def load_package(self, package_id: PackageID, size: float | None = None) -> None:
+        """Add a package to the loaded packages.
 
         Note: This does not check capacity - use can_load_package first.
 
         Args:
             package_id: ID of the package to load
+            size: Package size, added to the running loaded total; if omitted the
+                total is recomputed from the world on next use
 
         Raises:
             ValueError: If package is already loaded
         """
         if package_id in self.loaded_packages:
             raise ValueError(f"Package {package_id} is already loaded")
-        self.loaded_packages.append(package_id)
+        self.loaded_packages[package_id] = None
+        total = self._loaded_size
+        self._loaded_size = None if size is None or total is None else total + size
+        self._loaded_snapshot_src = None
+
+    def set_loaded_packages(self, package_ids: Iterable[str]) -> None:
+        """Replace the loaded packages, e.g. with a JSON list from an ``agent.update`` action.
+
+        The IDs are stored in the dict form the load/unload paths expect, and the running
+        loaded size is recomputed from the world on next use.
 
-    def unload_package(self, package_id: PackageID) -> None:
-        """Remove a package from the loaded packages list.
+        Args:
+            package_ids: IDs of the packages now loaded, in load order
+        """
+        self.loaded_packages = dict.fromkeys(PackageID(pkg) for pkg in package_ids)
+        self._loaded_size = None
+        self._loaded_snapshot_src = None
+
+    def unload_package(self, package_id: PackageID, size: float | None = None) -> None:
+        """Remove a package from the loaded packages.
 
         Args:
             package_id: ID of the package to unload
+            size: Package size, subtracted from the running loaded total; if omitted
+                the total is recomputed from the world on next use
 
         Raises:
             ValueError: If package is not loaded
         """
-        if package_id not in self.loaded_packages:
+        if not self._discard_loaded_package(package_id, size):
             raise ValueError(f"Package {package_id} is not loaded")
-        self.loaded_packages.remove(package_id)
+
+    def _discard_loaded_package(self, package_id: PackageID, size: float | None = None) -> bool:
+        """Remove a package if it is loaded, with a single lookup.
+
+        Args:
+            package_id: ID of the package to remove
+            size: Package size to subtract from the running loaded total, if known
+
+        Returns:
+            True if the package was loaded and has been removed, False otherwise
+        """
+        try:
+            del self.loaded_packages[package_id]
+        except KeyError:
+            return False
+        total = self._loaded_size
+        if not self.loaded_packages:
+            self._loaded_size = 0.0  # Drop accumulated rounding once the truck is empty
+        else:
+            self._loaded_size = None if size is None or total is None else total - size
+        self._loaded_snapshot_src = None
+        return True
 
     def _calculate_required_rest(self) -> float:
         """Calculate required rest time based on driving time.
 
         Formula: 6h drive → 6h rest, 8h drive → 10h rest (linear interpolation).
-        Mathematically: required_rest = driving_time * (2/3) + (driving_time / (8*3600)) * 4 * 3600
 
         Returns:
             Required rest time in seconds
         """
-        driving_hours = self.driving_time_s / 3600.0
-        # Linear interpolation: at 6h need 6h, at 8h need 10h
-        # Slope = (10 - 6) / (8 - 6) = 2
-        # required_hours = driving_hours + (driving_hours - 6) * 2 if driving_hours >= 6
-        # Simplified: required_hours = 2 * driving_hours - 6 for driving_hours >= 6
-        # For driving_hours < 6: proportional (1:1 ratio)
-        if driving_hours <= 6.0:
-            required_hours = driving_hours
-        else:
-            # Between 6 and 8 hours: linear from 6h rest to 10h rest
-            required_hours = 6.0 + (driving_hours - 6.0) * 2.0
-
-        return required_hours * 3600.0
+        return _required_rest_s(self.driving_time_s)
 
     def _should_seek_parking(self) -> bool:
         """Determine if truck should start seeking parking based on driving time and risk.
@@ -952,21 +1144,22 @@ class Truck:
         if self.is_resting or self.is_seeking_parking:
             return False
 
-        hours_driven = self.driving_time_s / 3600.0
-        # Threshold: 7.0 to 8.0 hours based on risk_factor
-        start_threshold = 7.0 + self.risk_factor * 1.0
+        driving_time_s = self.driving_time_s
+        # Threshold: 7.0 to 8.0 hours based on risk_factor, compared in seconds
+        start_threshold_s = (7.0 + self.risk_factor) * 3600.0
 
-        if hours_driven < start_threshold:
+        if driving_time_s < start_threshold_s:
             return False
 
-        # Linear probability increase from start_threshold to 8.0 hours
-        max_hours = 8.0
-        if hours_driven >= max_hours:
+        # Linear probability increase from start threshold to the driving limit
+        if driving_time_s >= MAX_DRIVING_TIME_S:
             # Must seek parking if at or past 8 hours
             return True
 
         # Probability increases linearly
-        probability = (hours_driven - start_threshold) / (max_hours - start_threshold)
+        probability = (driving_time_s - start_threshold_s) / (
+            MAX_DRIVING_TIME_S - start_threshold_s
+        )
         return random.random() < probability
 
     def _find_closest_parking(self, world: World) -> tuple[BuildingID | None, list[NodeID] | None]:
@@ -982,6 +1175,18 @@ class Truck:
         if self.current_node is None:
             return None, None
 
+        # Results only depend on the graph and the search inputs, not on occupancy
+        cache_key = (
+            self.current_node,
+            self.destination,
+            self.max_speed_kph,
+            self._tried_parkings,
+        )
+        cached = world.lookup_closest_parking(cache_key)
+        if cached is not None:
+            cached_id, cached_route = cached
+            return cached_id, list(cached_route) if cached_route is not None else None
+
         # Import here to avoid circular dependency
         from world.routing.criteria import BuildingTypeCriteria
 
@@ -1004,10 +1209,12 @@ class Truck:
             )
 
         if node_id is None or matched_item is None or route is None:
+            world.store_closest_parking(cache_key, (None, None))
             return None, None
 
         # Extract building ID from matched item (which is the Parking instance)
         parking = matched_item
+        world.store_closest_parking(cache_key, (parking.id, tuple(route)))
         return parking.id, route
 
     def _handle_resting(self, world: World) -> None:
@@ -1037,10 +1244,10 @@ class Truck:
             self.required_rest_s = 0.0
             self.is_seeking_parking = False
             self.original_destination = None
-            self._tried_parkings.clear()
+            self._tried_parkings = _NO_TRIED_BUILDINGS
 
             # Adjust risk positively (learned to rest on time)
-            if self.driving_time_s < 8.0 * 3600:  # Rested before exceeding limit
+            if self.driving_time_s < MAX_DRIVING_TIME_S:  # Rested before exceeding limit
                 self._adjust_risk(penalty=False)
 
     def _apply_tachograph_penalty(self, world: World) -> None:
@@ -1053,19 +1260,12 @@ class Truck:
 
         Also adjusts risk factor downward as a learning mechanism.
         """
-        overtime_s = self.driving_time_s - (8.0 * 3600)
+        overtime_s = self.driving_time_s - MAX_DRIVING_TIME_S
         if overtime_s <= 0:
             return
 
         overtime_hours = overtime_s / 3600.0
-
-        # Determine penalty amount
-        if overtime_hours <= 1.0:
-            penalty = 100.0
-        elif overtime_hours <= 2.0:
-            penalty = 200.0
-        else:
-            penalty = 500.0
+        penalty = _overtime_penalty_ducats(overtime_hours)
 
         # Apply penalty
         self.balance_ducats -= penalty
@@ -1110,27 +1310,26 @@ class Truck:
     def _handle_broker_messages(self, world: World) -> None:
         """Process messages from broker (proposals, assignments)."""
         for msg in self.inbox:
-            if msg.typ == "proposal":
+            if isinstance(msg, ProposalMsg):
                 self._handle_proposal(msg, world)
-            elif msg.typ == "assignment_confirmed":
+            elif isinstance(msg, AssignmentConfirmedMsg):
                 self._handle_assignment_confirmation(msg, world)
 
         # Clear inbox after processing
         self.inbox = []
 
-    def _handle_proposal(self, msg: Msg, world: World) -> None:
+    def _handle_proposal(self, msg: ProposalMsg, world: World) -> None:
         """Handle a pickup proposal from the broker.
 
         Evaluates whether the truck can feasibly pick up and deliver the package
         within the deadlines, considering current load, route, and driving time.
         """
-        body = msg.body
-        package_id = PackageID(body.get("package_id", ""))
-        origin_site_id = SiteID(body.get("origin_site_id", ""))
-        destination_site_id = SiteID(body.get("destination_site_id", ""))
-        package_size = float(body.get("package_size", 0))
-        pickup_deadline_tick = int(body.get("pickup_deadline_tick", 0))
-        delivery_deadline_tick = int(body.get("delivery_deadline_tick", 0))
+        package_id = msg.package_id
+        origin_site_id = msg.origin_site_id
+        destination_site_id = msg.destination_site_id
+        package_size = msg.package_size
+        pickup_deadline_tick = msg.pickup_deadline_tick
+        delivery_deadline_tick = msg.delivery_deadline_tick
 
         # Store broker ID for future communication
         self.broker_id = msg.src
@@ -1153,26 +1352,20 @@ class Truck:
             )
 
             # Send acceptance
-            response = Msg(
+            response: Msg = AcceptMsg(
                 src=self.id,
                 dst=msg.src,
-                typ="accept",
-                body={
-                    "package_id": str(package_id),
-                    "estimated_pickup_tick": est_pickup_tick,
-                    "estimated_delivery_tick": est_delivery_tick,
-                },
+                package_id=package_id,
+                estimated_pickup_tick=est_pickup_tick,
+                estimated_delivery_tick=est_delivery_tick,
             )
         else:
             # Send rejection
-            response = Msg(
+            response = RejectMsg(
                 src=self.id,
                 dst=msg.src,
-                typ="reject",
-                body={
-                    "package_id": str(package_id),
-                    "rejection_reason": rejection_reason,
-                },
+                package_id=package_id,
+                rejection_reason=rejection_reason,
             )
 
         self.outbox.append(response)
@@ -1216,7 +1409,7 @@ class Truck:
         potential_driving = self.driving_time_s + driving_needed_s
 
         # If this would cause significant overtime without rest opportunity
-        if potential_driving > 8 * 3600:
+        if potential_driving > MAX_DRIVING_TIME_S:
             # Check if there's time for rest
             time_margin = (delivery_deadline_tick - est_delivery_tick) * world.dt_s
             rest_needed = self._calculate_required_rest()
@@ -1256,9 +1449,10 @@ class Truck:
         # Calculate time to complete current delivery queue
         queue_time_s = self._estimate_queue_completion_time(world)
 
-        # Time to origin
-        time_to_origin_s = world.router.estimate_travel_time_s(
-            current_node, origin_node, world.graph, self.max_speed_kph
+        # Time to origin; every truck bidding on a package shares the same cached
+        # reverse search from the origin, and likewise for the destination
+        (time_to_origin_s,) = world.router.estimate_travel_times_to_s(
+            (current_node,), origin_node, world.graph, self.max_speed_kph
         )
 
         # Loading time at origin (estimate based on package size, assume ~0.1 tonnes per size unit)
@@ -1266,8 +1460,8 @@ class Truck:
         loading_time_s = package_weight / 0.5 * 60  # loading_rate = 0.5 tonnes/min
 
         # Time from origin to destination
-        time_to_dest_s = world.router.estimate_travel_time_s(
-            origin_node, dest_node, world.graph, self.max_speed_kph
+        (time_to_dest_s,) = world.router.estimate_travel_times_to_s(
+            (origin_node,), dest_node, world.graph, self.max_speed_kph
         )
 
         # Unloading time at destination
@@ -1321,8 +1515,8 @@ class Truck:
             if task_node is None:
                 continue
 
-            travel_time = world.router.estimate_travel_time_s(
-                current_node, task_node, world.graph, self.max_speed_kph
+            (travel_time,) = world.router.estimate_travel_times_to_s(
+                (current_node,), task_node, world.graph, self.max_speed_kph
             )
             total_time += travel_time
 
@@ -1341,12 +1535,11 @@ class Truck:
 
         return total_time
 
-    def _handle_assignment_confirmation(self, msg: Msg, _world: World) -> None:
+    def _handle_assignment_confirmation(self, msg: AssignmentConfirmedMsg, _world: World) -> None:
         """Handle confirmation that a package has been assigned to this truck."""
-        body = msg.body
-        package_id = PackageID(body.get("package_id", ""))
-        origin_site_id = SiteID(body.get("origin_site_id", ""))
-        destination_site_id = SiteID(body.get("destination_site_id", ""))
+        package_id = msg.package_id
+        origin_site_id = msg.origin_site_id
+        destination_site_id = msg.destination_site_id
 
         # Add pickup task to queue
         pickup_task = DeliveryTask(
@@ -1456,6 +1649,7 @@ class Truck:
 
         # Mark task as in progress
         current_task.status = TaskStatus.IN_PROGRESS
+        self.current_delivery_task = current_task
 
         # Calculate loading/unloading time
         total_weight = 0.0
@@ -1484,14 +1678,8 @@ class Truck:
 
     def _complete_loading(self, world: World) -> None:
         """Complete the loading operation at current site."""
-        # Find the current loading task
-        current_task = None
-        for task in self.delivery_queue:
-            if task.status == TaskStatus.IN_PROGRESS and task.task_type == TaskType.PICKUP:
-                current_task = task
-                break
-
-        if current_task is None:
+        current_task = self.current_delivery_task
+        if current_task is None or current_task.task_type != TaskType.PICKUP:
             self.is_loading = False
             return
 
@@ -1499,17 +1687,18 @@ class Truck:
         for pkg_id in current_task.package_ids:
             package = world.packages.get(pkg_id)
             if package is not None and self.can_load_package(world, pkg_id):
-                self.load_package(pkg_id)
+                self.load_package(pkg_id, package.size)
                 world.update_package_status(pkg_id, PackageStatus.IN_TRANSIT.value, self.id)
 
                 # Remove from site's active packages
                 site = self._resolve_site(world, current_task.site_id, self.current_node)
                 if site is not None:
                     site.remove_package(pkg_id)
-                    site.update_statistics("picked_up")
+                    site.record_picked_up()
 
         # Mark task as completed
         current_task.status = TaskStatus.COMPLETED
+        self.current_delivery_task = None
 
         # Leave the site
         self._leave_site(world)
@@ -1519,71 +1708,68 @@ class Truck:
         self.loading_progress_s = 0.0
         self.loading_target_s = 0.0
 
-        # Notify broker of pickup
-        if self.broker_id is not None:
-            for pkg_id in current_task.package_ids:
-                pickup_msg = Msg(
-                    src=self.id,
-                    dst=self.broker_id,
-                    typ="pickup_confirmed",
-                    body={"package_id": str(pkg_id)},
-                )
-                self.outbox.append(pickup_msg)
-
-    def _handle_unloading(self, world: World) -> None:
-        """Handle package unloading at a site."""
-        self.loading_progress_s += world.dt_s
-
-        if self.loading_progress_s >= self.loading_target_s:
-            # Unloading complete
-            self._complete_unloading(world)
+        # Notify broker of pickup (PackageID is a str NewType, no conversion needed)
+        broker_id = self.broker_id
+        if broker_id is not None:
+            truck_id = self.id
+            self.outbox.extend(
+                [
+                    PickupConfirmedMsg(src=truck_id, dst=broker_id, package_id=pkg_id)
+                    for pkg_id in current_task.package_ids
+                ]
+            )
 
     def _complete_unloading(self, world: World) -> None:
         """Complete the unloading operation at current site."""
-        # Find the current unloading task
-        current_task = None
-        for task in self.delivery_queue:
-            if task.status == TaskStatus.IN_PROGRESS and task.task_type == TaskType.DELIVERY:
-                current_task = task
-                break
-
-        if current_task is None:
+        current_task = self.current_delivery_task
+        if current_task is None or current_task.task_type != TaskType.DELIVERY:
             self.is_unloading = False
             return
 
+        # Hoist per-event values out of the package loop
+        broker_id = self.broker_id
+        truck_id = self.id
+        tick = world.tick
+        delivered: list[tuple[PackageID, bool]] = []
+
+        packages = world.packages
+        site = self._resolve_site(world, current_task.site_id, self.current_node)
+
         # Unload all packages destined for this site
-        for pkg_id in list(current_task.package_ids):  # Copy list since we're modifying
-            if pkg_id in self.loaded_packages:
-                package = world.packages.get(pkg_id)
-                self.unload_package(pkg_id)
+        for pkg_id in current_task.package_ids:
+            package = packages.get(pkg_id)
+            if not self._discard_loaded_package(
+                pkg_id, package.size if package is not None else None
+            ):
+                continue
+            if package is None:
+                continue
 
-                if package is not None:
-                    # Check if on time
-                    on_time = world.tick <= package.delivery_deadline_tick
-                    world.update_package_status(pkg_id, PackageStatus.DELIVERED.value, self.id)
-
-                    # Update site statistics
-                    site = self._resolve_site(world, current_task.site_id, self.current_node)
-                    if site is not None:
-                        site.update_statistics("delivered", package.value_currency)
-
-                    # Notify broker of delivery
-                    if self.broker_id is not None:
-                        delivery_msg = Msg(
-                            src=self.id,
-                            dst=self.broker_id,
-                            typ="delivery_confirmed",
-                            body={
-                                "package_id": str(pkg_id),
-                                "delivery_tick": world.tick,
-                                "on_time": on_time,
-                                "delivery_site_id": str(current_task.site_id),
-                            },
-                        )
-                        self.outbox.append(delivery_msg)
+            # Check if on time
+            on_time = tick <= package.delivery_deadline_tick
+            world.update_package_status(pkg_id, PackageStatus.DELIVERED.value, truck_id)
+
+            # Update site statistics
+            if site is not None:
+                site.record_delivered(package.value_currency)
+
+            delivered.append((pkg_id, on_time))
+
+        # Notify broker of all deliveries at this site in one message
+        if delivered and broker_id is not None:
+            self.outbox.append(
+                DeliveryBatchConfirmedMsg(
+                    src=truck_id,
+                    dst=broker_id,
+                    delivery_tick=tick,
+                    delivery_site_id=current_task.site_id,
+                    packages=delivered,
+                )
+            )
 
         # Mark task as completed
         current_task.status = TaskStatus.COMPLETED
+        self.current_delivery_task = None
 
         # Leave the site
         self._leave_site(world)
@@ -1617,19 +1803,16 @@ class Truck:
         if node is None:
             return None
 
-        for building in node.get_buildings():
-            if building.id == site_id and isinstance(building, Site):
-                return building
+        # O(1) lookup for site buildings by type
+        for building in node.get_buildings_by_type(Site):
+            if building.id == site_id:
+                return cast(Site, building)
 
         return None
 
     def _get_site_node(self, site_id: SiteID, world: World) -> NodeID | None:
         """Get the node ID where a site is located."""
-        for node_id_raw, node in world.graph.nodes.items():
-            for building in node.buildings:
-                if isinstance(building, Site) and building.id == site_id:
-                    return cast(NodeID, node_id_raw)
-        return None
+        return world.get_site_node(site_id)
 
     def _plan_next_destination(self, world: World) -> None:
         """Plan route to next destination based on delivery queue.
@@ -1678,7 +1861,7 @@ class Truck:
         # Seek closest parking
         if not self.is_seeking_idle_parking:
             self.is_seeking_idle_parking = True
-            self._tried_parkings.clear()
+            self._tried_parkings = _NO_TRIED_BUILDINGS
 
         parking_id, route = self._find_closest_parking(world)
         if parking_id and route:
@@ -1696,66 +1879,157 @@ class Truck:
             self.route_start_node = None
             self.route_end_node = None
 
+    def _get_route_snapshot(self) -> tuple[NodeID, ...]:
+        """Return the route as a tuple, rebuilt only when the route changed.
+
+        The route is only ever replaced or consumed from the front, so list
+        identity, length and head are enough to detect a change.
+        """
+        route = self.route
+        snapshot = self._route_snapshot
+        if (
+            route is not self._route_snapshot_src
+            or len(route) != len(snapshot)
+            or (route and route[0] != snapshot[0])
+        ):
+            snapshot = tuple(route)
+            self._route_snapshot = snapshot
+            self._route_snapshot_src = route
+        return snapshot
+
+    def _get_loaded_snapshot(self) -> tuple[PackageID, ...]:
+        """Return loaded packages as a tuple, rebuilt after load/unload or reassignment."""
+        loaded = self.loaded_packages
+        if loaded is not self._loaded_snapshot_src or len(loaded) != len(self._loaded_snapshot):
+            self._loaded_snapshot = tuple(loaded)
+            self._loaded_snapshot_src = loaded
+        return self._loaded_snapshot
+
     def serialize_diff(self) -> dict[str, Any] | None:
         """Return a small dict for UI delta, or None if no changes.
 
         Only emits updates when watch fields change (node, edge, speed, route, route boundary,
-        loaded packages, or building). Watch field changes are detected using
-        TruckWatchFieldsDTO comparison.
-        When changes are detected, returns complete state (TruckStateDTO) including tachograph
-        and fuel fields.
+        loaded packages, or building). Watch field changes are detected by comparing a plain
+        tuple in TruckWatchFieldsDTO field order; building the NamedTuple by keyword would
+        cost more than the comparison itself on this per-truck, per-tick path.
+        The first diff carries the complete state (TruckStateDTO) including tachograph and
+        fuel fields; later diffs carry ``id``, ``kind`` and only the TruckStateDTO fields
+        whose values changed since the previous diff, for clients to merge. Every
+        ``FULL_DIFF_INTERVAL``-th diff, and the next one after ``request_full_diff``, is
+        complete again so clients that missed a delta resynchronize.
         """
-        # Create watch fields DTO from current state
-        current_watch_fields = TruckWatchFieldsDTO(
-            current_node=self.current_node,
-            current_edge=self.current_edge,
-            current_speed_kph=self.current_speed_kph,
-            route=tuple(self.route),  # Convert to tuple for immutability
-            route_start_node=self.route_start_node,
-            route_end_node=self.route_end_node,
-            loaded_packages=tuple(self.loaded_packages),  # Convert to tuple for immutability
-            current_building_id=self.current_building_id,  # Triggers update on building enter/leave
+        # Snapshot watch fields from current state (memoized tuples for immutability)
+        current_watch_fields = (
+            self.current_node,
+            self.current_edge,
+            self.current_speed_kph,
+            self._get_route_snapshot(),
+            self.route_start_node,
+            self.route_end_node,
+            self._get_loaded_snapshot(),
+            self.current_building_id,  # Triggers update on building enter/leave
         )
 
         # Compare with last watch state
-        if current_watch_fields == self._last_serialized_watch_state:
+        last_watch_fields = self._last_serialized_watch_state
+        if current_watch_fields == last_watch_fields:
             return None  # No changes to watch fields
 
-        # Watch fields changed - update last state and return complete state
+        # Watch fields changed - update last state and emit
         self._last_serialized_watch_state = current_watch_fields
-
-        # Create complete state DTO
-        complete_state = TruckStateDTO(
-            id=self.id,
-            kind=self.kind,
-            max_speed_kph=self.max_speed_kph,
-            capacity=self.capacity,
-            loaded_packages=list(self.loaded_packages),
-            current_speed_kph=self.current_speed_kph,
-            current_node=self.current_node,
-            current_edge=self.current_edge,
-            route=self.route.copy(),  # Return as list for frontend
-            route_start_node=self.route_start_node,
-            route_end_node=self.route_end_node,
-            current_building_id=str(self.current_building_id) if self.current_building_id else None,
-            # Tachograph fields
-            driving_time_s=self.driving_time_s,
-            resting_time_s=self.resting_time_s,
-            is_resting=self.is_resting,
-            balance_ducats=self.balance_ducats,
-            risk_factor=self.risk_factor,
-            is_seeking_parking=self.is_seeking_parking,
-            is_seeking_idle_parking=self.is_seeking_idle_parking,
-            original_destination=self.original_destination,
-            # Fuel system fields
-            fuel_tank_capacity_l=self.fuel_tank_capacity_l,
-            current_fuel_l=self.current_fuel_l,
-            co2_emitted_kg=self.co2_emitted_kg,
-            is_seeking_gas_station=self.is_seeking_gas_station,
-            is_fueling=self.is_fueling,
+        # Counters are quantized to what the UI displays (1 s, 0.01 ducat, 0.1 L/kg):
+        # shorter numbers on the wire, and sub-display changes never enter a delta
+        current_other_fields = (
+            self.max_speed_kph,
+            self.capacity,
+            round(self.driving_time_s, 0),
+            round(self.resting_time_s, 0),
+            self.is_resting,
+            round(self.balance_ducats, 2),
+            self.risk_factor,
+            self.is_seeking_parking,
+            self.is_seeking_idle_parking,
+            self.original_destination,
+            self.fuel_tank_capacity_l,
+            round(self.current_fuel_l, 1),
+            round(self.co2_emitted_kg, 1),
+            self.is_seeking_gas_station,
+            self.is_fueling,
         )
+        last_other_fields = self._last_serialized_other_state
+        self._last_serialized_other_state = current_other_fields
+
+        if (
+            last_watch_fields is None
+            or last_other_fields is None
+            or self._diffs_since_full >= FULL_DIFF_INTERVAL
+        ):
+            self._diffs_since_full = 0
+            # Complete state in TruckStateDTO field order, built directly rather than
+            # validated and dumped through the model. ID fields are already strings and
+            # are emitted as the shared objects the truck holds
+            return {
+                "id": self.id,
+                "kind": self.kind,
+                "max_speed_kph": self.max_speed_kph,
+                "capacity": self.capacity,
+                "loaded_packages": list(self.loaded_packages),
+                "current_speed_kph": self.current_speed_kph,
+                "current_node": self.current_node,
+                "current_edge": self.current_edge,
+                "route": list(self.route),
+                "route_start_node": self.route_start_node,
+                "route_end_node": self.route_end_node,
+                "current_building_id": self.current_building_id or None,
+                # Tachograph fields
+                "driving_time_s": current_other_fields[2],
+                "resting_time_s": current_other_fields[3],
+                "is_resting": self.is_resting,
+                "balance_ducats": current_other_fields[5],
+                "risk_factor": self.risk_factor,
+                "is_seeking_parking": self.is_seeking_parking,
+                "is_seeking_idle_parking": self.is_seeking_idle_parking,
+                "original_destination": self.original_destination,
+                # Fuel system fields
+                "fuel_tank_capacity_l": self.fuel_tank_capacity_l,
+                "current_fuel_l": current_other_fields[11],
+                "co2_emitted_kg": current_other_fields[12],
+                "is_seeking_gas_station": self.is_seeking_gas_station,
+                "is_fueling": self.is_fueling,
+            }
 
-        return complete_state.model_dump()
+        self._diffs_since_full += 1
+        # Delta against the previous diff, read straight off the two state tuples so
+        # unchanged fields (typically the route and cargo) are neither copied nor
+        # compared as lists; id and kind always identify the agent
+        delta: dict[str, Any] = {"id": self.id, "kind": self.kind}
+        for key, value, last in zip(
+            _WATCH_PAYLOAD_KEYS, current_watch_fields, last_watch_fields, strict=True
+        ):
+            if value != last:
+                delta[key] = value
+        for key, value, last in zip(
+            _OTHER_PAYLOAD_KEYS, current_other_fields, last_other_fields, strict=True
+        ):
+            if value != last:
+                delta[key] = value
+
+        # Wire forms of the tuple snapshots and the building sentinel
+        if "route" in delta:
+            delta["route"] = list(delta["route"])
+        if "loaded_packages" in delta:
+            delta["loaded_packages"] = list(delta["loaded_packages"])
+        if "current_building_id" in delta:
+            delta["current_building_id"] = delta["current_building_id"] or None
+        return delta
+
+    def request_full_diff(self) -> None:
+        """Make the next ``serialize_diff`` return the complete state, even if unchanged.
+
+        Called when an emitted diff may not have reached clients.
+        """
+        self._last_serialized_watch_state = None
+        self._last_serialized_other_state = None
 
     def serialize_full(self) -> dict[str, Any]:
         """Return complete agent state for state snapshot."""
@@ -1773,9 +2047,7 @@ class Truck:
             "destination": self.destination,
             "route_start_node": self.route_start_node,
             "route_end_node": self.route_end_node,
-            "current_building_id": str(self.current_building_id)
-            if self.current_building_id
-            else None,
+            "current_building_id": self.current_building_id or None,
             # Tachograph fields
             "driving_time_s": self.driving_time_s,
             "resting_time_s": self.resting_time_s,
@@ -1799,7 +2071,7 @@ class Truck:
             "is_unloading": self.is_unloading,
             "loading_progress_s": self.loading_progress_s,
             "loading_target_s": self.loading_target_s,
-            "broker_id": str(self.broker_id) if self.broker_id else None,
+            "broker_id": self.broker_id or None,
             # Metadata
             "inbox_count": len(self.inbox),
             "outbox_count": len(self.outbox),
@@ -1860,8 +2132,10 @@ class Truck:
             # Parse route (list of NodeIDs)
             route = [NodeID(node) for node in data.get("route", [])]
 
-            # Parse loaded packages (list of PackageIDs)
-            loaded_packages = [PackageID(pkg) for pkg in data.get("loaded_packages", [])]
+            # Parse loaded packages (serialized as a list of PackageIDs, in load order)
+            loaded_packages = dict.fromkeys(
+                PackageID(pkg) for pkg in data.get("loaded_packages", [])
+            )
 
             # Parse delivery queue
             delivery_queue = []
@@ -1915,6 +2189,9 @@ class Truck:
                 loading_progress_s=float(data.get("loading_progress_s", 0.0)),
                 loading_target_s=float(data.get("loading_target_s", 0.0)),
             )
+            truck.current_delivery_task = next(
+                (task for task in delivery_queue if task.status == TaskStatus.IN_PROGRESS), None
+            )
 
             return truck
 
@@ -1,7 +1,17 @@
-from core.buildings.base import Building
+from core.buildings.base import Building, register_building_type
 from core.buildings.gas_station import GasStation
 from core.buildings.occupancy import OccupiableBuilding
 from core.buildings.parking import Parking
-from core.buildings.site import Site
+from core.buildings.site import Site, SiteStatistics
 
-__all__ = ["Building", "GasStation", "OccupiableBuilding", "Parking", "Site"]
+for _building_cls in (Parking, Site, GasStation):
+    register_building_type(_building_cls)
+
+__all__ = [
+    "Building",
+    "GasStation",
+    "OccupiableBuilding",
+    "Parking",
+    "Site",
+    "SiteStatistics",
+]
@@ -1,10 +1,10 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Any, ClassVar
 
 from core.types import BuildingID
 
 
-@dataclass
+@dataclass(slots=True)
 class Building:
     """Base building class representing a physical facility in the logistics network.
 
@@ -20,10 +20,26 @@ class Building:
     _last_serialized_state: dict[str, Any] = field(
         default_factory=dict, init=False, repr=False, compare=False
     )
+    # World-owned registry of dirty buildings, set by World when it starts tracking the graph
+    _dirty_sink: dict[BuildingID, "Building"] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def mark_dirty(self) -> None:
         """Mark building as having changed state, triggering update signal emission."""
         self._dirty = True
+        if self._dirty_sink is not None:
+            self._dirty_sink[self.id] = self
+
+    def track_dirty(self, sink: dict[BuildingID, "Building"]) -> None:
+        """Report future dirty marks to ``sink`` so the owner can skip clean buildings.
+
+        Args:
+            sink: Registry of dirty buildings keyed by building ID
+        """
+        self._dirty_sink = sink
+        if self._dirty:
+            sink[self.id] = self
 
     def is_dirty(self) -> bool:
         """Check if building has unserialized state changes."""
@@ -34,22 +50,33 @@ class Building:
         self._dirty = False
 
     def to_dict(self) -> dict[str, Any]:
-        """Serialize building to dictionary."""
-        data = asdict(self)
+        """Serialize building to dictionary.
+
+        Only public fields are included; internal tracking fields (underscore-prefixed)
+        are skipped rather than deep-copied and discarded. Subclasses convert their
+        container fields explicitly.
+        """
+        data = {name: getattr(self, name) for name in _public_field_names(type(self))}
         data["id"] = str(self.id)
         data["type"] = self.TYPE
-        # Remove internal tracking fields from serialization
-        data.pop("_dirty", None)
-        data.pop("_last_serialized_state", None)
         return data
 
     def serialize_full(self) -> dict[str, Any]:
         """Return complete building state for state snapshot.
 
+        Clean buildings reuse the last serialized state instead of rebuilding it,
+        so snapshotting many static buildings costs a single reference return each.
+        Callers must treat the returned dictionary as read-only.
+
         Returns:
             Full serialized building state dictionary.
         """
-        return self.to_dict()
+        if not self._dirty and self._last_serialized_state:
+            return self._last_serialized_state
+
+        current_state = self.to_dict()
+        self._last_serialized_state = current_state
+        return current_state
 
     def serialize_diff(self) -> dict[str, Any] | None:
         """Return building state if dirty, or None if no changes.
@@ -73,18 +100,38 @@ class Building:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Building":
-        """Deserialize building from dictionary."""
-        building_type = data.get("type", cls.TYPE)
-        if building_type == "parking":
-            from core.buildings.parking import Parking
+        """Deserialize building from dictionary.
 
-            return Parking.from_dict(data)
-        elif building_type == "site":
-            from core.buildings.site import Site
+        Dispatches on the payload's ``type`` field through the building registry
+        populated by ``core.buildings``; unknown types fall back to ``cls``.
+        """
+        building_cls = _BUILDING_REGISTRY.get(data.get("type", cls.TYPE))
+        if building_cls is not None and building_cls is not Building:
+            return building_cls.from_dict(data)
+        return cls(id=BuildingID(data["id"]))
 
-            return Site.from_dict(data)
-        elif building_type == "gas_station":
-            from core.buildings.gas_station import GasStation
 
-            return GasStation.from_dict(data)
-        return cls(id=BuildingID(data["id"]))
+# Public dataclass field names per building class, resolved once instead of on every to_dict
+_PUBLIC_FIELD_NAMES: dict[type[Building], tuple[str, ...]] = {}
+
+
+def _public_field_names(building_cls: type[Building]) -> tuple[str, ...]:
+    """Return the non-underscore dataclass field names of ``building_cls``, in field order."""
+    names = _PUBLIC_FIELD_NAMES.get(building_cls)
+    if names is None:
+        names = tuple(f.name for f in fields(building_cls) if not f.name.startswith("_"))
+        _PUBLIC_FIELD_NAMES[building_cls] = names
+    return names
+
+
+# Maps Building.TYPE tags to concrete classes for from_dict dispatch
+_BUILDING_REGISTRY: dict[str, type[Building]] = {Building.TYPE: Building}
+
+
+def register_building_type(building_cls: type[Building]) -> None:
+    """Register a building subclass for ``Building.from_dict`` dispatch.
+
+    Args:
+        building_cls: Building subclass keyed by its ``TYPE`` tag
+    """
+    _BUILDING_REGISTRY[building_cls.TYPE] = building_cls
@@ -7,7 +7,7 @@ from core.buildings.occupancy import OccupiableBuilding
 from core.types import AgentID, BuildingID
 
 
-@dataclass
+@dataclass(slots=True)
 class GasStation(OccupiableBuilding):
     """Gas station building that provides fuel services to transport agents.
 
@@ -24,7 +24,7 @@ class GasStation(OccupiableBuilding):
 
     def __post_init__(self) -> None:
         """Validate the gas station configuration."""
-        super().__post_init__()
+        super(GasStation, self).__post_init__()
         if self.cost_factor <= 0:
             raise ValueError("GasStation cost_factor must be positive")
 
@@ -55,7 +55,7 @@ class GasStation(OccupiableBuilding):
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize gas station to dictionary."""
-        data = super().to_dict()
+        data = super(GasStation, self).to_dict()
         data["cost_factor"] = self.cost_factor
         data["balance_ducats"] = self.balance_ducats
         return data
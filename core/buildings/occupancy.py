@@ -8,7 +8,7 @@ from core.buildings.base import Building
 from core.types import AgentID
 
 
-@dataclass
+@dataclass(slots=True)
 class OccupiableBuilding(Building):
     """Base building class for facilities that can hold agents up to a capacity limit.
 
@@ -18,6 +18,8 @@ class OccupiableBuilding(Building):
 
     capacity: int
     current_agents: set[AgentID] = field(default_factory=set)
+    # Lazily built sorted occupant list for serialization; reset on occupancy changes
+    _agents_sorted: list[str] | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate the occupancy configuration."""
@@ -39,11 +41,13 @@ class OccupiableBuilding(Building):
         Raises:
             ValueError: If agent is already present or facility is at capacity
         """
-        if agent_id in self.current_agents:
+        current_agents = self.current_agents
+        if agent_id in current_agents:
             raise ValueError(f"Agent {agent_id} is already in {self.__class__.__name__}")
-        if not self.has_space():
+        if len(current_agents) >= self.capacity:
             raise ValueError(f"{self.__class__.__name__} is at full capacity")
-        self.current_agents.add(agent_id)
+        current_agents.add(agent_id)
+        self._agents_sorted = None
         self.mark_dirty()
 
     def leave(self, agent_id: AgentID) -> None:
@@ -55,9 +59,12 @@ class OccupiableBuilding(Building):
         Raises:
             ValueError: If agent is not present in the facility
         """
-        if agent_id not in self.current_agents:
-            raise ValueError(f"Agent {agent_id} is not in {self.__class__.__name__}")
-        self.current_agents.remove(agent_id)
+        # A single hash lookup: remove() both checks membership and drops the agent
+        try:
+            self.current_agents.remove(agent_id)
+        except KeyError:
+            raise ValueError(f"Agent {agent_id} is not in {self.__class__.__name__}") from None
+        self._agents_sorted = None
         self.mark_dirty()
 
     def assign_occupants(self, agents: Iterable[AgentID]) -> None:
@@ -74,11 +81,19 @@ class OccupiableBuilding(Building):
             raise ValueError(f"Occupant assignment exceeds {self.__class__.__name__} capacity")
         if occupants != self.current_agents:
             self.current_agents = occupants
+            self._agents_sorted = None
             self.mark_dirty()
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize occupancy data to dictionary with deterministic occupant order."""
-        data = super().to_dict()
+        # Two-argument super(): slots=True rebuilds the class, which breaks the zero-arg form
+        data = super(OccupiableBuilding, self).to_dict()
         data["capacity"] = self.capacity
-        data["current_agents"] = sorted(str(agent) for agent in self.current_agents)
+        data["current_agents"] = self._serialize_agents()
         return data
+
+    def _serialize_agents(self) -> list[str]:
+        """Return a fresh copy of the cached, sorted occupant list."""
+        if self._agents_sorted is None:
+            self._agents_sorted = sorted(map(str, self.current_agents))
+        return list(self._agents_sorted)
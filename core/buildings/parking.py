@@ -8,7 +8,7 @@ from core.buildings.occupancy import OccupiableBuilding
 from core.types import AgentID, BuildingID
 
 
-@dataclass
+@dataclass(slots=True)
 class Parking(OccupiableBuilding):
     """Parking building that tracks parked agents up to a capacity limit.
 
@@ -59,7 +59,10 @@ class Parking(OccupiableBuilding):
         occupants = {AgentID(agent) for agent in agents}
         if len(occupants) > self.capacity:
             raise ValueError("Occupant assignment exceeds parking capacity")
-        self.current_agents = occupants
+        if occupants != self.current_agents:
+            self.current_agents = occupants
+            self._agents_sorted = None
+            self.mark_dirty()
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Parking":
@@ -2,14 +2,102 @@
 
 import math
 import random
-from dataclasses import asdict, dataclass, field
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import Any, ClassVar
 
 from core.buildings.occupancy import OccupiableBuilding
-from core.types import AgentID, DeliveryUrgency, PackageID, Priority, SiteID
+from core.sampling.alias import AliasTable
+from core.types import AgentID, BuildingID, DeliveryUrgency, PackageID, Priority, SiteID
+
+# Value multipliers by priority and urgency; levels not listed keep the base value.
+# Keyed by the str enums, so plain-string weights loaded from JSON match as well.
+_PRIORITY_VALUE_MULTIPLIERS: dict[Priority, float] = {Priority.HIGH: 1.5, Priority.URGENT: 2.0}
+_URGENCY_VALUE_MULTIPLIERS: dict[DeliveryUrgency, float] = {
+    DeliveryUrgency.EXPRESS: 1.3,
+    DeliveryUrgency.SAME_DAY: 1.8,
+}
+
+
+_PACKAGE_CONFIG_KEYS = (
+    "size_range",
+    "value_range_currency",
+    "pickup_deadline_range_ticks",
+    "delivery_deadline_range_ticks",
+    "priority_weights",
+    "urgency_weights",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PackageConfig:
+    """Parsed ``Site.package_config`` with scalar ranges and prebuilt alias tables.
+
+    Built once per config dict so package generation reads attributes instead of
+    probing the dict and unpacking range tuples on every spawn.
+    """
+
+    size_min: float
+    size_max: float
+    value_min: float
+    value_max: float
+    pickup_min_ticks: int
+    pickup_max_ticks: int
+    delivery_min_ticks: int
+    delivery_max_ticks: int
+    priorities: AliasTable[Any]
+    urgencies: AliasTable[Any]
 
+    @classmethod
+    def from_dict(cls, config: dict[str, Any]) -> "PackageConfig":
+        """Parse a site's package configuration dictionary.
 
-@dataclass
+        Raises:
+            ValueError: If a required key is missing or a weights mapping is empty
+        """
+        missing = [key for key in _PACKAGE_CONFIG_KEYS if key not in config]
+        if missing:
+            raise ValueError(f"Site package_config is missing {', '.join(missing)}")
+        size_min, size_max = config["size_range"]
+        value_min, value_max = config["value_range_currency"]
+        pickup_min, pickup_max = config["pickup_deadline_range_ticks"]
+        delivery_min, delivery_max = config["delivery_deadline_range_ticks"]
+        return cls(
+            size_min=size_min,
+            size_max=size_max,
+            value_min=value_min,
+            value_max=value_max,
+            pickup_min_ticks=pickup_min,
+            pickup_max_ticks=pickup_max,
+            delivery_min_ticks=delivery_min,
+            delivery_max_ticks=delivery_max,
+            priorities=AliasTable(config["priority_weights"]),
+            urgencies=AliasTable(config["urgency_weights"]),
+        )
+
+
+# Package configuration of sites created without one
+_DEFAULT_PACKAGE_CONFIG: dict[str, Any] = {
+    "size_range": (1.0, 30.0),  # Unitless size (1-30)
+    "value_range_currency": (10.0, 1000.0),
+    "pickup_deadline_range_ticks": (1800, 7200),  # 30min to 2h in ticks
+    "delivery_deadline_range_ticks": (3600, 14400),  # 1h to 4h in ticks
+    "priority_weights": {
+        Priority.LOW: 0.4,
+        Priority.MEDIUM: 0.3,
+        Priority.HIGH: 0.2,
+        Priority.URGENT: 0.1,
+    },
+    "urgency_weights": {
+        DeliveryUrgency.STANDARD: 0.6,
+        DeliveryUrgency.EXPRESS: 0.3,
+        DeliveryUrgency.SAME_DAY: 0.1,
+    },
+}
+_DEFAULT_PARSED_CONFIG = (_DEFAULT_PACKAGE_CONFIG, PackageConfig.from_dict(_DEFAULT_PACKAGE_CONFIG))
+
+
+@dataclass(slots=True)
 class SiteStatistics:
     """Statistics tracking for site performance."""
 
@@ -22,7 +110,14 @@ class SiteStatistics:
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize statistics to dictionary."""
-        return asdict(self)
+        return {
+            "packages_generated": self.packages_generated,
+            "packages_picked_up": self.packages_picked_up,
+            "packages_delivered": self.packages_delivered,
+            "packages_expired": self.packages_expired,
+            "total_value_delivered": self.total_value_delivered,
+            "total_value_expired": self.total_value_expired,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "SiteStatistics":
@@ -30,7 +125,7 @@ class SiteStatistics:
         return cls(**data)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Site(OccupiableBuilding):
     """Site building for pickup and delivery operations.
 
@@ -40,108 +135,194 @@ class Site(OccupiableBuilding):
 
     Note: Uses kw_only=True to allow non-default fields after inherited defaults.
     All fields must be passed as keyword arguments when constructing Site.
+    Slotted like its bases, so init=False fields get real per-instance storage.
     """
 
     TYPE: ClassVar[str] = "site"
 
     # Site-specific fields
     name: str
-    activity_rate: float  # λ for Poisson process (packages/hour)
+    activity_rate: float  # λ for Poisson process (packages/hour), fixed after construction
     # Override capacity with a default (3 trucks can dock at once)
     capacity: int = 3
     # Fields with defaults
     loading_rate_tonnes_per_min: float = 0.5  # 0.5 tonnes/min = 2 min per tonne
     destination_weights: dict[SiteID, float] = field(default_factory=dict)
     package_config: dict[str, Any] = field(default_factory=dict)
-    active_packages: list[PackageID] = field(default_factory=list)
+    # Insertion-ordered set of waiting packages (dict keys) for O(1) add/remove
+    active_packages: dict[PackageID, None] = field(default_factory=dict)
     statistics: SiteStatistics = field(default_factory=SiteStatistics)
+    # Seed for this site's random stream; None derives one from the global `random` state
+    seed: int | None = None
+    # Private generator for all of this site's draws, created in __post_init__
+    _rng: random.Random = field(init=False, repr=False, compare=False)
+    # activity_rate converted to packages/second, set in __post_init__
+    _lambda_per_second: float = field(default=0.0, init=False, repr=False, compare=False)
+    # Tick of the next scheduled spawn (None until first scheduled, inf if inactive)
+    _next_spawn_tick: float | None = field(default=None, init=False, repr=False, compare=False)
+    # Tick length the pending spawn tick was computed with
+    _spawn_dt_s: float = field(default=0.0, init=False, repr=False, compare=False)
+    # (package_config dict it was parsed from, parsed config)
+    _parsed_config: tuple[dict[str, Any], PackageConfig] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (destination_weights, candidate sites, table or None for uniform choice) of the last call
+    _destination_alias: (
+        tuple[dict[SiteID, float], tuple[SiteID, ...], AliasTable[SiteID] | None] | None
+    ) = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Initialize site with default package configuration and validate occupancy."""
+        """Initialize site with default package configuration and validate it and occupancy."""
         # Validate occupancy configuration from parent
-        super().__post_init__()
+        super(Site, self).__post_init__()
+        self._lambda_per_second = self.activity_rate / 3600.0
+        # Deriving from the global state keeps runs reproducible under random.seed()
+        self._rng = random.Random(self.seed if self.seed is not None else random.getrandbits(64))
 
         if not self.package_config:
-            self.package_config = {
-                "size_range": (1.0, 30.0),  # Unitless size (1-30)
-                "value_range_currency": (10.0, 1000.0),
-                "pickup_deadline_range_ticks": (1800, 7200),  # 30min to 2h in ticks
-                "delivery_deadline_range_ticks": (3600, 14400),  # 1h to 4h in ticks
-                "priority_weights": {
-                    Priority.LOW: 0.4,
-                    Priority.MEDIUM: 0.3,
-                    Priority.HIGH: 0.2,
-                    Priority.URGENT: 0.1,
-                },
-                "urgency_weights": {
-                    DeliveryUrgency.STANDARD: 0.6,
-                    DeliveryUrgency.EXPRESS: 0.3,
-                    DeliveryUrgency.SAME_DAY: 0.1,
-                },
-            }
+            # Shared by every site without its own config, together with its parse;
+            # configs are replaced rather than edited in place (see get_package_config)
+            self.package_config = _DEFAULT_PACKAGE_CONFIG
+            self._parsed_config = _DEFAULT_PARSED_CONFIG
+
+        # Parse (and validate) up front so the spawn path starts with frozen tables
+        self.get_package_config()
 
     def to_dict(self) -> dict[str, Any]:
-        """Serialize site to dictionary."""
-        # Start with parent's serialization (includes capacity, current_agents)
-        data = super().to_dict()
-        # Add site-specific fields
-        data["name"] = self.name
-        data["activity_rate"] = self.activity_rate
-        data["loading_rate_tonnes_per_min"] = self.loading_rate_tonnes_per_min
-        data["destination_weights"] = {str(k): v for k, v in self.destination_weights.items()}
-        data["package_config"] = self.package_config
-        data["active_packages"] = list(self.active_packages)
-        # Convert SiteStatistics to dict
-        data["statistics"] = self.statistics.to_dict()
-        # Add type field
-        data["type"] = self.TYPE
-        return data
+        """Serialize site to dictionary.
+
+        Built directly rather than through the parent chain, which would first copy
+        every field generically and then overwrite most of them. ``package_config`` is
+        emitted as a copy (nested weights and ranges included), since sites without
+        their own config share one dict and its cached parse.
+        """
+        return {
+            "id": str(self.id),
+            "capacity": self.capacity,
+            "current_agents": self._serialize_agents(),
+            "name": self.name,
+            "activity_rate": self.activity_rate,
+            "loading_rate_tonnes_per_min": self.loading_rate_tonnes_per_min,
+            "destination_weights": {str(k): v for k, v in self.destination_weights.items()},
+            "package_config": {
+                key: value.copy() if isinstance(value, dict | list) else value
+                for key, value in self.package_config.items()
+            },
+            "active_packages": list(self.active_packages),
+            "statistics": self.statistics.to_dict(),
+            "seed": self.seed,
+            "type": self.TYPE,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Site":
-        """Deserialize site from dictionary."""
-        # Remove fields not needed for construction
-        data = dict(data)  # Create copy to avoid mutating original
-        data.pop("type", None)
-        data.pop("_dirty", None)
-        data.pop("_last_serialized_state", None)
-
-        # Convert current_agents list back to set
-        if "current_agents" in data and isinstance(data["current_agents"], list):
-            data["current_agents"] = {AgentID(a) for a in data["current_agents"]}
-
-        # Convert destination_weights keys back to SiteID
-        if "destination_weights" in data and isinstance(data["destination_weights"], dict):
-            data["destination_weights"] = {
-                SiteID(k): v for k, v in data["destination_weights"].items()
-            }
+        """Deserialize site from dictionary.
 
-        # Convert statistics dict back to SiteStatistics
-        if isinstance(data.get("statistics"), dict):
-            data["statistics"] = SiteStatistics.from_dict(data["statistics"])
-        return cls(**data)
+        Fields are read straight into constructor arguments, so the payload is
+        neither copied nor mutated; keys that are not site fields are ignored.
+        """
+        return cls(
+            id=BuildingID(data["id"]),
+            name=data["name"],
+            activity_rate=data["activity_rate"],
+            capacity=data.get("capacity", 3),
+            current_agents={AgentID(a) for a in data.get("current_agents", ())},
+            loading_rate_tonnes_per_min=data.get("loading_rate_tonnes_per_min", 0.5),
+            destination_weights={
+                SiteID(k): v for k, v in data.get("destination_weights", {}).items()
+            },
+            package_config=data.get("package_config") or {},
+            active_packages=dict.fromkeys(PackageID(p) for p in data.get("active_packages", ())),
+            statistics=SiteStatistics.from_dict(data.get("statistics") or {}),
+            seed=data.get("seed"),
+        )
 
     def should_spawn_package(self, dt_s: float) -> bool:
         """Check if a package should spawn based on Poisson process.
 
+        Not used by the simulation, which spawns through the equivalent next-event
+        schedule in ``is_spawn_due``. Kept as public API for external callers without a
+        tick counter, and as the reference per-tick form the tests check the schedule
+        against.
+
         Args:
             dt_s: Time delta in seconds
 
         Returns:
             True if package should spawn this tick
         """
-        # Convert activity rate from packages/hour to packages/second
-        lambda_per_second = self.activity_rate / 3600.0
+        # Poisson probability: P(X >= 1) = 1 - exp(-λ * dt), via expm1 to keep
+        # precision when λ * dt is small
+        spawn_probability: float = -math.expm1(-self._lambda_per_second * dt_s)
 
-        # Poisson probability: P(X >= 1) = 1 - exp(-λ * dt)
-        spawn_probability: float = 1.0 - math.exp(-lambda_per_second * dt_s)
-
-        result: bool = random.random() < spawn_probability
+        result: bool = self._rng.random() < spawn_probability
         return result
 
-    def select_destination(self, available_sites: list[SiteID]) -> SiteID | None:
+    def is_spawn_due(self, current_tick: int, dt_s: float) -> bool:
+        """Check if a package spawns this tick using next-event scheduling.
+
+        Instead of a Bernoulli trial every tick, the wait until the next spawn is
+        drawn once per spawn: ceil(X / dt) ticks with X ~ Exp(λ). That wait is
+        geometric with the same per-tick probability 1 - exp(-λ * dt) used by
+        should_spawn_package, so ticks without a spawn cost one comparison.
+
+        Args:
+            current_tick: Current simulation tick
+            dt_s: Time delta per tick in seconds
+
+        Returns:
+            True if package should spawn this tick
+        """
+        if current_tick < self.next_spawn_tick(current_tick, dt_s):
+            return False
+
+        self._schedule_next_spawn(current_tick, dt_s)
+        return True
+
+    def next_spawn_tick(self, current_tick: int, dt_s: float) -> float:
+        """Return the tick of the next scheduled spawn, scheduling one if needed.
+
+        If ``dt_s`` differs from the tick length the spawn was scheduled with, the
+        remaining wait is rescaled so the spawn stays at the same simulated time.
+
+        Args:
+            current_tick: Current simulation tick
+            dt_s: Time delta per tick in seconds
+
+        Returns:
+            Tick of the next spawn (math.inf if the site never spawns)
+        """
+        next_tick = self._next_spawn_tick
+        if next_tick is None:
+            # First check behaves as if the schedule started on the previous tick
+            next_tick = self._schedule_next_spawn(current_tick - 1, dt_s)
+        elif dt_s != self._spawn_dt_s:
+            remaining_ticks = next_tick - current_tick
+            if 0 < remaining_ticks < math.inf:
+                next_tick = current_tick + math.ceil(remaining_ticks * self._spawn_dt_s / dt_s)
+                self._next_spawn_tick = next_tick
+            self._spawn_dt_s = dt_s
+        return next_tick
+
+    def _schedule_next_spawn(self, from_tick: int, dt_s: float) -> float:
+        """Draw and store the tick of the next spawn after ``from_tick``."""
+        lambda_per_second = self._lambda_per_second
+        if lambda_per_second <= 0.0:
+            next_tick = math.inf
+        else:
+            wait_s = self._rng.expovariate(lambda_per_second)
+            next_tick = from_tick + max(1, math.ceil(wait_s / dt_s))
+        self._next_spawn_tick = next_tick
+        self._spawn_dt_s = dt_s
+        return next_tick
+
+    def select_destination(self, available_sites: Sequence[SiteID]) -> SiteID | None:
         """Select destination site based on weights.
 
+        The alias table for the weighted sites is cached and reused while the
+        candidate list and ``destination_weights`` stay the same. Passing the same
+        tuple object on every call (as World does) makes the cache check O(1).
+
         Args:
             available_sites: List of available destination sites
 
@@ -151,78 +332,80 @@ class Site(OccupiableBuilding):
         if not available_sites:
             return None
 
-        # Filter weights to only include available sites
-        valid_weights = {
-            site_id: weight
-            for site_id, weight in self.destination_weights.items()
-            if site_id in available_sites
-        }
-
-        if not valid_weights:
-            # If no weights defined, select randomly
-            return random.choice(available_sites)
-
-        # Normalize weights to probabilities
-        total_weight = sum(valid_weights.values())
-        if total_weight == 0:
-            return random.choice(available_sites)
-
-        probabilities = {
-            site_id: weight / total_weight for site_id, weight in valid_weights.items()
-        }
+        candidates = (
+            available_sites if isinstance(available_sites, tuple) else tuple(available_sites)
+        )
+        cached = self._destination_alias
+        if (
+            cached is None
+            or cached[0] is not self.destination_weights
+            or (cached[1] is not candidates and cached[1] != candidates)
+        ):
+            # Filter weights to only include available sites
+            available = set(candidates)
+            valid_weights = {
+                site_id: weight
+                for site_id, weight in self.destination_weights.items()
+                if site_id in available
+            }
+            # No weights (or all zero) means a uniform choice among the candidates
+            table = AliasTable(valid_weights) if sum(valid_weights.values()) > 0 else None
+            cached = (self.destination_weights, candidates, table)
+            self._destination_alias = cached
 
-        # Weighted random selection
-        rand_val = random.random()
-        cumulative = 0.0
+        table = cached[2]
+        if table is None:
+            return self._rng.choice(available_sites)
+        return table.sample(self._rng.random)
 
-        for site_id, probability in probabilities.items():
-            cumulative += probability
-            if rand_val <= cumulative:
-                return site_id
+    def get_package_config(self) -> PackageConfig:
+        """Get the parsed package configuration.
 
-        # Fallback to last site (shouldn't happen)
-        return list(probabilities.keys())[-1]
+        Parsed in ``__post_init__`` and again whenever ``package_config`` is replaced;
+        assign a new dict rather than editing it in place to change the configuration.
+        """
+        cached = self._parsed_config
+        if cached is None or cached[0] is not self.package_config:
+            cached = (self.package_config, PackageConfig.from_dict(self.package_config))
+            self._parsed_config = cached
+        return cached[1]
 
     def generate_package_parameters(self) -> dict[str, Any]:
-        """Generate random package parameters based on configuration."""
-        config = self.package_config
+        """Generate random package parameters based on configuration.
+
+        All draws come from the site's ``random()`` scaled inline; ``uniform`` and
+        ``randint`` add a Python-level call (and a rejection loop for randint) per
+        value on this per-spawn path.
+        """
+        cfg = self.get_package_config()
+        rand = self._rng.random
 
         # Generate size (unitless, 1-30)
-        size_min, size_max = config["size_range"]
-        size = random.uniform(size_min, size_max)
+        size = cfg.size_min + (cfg.size_max - cfg.size_min) * rand()
 
         # Generate value (higher priority/urgency = higher value)
-        value_min, value_max = config["value_range_currency"]
-        base_value = random.uniform(value_min, value_max)
+        base_value = cfg.value_min + (cfg.value_max - cfg.value_min) * rand()
 
         # Select priority and urgency
-        priority = self._weighted_choice(config["priority_weights"])
-        urgency = self._weighted_choice(config["urgency_weights"])
+        priority = cfg.priorities.sample(rand)
+        urgency = cfg.urgencies.sample(rand)
 
         # Adjust value based on priority and urgency
-        value_multiplier = 1.0
-        if priority == Priority.HIGH:
-            value_multiplier *= 1.5
-        elif priority == Priority.URGENT:
-            value_multiplier *= 2.0
-
-        if urgency == DeliveryUrgency.EXPRESS:
-            value_multiplier *= 1.3
-        elif urgency == DeliveryUrgency.SAME_DAY:
-            value_multiplier *= 1.8
-
-        value_currency = base_value * value_multiplier
-
-        # Generate deadlines
-        pickup_min, pickup_max = config["pickup_deadline_range_ticks"]
-        delivery_min, delivery_max = config["delivery_deadline_range_ticks"]
-
-        pickup_deadline_tick = random.randint(pickup_min, pickup_max)
-        delivery_deadline_tick = random.randint(delivery_min, delivery_max)
-
-        # Ensure delivery deadline is after pickup deadline
+        priority_multiplier = _PRIORITY_VALUE_MULTIPLIERS.get(priority, 1.0)
+        urgency_multiplier = _URGENCY_VALUE_MULTIPLIERS.get(urgency, 1.0)
+        value_currency = base_value * priority_multiplier * urgency_multiplier
+
+        # Generate deadlines (inclusive integer ranges)
+        pickup_min = cfg.pickup_min_ticks
+        delivery_min = cfg.delivery_min_ticks
+        pickup_deadline_tick = pickup_min + int(rand() * (cfg.pickup_max_ticks - pickup_min + 1))
+        delivery_deadline_tick = delivery_min + int(
+            rand() * (cfg.delivery_max_ticks - delivery_min + 1)
+        )
+
+        # Ensure delivery deadline is after pickup deadline (1800-3600 ticks later)
         if delivery_deadline_tick <= pickup_deadline_tick:
-            delivery_deadline_tick = pickup_deadline_tick + random.randint(1800, 3600)
+            delivery_deadline_tick = pickup_deadline_tick + 1800 + int(rand() * 1801)
 
         return {
             "size": size,
@@ -233,57 +416,56 @@ class Site(OccupiableBuilding):
             "delivery_deadline_tick": delivery_deadline_tick,
         }
 
-    def _weighted_choice(self, weights: dict[Any, float]) -> Any:
-        """Select an item based on weights."""
-        items = list(weights.keys())
-        probabilities = list(weights.values())
-
-        # Normalize probabilities
-        total = sum(probabilities)
-        if total == 0:
-            return random.choice(items)
-
-        probabilities = [p / total for p in probabilities]
-
-        # Weighted random selection
-        rand_val = random.random()
-        cumulative = 0.0
-
-        for item, probability in zip(items, probabilities, strict=False):
-            cumulative += probability
-            if rand_val <= cumulative:
-                return item
-
-        return items[-1]  # Fallback
-
     def add_package(self, package_id: PackageID) -> None:
         """Add package to active packages list."""
         if package_id not in self.active_packages:
-            self.active_packages.append(package_id)
+            self.active_packages[package_id] = None
             self.mark_dirty()
 
     def remove_package(self, package_id: PackageID) -> None:
         """Remove package from active packages list."""
         if package_id in self.active_packages:
-            self.active_packages.remove(package_id)
+            del self.active_packages[package_id]
             self.mark_dirty()
 
     def update_statistics(self, event_type: str, value: float = 0.0) -> None:
-        """Update site statistics based on package events."""
+        """Update site statistics based on package events.
+
+        String-keyed entry point kept for callers that carry the event name; hot
+        paths call the matching ``record_*`` method directly.
+        """
         if event_type == "generated":
-            self.statistics.packages_generated += 1
-            self.mark_dirty()
+            self.record_generated()
         elif event_type == "picked_up":
-            self.statistics.packages_picked_up += 1
-            self.mark_dirty()
+            self.record_picked_up()
         elif event_type == "delivered":
-            self.statistics.packages_delivered += 1
-            self.statistics.total_value_delivered += value
-            self.mark_dirty()
+            self.record_delivered(value)
         elif event_type == "expired":
-            self.statistics.packages_expired += 1
-            self.statistics.total_value_expired += value
-            self.mark_dirty()
+            self.record_expired(value)
+
+    def record_generated(self) -> None:
+        """Count a package spawned at this site."""
+        self.statistics.packages_generated += 1
+        self.mark_dirty()
+
+    def record_picked_up(self) -> None:
+        """Count a package picked up from this site."""
+        self.statistics.packages_picked_up += 1
+        self.mark_dirty()
+
+    def record_delivered(self, value: float) -> None:
+        """Count a package delivered to this site and its value."""
+        statistics = self.statistics
+        statistics.packages_delivered += 1
+        statistics.total_value_delivered += value
+        self.mark_dirty()
+
+    def record_expired(self, value: float) -> None:
+        """Count a package that expired at this site and the value lost."""
+        statistics = self.statistics
+        statistics.packages_expired += 1
+        statistics.total_value_expired += value
+        self.mark_dirty()
 
     def calculate_loading_time_s(self, total_weight_tonnes: float) -> float:
         """Calculate the time needed to load/unload a given weight.
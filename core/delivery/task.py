@@ -6,7 +6,7 @@ from typing import Any
 from core.types import PackageID, SiteID, TaskStatus, TaskType
 
 
-@dataclass
+@dataclass(slots=True)
 class DeliveryTask:
     """Represents a pickup or delivery task in a truck's delivery queue.
 
@@ -1,13 +1,140 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Any
 
-from .types import AgentID
+from .types import AgentID, PackageID, SiteID
 
 
-@dataclass
+@dataclass(slots=True)
 class Msg:
     src: AgentID
     dst: AgentID | None = None
     topic: str | None = None
     typ: str = ""  # e.g., "auction", "award", "reroute", "handoff", "signal"
     body: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to the generic wire form; typed payload fields are placed in ``body``."""
+        body = dict(self.body)
+        for f in fields(self):
+            if f.name not in _BASE_FIELD_NAMES:
+                body[f.name] = getattr(self, f.name)
+        return {
+            "src": self.src,
+            "dst": self.dst,
+            "topic": self.topic,
+            "typ": self.typ,
+            "body": body,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Msg":
+        """Deserialize a message, building the typed subclass registered for its ``typ``."""
+        typ = data.get("typ", "")
+        src = AgentID(data["src"])
+        dst = data.get("dst")
+        topic = data.get("topic")
+        body = dict(data.get("body", {}))
+        msg_cls = _MSG_TYPES.get(typ)
+        if msg_cls is None:
+            return Msg(src=src, dst=dst, topic=topic, typ=typ, body=body)
+        return msg_cls(src=src, dst=dst, topic=topic, **body)
+
+
+_BASE_FIELD_NAMES = frozenset(f.name for f in fields(Msg))
+
+
+# Typed broker/truck protocol messages. Payloads are slotted attributes rather than
+# ``body`` entries; ``typ`` is fixed per class so string-based routing keeps working.
+
+
+@dataclass(slots=True, kw_only=True)
+class ProposalMsg(Msg):
+    """Broker asks a truck to pick up and deliver a package."""
+
+    typ: str = field(default="proposal", init=False)
+    package_id: PackageID
+    origin_site_id: SiteID
+    destination_site_id: SiteID
+    package_size: float
+    package_value: float
+    pickup_deadline_tick: int
+    delivery_deadline_tick: int
+
+
+@dataclass(slots=True, kw_only=True)
+class AssignmentConfirmedMsg(Msg):
+    """Broker confirms that an accepted package is assigned to the truck."""
+
+    typ: str = field(default="assignment_confirmed", init=False)
+    package_id: PackageID
+    origin_site_id: SiteID
+    destination_site_id: SiteID
+    package_size: float
+    pickup_deadline_tick: int
+    delivery_deadline_tick: int
+
+
+@dataclass(slots=True, kw_only=True)
+class AcceptMsg(Msg):
+    """Truck accepts a proposal with its estimated pickup and delivery ticks."""
+
+    typ: str = field(default="accept", init=False)
+    package_id: PackageID
+    estimated_pickup_tick: int
+    estimated_delivery_tick: int
+
+
+@dataclass(slots=True, kw_only=True)
+class RejectMsg(Msg):
+    """Truck rejects a proposal."""
+
+    typ: str = field(default="reject", init=False)
+    package_id: PackageID
+    rejection_reason: str | None
+
+
+@dataclass(slots=True, kw_only=True)
+class PickupConfirmedMsg(Msg):
+    """Truck reports that a package was loaded at its origin site."""
+
+    typ: str = field(default="pickup_confirmed", init=False)
+    package_id: PackageID
+
+
+@dataclass(slots=True, kw_only=True)
+class DeliveryConfirmedMsg(Msg):
+    """Truck reports that a single package was delivered."""
+
+    typ: str = field(default="delivery_confirmed", init=False)
+    package_id: PackageID
+    delivery_tick: int
+    on_time: bool = True
+
+
+@dataclass(slots=True, kw_only=True)
+class DeliveryBatchConfirmedMsg(Msg):
+    """Truck reports every package delivered at one site, as (package_id, on_time) pairs."""
+
+    typ: str = field(default="delivery_batch_confirmed", init=False)
+    delivery_tick: int
+    delivery_site_id: SiteID
+    packages: list[tuple[PackageID, bool]]
+
+
+def _message_type(msg_cls: type[Msg]) -> str:
+    """Return the fixed ``typ`` default declared by a typed message class."""
+    return next(str(f.default) for f in fields(msg_cls) if f.name == "typ")
+
+
+_MSG_TYPES: dict[str, type[Msg]] = {
+    _message_type(msg_cls): msg_cls
+    for msg_cls in (
+        ProposalMsg,
+        AssignmentConfirmedMsg,
+        AcceptMsg,
+        RejectMsg,
+        PickupConfirmedMsg,
+        DeliveryConfirmedMsg,
+        DeliveryBatchConfirmedMsg,
+    )
+}
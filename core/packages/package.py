@@ -1,12 +1,12 @@
 """Package data structure for delivery items."""
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from typing import Any
 
 from core.types import DeliveryUrgency, PackageID, PackageStatus, Priority, SiteID
 
 
-@dataclass
+@dataclass(slots=True)
 class Package:
     """Package data structure representing a delivery item."""
 
@@ -24,7 +24,19 @@ class Package:
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize package to dictionary."""
-        return asdict(self)
+        return {
+            "id": self.id,
+            "origin_site": self.origin_site,
+            "destination_site": self.destination_site,
+            "size": self.size,
+            "value_currency": self.value_currency,
+            "priority": self.priority,
+            "urgency": self.urgency,
+            "spawn_tick": self.spawn_tick,
+            "pickup_deadline_tick": self.pickup_deadline_tick,
+            "delivery_deadline_tick": self.delivery_deadline_tick,
+            "status": self.status,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Package":
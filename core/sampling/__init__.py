@@ -0,0 +1,5 @@
+"""Sampling primitives for stochastic simulation processes."""
+
+from core.sampling.alias import AliasTable
+
+__all__ = ["AliasTable"]
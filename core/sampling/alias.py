@@ -0,0 +1,65 @@
+"""Walker/Vose alias tables for O(1) sampling from discrete weighted distributions."""
+
+import random
+from collections.abc import Callable, Mapping
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class AliasTable(Generic[T]):
+    """Discrete distribution over weighted items, sampled in O(1).
+
+    Built once in O(k) with Vose's method; each sample then costs a single
+    uniform draw, split into a column index and a biased coin. Weights do not
+    need to be normalized. If they sum to zero, items are sampled uniformly.
+    """
+
+    __slots__ = ("items", "_prob", "_alias")
+
+    def __init__(self, weights: Mapping[T, float]) -> None:
+        """Build the alias table.
+
+        Args:
+            weights: Mapping of item to non-negative weight
+
+        Raises:
+            ValueError: If weights is empty
+        """
+        if not weights:
+            raise ValueError("AliasTable requires at least one item")
+
+        self.items: tuple[T, ...] = tuple(weights)
+        n = len(self.items)
+        total = sum(weights.values())
+        # Scale so the average column holds exactly 1.0; zero total falls back to uniform
+        scaled = [1.0] * n if total <= 0 else [weight * n / total for weight in weights.values()]
+
+        self._prob: list[float] = [1.0] * n
+        self._alias: list[int] = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self._prob[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # Leftovers are 1.0 up to rounding error and keep their defaults
+
+    def sample(self, rand: Callable[[], float] = random.random) -> T:
+        """Draw one item according to the weights.
+
+        Args:
+            rand: Uniform [0, 1) source, e.g. a ``random.Random`` instance's ``random``
+        """
+        r = rand() * len(self.items)
+        column = int(r)
+        if r - column < self._prob[column]:
+            return self.items[column]
+        return self.items[self._alias[column]]
@@ -1,20 +1,28 @@
 from __future__ import annotations
 
+import logging
+from unittest.mock import patch
+
 import pytest
 
 from agents.transports.truck import (
     BASE_FUEL_CONSUMPTION_L_PER_100KM,
     BASE_TRUCK_WEIGHT_TONNES,
     CO2_KG_PER_LITER_DIESEL,
+    FUEL_CONSUMPTION_FACTOR_PER_TONNE,
     Truck,
+    _overtime_penalty_ducats,
+    _required_rest_s,
 )
 from core.buildings.gas_station import GasStation
 from core.buildings.parking import Parking
+from core.messages import DeliveryBatchConfirmedMsg
 from core.types import AgentID, BuildingID, EdgeID, NodeID
 from world.graph.edge import Edge, Mode, RoadClass
 from world.graph.graph import Graph
 from world.graph.node import Node
 from world.routing.navigator import Navigator
+from world.sim.dto.truck_dto import TruckStateDTO, TruckWatchFieldsDTO
 from world.world import World
 
 
@@ -39,6 +47,26 @@ def _make_truck(node_id: NodeID | None) -> Truck:
     return truck
 
 
+def test_trucks_share_empty_tried_building_sets() -> None:
+    """Test that fresh trucks do not allocate their own empty tried-building sets."""
+    first = _make_truck(NodeID(1))
+    second = _make_truck(NodeID(2))
+    assert first._tried_parkings is second._tried_parkings
+    assert first._tried_gas_stations is second._tried_parkings
+
+    first._tried_parkings |= {BuildingID("parking-1")}
+    assert first._tried_parkings == {BuildingID("parking-1")}
+    assert not second._tried_parkings
+
+
+def test_truck_uses_slots() -> None:
+    """Test that trucks, including their cache fields, live in slots without a __dict__."""
+    truck = _make_truck(NodeID(1))
+    assert not hasattr(truck, "__dict__")
+    with pytest.raises(AttributeError):
+        truck.unknown_field = 1  # type: ignore[attr-defined]
+
+
 def test_truck_parking_registers_building_and_updates_state() -> None:
     node_id = NodeID(1)
     parking_id = BuildingID("parking-1")
@@ -160,17 +188,33 @@ def test_calculate_required_rest() -> None:
     # 6 hours driving → 6 hours rest
     truck.driving_time_s = 6.0 * 3600
     required = truck._calculate_required_rest()
-    assert abs(required - 6.0 * 3600) < 1.0  # Allow small floating point error
+    assert required == pytest.approx(6.0 * 3600, abs=1.0)  # Allow small floating point error
 
     # 8 hours driving → 10 hours rest
     truck.driving_time_s = 8.0 * 3600
     required = truck._calculate_required_rest()
-    assert abs(required - 10.0 * 3600) < 1.0
+    assert required == pytest.approx(10.0 * 3600, abs=1.0)
 
     # 7 hours driving → 8 hours rest (linear interpolation)
     truck.driving_time_s = 7.0 * 3600
     required = truck._calculate_required_rest()
-    assert abs(required - 8.0 * 3600) < 1.0
+    assert required == pytest.approx(8.0 * 3600, abs=1.0)
+
+
+def test_required_rest_is_exact_between_whole_minutes() -> None:
+    """Test that the rest curve is evaluated exactly, not rounded to coarse buckets."""
+    assert _required_rest_s(30.0) == 30.0
+    assert _required_rest_s(6.0 * 3600 + 30.0) == 6.0 * 3600 + 60.0
+    assert _required_rest_s(7.5 * 3600 + 1.0) == 9.0 * 3600 + 2.0
+
+
+def test_overtime_penalty_tiers() -> None:
+    """Test the tachograph fine for each overtime band, including band edges."""
+    assert _overtime_penalty_ducats(0.5) == 100.0
+    assert _overtime_penalty_ducats(1.0) == 100.0
+    assert _overtime_penalty_ducats(1.5) == 200.0
+    assert _overtime_penalty_ducats(2.0) == 200.0
+    assert _overtime_penalty_ducats(2.5) == 500.0
 
 
 def test_should_seek_parking_probability() -> None:
@@ -187,6 +231,17 @@ def test_should_seek_parking_probability() -> None:
     assert truck._should_seek_parking()
 
 
+def test_should_seek_parking_at_max_risk_waits_for_limit() -> None:
+    """Test that a maximum-risk truck only seeks parking once the driving limit is reached."""
+    truck = Truck(id=AgentID("truck-1"), kind="truck", risk_factor=1.0)
+
+    truck.driving_time_s = 8.0 * 3600 - 1.0
+    assert not truck._should_seek_parking()
+
+    truck.driving_time_s = 8.0 * 3600
+    assert truck._should_seek_parking()
+
+
 def test_apply_tachograph_penalty() -> None:
     """Test penalty amounts for different overtime durations."""
     graph = Graph()
@@ -266,6 +321,31 @@ def test_rest_management_workflow() -> None:
     assert truck.resting_time_s == 0.0
 
 
+def test_decide_rest_matches_handle_resting() -> None:
+    """Test that resting through decide advances the timer and completes like the handler."""
+    graph = Graph()
+    node = Node(id=NodeID(1), x=0.0, y=0.0)
+    node.add_building(Parking(id=BuildingID("parking-1"), capacity=5))
+    graph.add_node(node)
+    world = World(graph=graph, router=Navigator(), traffic=None, dt_s=1.0)
+
+    truck = Truck(id=AgentID("truck-1"), kind="truck", current_node=NodeID(1))
+    truck.park_in_building(world, BuildingID("parking-1"))
+    truck.is_resting = True
+    truck.is_seeking_parking = True
+    truck.required_rest_s = 10.0
+
+    for _ in range(9):
+        truck.decide(world)
+    assert truck.is_resting
+    assert truck.resting_time_s == 9.0
+
+    truck.decide(world)
+    assert not truck.is_resting
+    assert truck.resting_time_s == 0.0
+    assert not truck.is_seeking_parking
+
+
 def test_parking_full_scenario() -> None:
     """Test that truck tries alternative parking when first one is full."""
     graph = Graph()
@@ -306,7 +386,7 @@ def test_parking_full_scenario() -> None:
     )
 
     # Mark parking1 as tried (full)
-    truck._tried_parkings.add(BuildingID("parking-1"))
+    truck._tried_parkings = frozenset({BuildingID("parking-1")})
 
     # Try to find parking (should skip excluded parking1)
     parking_id, route = truck._find_closest_parking(world)
@@ -384,6 +464,132 @@ def test_serialize_diff_only_on_watch_field_changes() -> None:
     assert diff["driving_time_s"] == 3600.0  # Non-watch field included in payload
 
 
+def test_serialize_diff_watch_state_follows_dto_layout() -> None:
+    """Test that the compared watch tuple stays in TruckWatchFieldsDTO field order."""
+    truck = Truck(
+        id=AgentID("truck-1"),
+        kind="truck",
+        current_node=NodeID(1),
+        route=[NodeID(2)],
+        route_end_node=NodeID(2),
+    )
+    assert truck.serialize_diff() is not None
+    assert truck._last_serialized_watch_state is not None
+
+    watch = TruckWatchFieldsDTO(*truck._last_serialized_watch_state)
+    assert watch.current_node == NodeID(1)
+    assert watch.route == (NodeID(2),)
+    assert watch.route_end_node == NodeID(2)
+    assert watch.loaded_packages == ()
+    assert watch.current_building_id is None
+
+
+def test_serialize_diff_payload_matches_state_dto() -> None:
+    """Test that the directly built diff payload matches the TruckStateDTO schema."""
+    truck = Truck(
+        id=AgentID("truck-1"),
+        kind="truck",
+        current_node=NodeID(1),
+        route=[NodeID(2), NodeID(3)],
+        current_building_id=BuildingID("parking-1"),
+    )
+    diff = truck.serialize_diff()
+    assert diff is not None
+
+    assert TruckStateDTO.model_validate(diff).model_dump() == diff
+    assert list(diff) == list(TruckStateDTO.model_fields)
+    assert diff["route"] is not truck.route
+
+
+def test_serialize_diff_delta_encodes_after_first_payload() -> None:
+    """Test that later diffs carry the agent identity plus only the changed fields."""
+    truck = Truck(
+        id=AgentID("truck-1"),
+        kind="truck",
+        current_node=NodeID(1),
+        route=[NodeID(2)],
+    )
+    first = truck.serialize_diff()
+    assert first is not None
+    assert list(first) == list(TruckStateDTO.model_fields)
+
+    truck.current_node = NodeID(2)
+    truck.route.pop(0)
+    truck.driving_time_s = 60.0
+    diff = truck.serialize_diff()
+    assert diff == {
+        "id": AgentID("truck-1"),
+        "kind": "truck",
+        "current_node": NodeID(2),
+        "route": [],
+        "driving_time_s": 60.0,
+    }
+
+    merged = {**first, **diff}
+    assert TruckStateDTO.model_validate(merged).current_node == NodeID(2)
+
+
+def test_serialize_diff_resends_complete_state_to_resync_clients(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that complete payloads follow request_full_diff and recur every interval."""
+    monkeypatch.setattr("agents.transports.truck.FULL_DIFF_INTERVAL", 2)
+    truck = Truck(id=AgentID("truck-1"), kind="truck", current_node=NodeID(1))
+    full_keys = list(TruckStateDTO.model_fields)
+    first = truck.serialize_diff()
+    assert first is not None and list(first) == full_keys
+
+    # A delta that a client may never have received
+    truck.current_node = NodeID(2)
+    assert truck.serialize_diff() == {"id": "truck-1", "kind": "truck", "current_node": 2}
+
+    # After a resync request the unchanged state is sent again in full
+    truck.request_full_diff()
+    resync = truck.serialize_diff()
+    assert resync is not None and list(resync) == full_keys
+    assert resync["current_node"] == NodeID(2)
+    assert truck.serialize_diff() is None
+
+    # Periodic resync: two deltas, then a complete payload
+    sizes = []
+    for node in (3, 4, 5):
+        truck.current_node = NodeID(node)
+        diff = truck.serialize_diff()
+        assert diff is not None
+        sizes.append(len(diff))
+    assert sizes == [3, 3, len(full_keys)]
+
+
+def test_serialize_diff_quantizes_counters() -> None:
+    """Test that diffs round counters to display precision and skip sub-precision changes."""
+    truck = Truck(
+        id=AgentID("truck-1"),
+        kind="truck",
+        current_node=NodeID(1),
+        driving_time_s=3600.2,
+        balance_ducats=10.123,
+        current_fuel_l=123.42,
+        co2_emitted_kg=7.77,
+    )
+    first = truck.serialize_diff()
+    assert first is not None
+    assert first["driving_time_s"] == 3600.0
+    # Rounded counters keep the float wire type of serialize_full
+    assert type(first["driving_time_s"]) is float
+    assert type(first["resting_time_s"]) is float
+    assert first["balance_ducats"] == 10.12
+    assert first["current_fuel_l"] == 123.4
+    assert first["co2_emitted_kg"] == 7.8
+    # In-memory state keeps full precision
+    assert truck.current_fuel_l == 123.42
+
+    truck.current_node = NodeID(2)
+    truck.driving_time_s += 0.1
+    truck.current_fuel_l -= 0.01
+    diff = truck.serialize_diff()
+    assert diff == {"id": AgentID("truck-1"), "kind": "truck", "current_node": NodeID(2)}
+
+
 def test_serialize_diff_includes_all_fields() -> None:
     """Test that serialize_diff payload includes all fields (watch + non-watch)."""
     truck = Truck(
@@ -789,6 +995,31 @@ def test_truck_get_total_loaded_size() -> None:
     assert truck.get_total_loaded_size(world) == 30.0
 
 
+def test_truck_loaded_size_running_total() -> None:
+    """Test that sizes passed to load/unload keep the loaded total without world lookups."""
+    from core.types import PackageID
+
+    world = _create_world_with_packages()
+    truck = Truck(id=AgentID("truck-1"), kind="truck", current_node=NodeID(1))
+    assert truck.get_total_loaded_size(world) == 0.0
+
+    truck.load_package(PackageID("pkg-1"), 5.0)
+    truck.load_package(PackageID("pkg-2"), 10.0)
+    world.packages.clear()
+    assert truck.get_total_loaded_size(world) == 15.0
+
+    truck.unload_package(PackageID("pkg-1"), 5.0)
+    assert truck.get_total_loaded_size(world) == 10.0
+
+    # Without a size the total is recomputed from the world, which no longer has pkg-3
+    truck.load_package(PackageID("pkg-3"))
+    assert truck.get_total_loaded_size(world) == 0.0
+
+    truck.unload_package(PackageID("pkg-2"))
+    truck.unload_package(PackageID("pkg-3"))
+    assert truck.get_total_loaded_size(world) == 0.0
+
+
 def test_truck_can_load_package_within_capacity() -> None:
     """Test that can_load_package returns True when package fits."""
     from core.types import PackageID
@@ -934,7 +1165,40 @@ def test_truck_fuel_consumption_rate_calculation() -> None:
     # Empty truck: base consumption
     rate = truck._calculate_fuel_consumption_l_per_km(world)
     expected_rate = BASE_FUEL_CONSUMPTION_L_PER_100KM / 100.0
-    assert abs(rate - expected_rate) < 0.001
+    assert rate == pytest.approx(expected_rate, abs=0.001)
+
+
+def test_truck_fuel_consumption_rate_follows_load_changes() -> None:
+    """Test that the cached fuel rate is recomputed when the loaded size changes."""
+    from core.types import PackageID
+
+    world = _create_world_with_packages()
+    truck = Truck(id=AgentID("truck-1"), kind="truck", current_node=NodeID(1))
+
+    empty_rate = truck._calculate_fuel_consumption_l_per_km(world)
+    assert truck._calculate_fuel_consumption_l_per_km(world) == empty_rate
+
+    truck.load_package(PackageID("pkg-2"), 10.0)  # 1 tonne of cargo
+    loaded_rate = truck._calculate_fuel_consumption_l_per_km(world)
+    assert loaded_rate - empty_rate == pytest.approx(
+        FUEL_CONSUMPTION_FACTOR_PER_TONNE / 100.0, abs=1e-9
+    )
+
+    truck.unload_package(PackageID("pkg-2"), 10.0)
+    assert truck._calculate_fuel_consumption_l_per_km(world) == empty_rate
+
+
+def _drive(truck: Truck, world: World, distance_m: float) -> None:
+    """Move the truck one tick of ``distance_m`` along a road too long to finish."""
+    if world.graph.get_edge(EdgeID(99)) is None:
+        world.graph.add_node(Node(id=NodeID(99), x=0.0, y=0.0))
+        world.graph.add_edge(
+            Edge(EdgeID(99), NodeID(1), NodeID(99), 1e12, Mode.ROAD, RoadClass.G, 2, 36.0, None)
+        )
+    truck.current_edge = EdgeID(99)
+    truck.current_speed_kph = 36.0  # 10 m/s
+    world.dt_s = distance_m / 10.0
+    truck._move_along_edge(world)
 
 
 def test_truck_consumes_fuel_and_emits_co2() -> None:
@@ -957,7 +1221,7 @@ def test_truck_consumes_fuel_and_emits_co2() -> None:
 
     # Simulate traveling 10km
     distance_m = 10000.0
-    truck._consume_fuel_and_emit_co2(world, distance_m)
+    _drive(truck, world, distance_m)
 
     # Calculate expected values
     consumption_rate = BASE_FUEL_CONSUMPTION_L_PER_100KM / 100.0  # L/km
@@ -967,8 +1231,66 @@ def test_truck_consumes_fuel_and_emits_co2() -> None:
     actual_fuel_consumed = initial_fuel - truck.current_fuel_l
     actual_co2 = truck.co2_emitted_kg - initial_co2
 
-    assert abs(actual_fuel_consumed - expected_fuel_consumed) < 0.01
-    assert abs(actual_co2 - expected_co2) < 0.01
+    assert truck.edge_progress_m == pytest.approx(distance_m)
+    assert truck.driving_time_s == pytest.approx(1000.0)
+    assert actual_fuel_consumed == pytest.approx(expected_fuel_consumed, abs=0.01)
+    assert actual_co2 == pytest.approx(expected_co2, abs=0.01)
+
+
+def test_modify_agent_normalizes_loaded_packages() -> None:
+    """Test that a JSON list assigned through modify_agent keeps the truck loadable."""
+    from core.types import PackageID
+
+    world = _create_world_with_packages()
+    truck = Truck(id=AgentID("truck-1"), kind="truck", current_node=NodeID(1))
+    world.agents[truck.id] = truck  # type: ignore[assignment]
+    truck.load_package(PackageID("pkg-1"), 5.0)
+    assert truck.get_total_loaded_size(world) == 5.0
+
+    world.modify_agent(truck.id, {"loaded_packages": ["pkg-2"]})
+
+    assert truck.loaded_packages == {PackageID("pkg-2"): None}
+    assert truck.get_total_loaded_size(world) == 10.0
+    assert truck._get_loaded_snapshot() == (PackageID("pkg-2"),)
+    truck.load_package(PackageID("pkg-3"))
+    assert truck.get_total_loaded_size(world) == 25.0
+
+
+def test_truck_fuel_consumption_uses_current_load_and_stops_at_empty() -> None:
+    """Test that fuel use follows load changes made after the rate was cached."""
+    from core.types import PackageID
+
+    world = _create_world_with_packages()
+    truck = Truck(id=AgentID("truck-1"), kind="truck", current_node=NodeID(1), current_fuel_l=100.0)
+
+    _drive(truck, world, 1000.0)
+    empty_used = 100.0 - truck.current_fuel_l
+
+    truck.load_package(PackageID("pkg-2"))  # size looked up from the world
+    before = truck.current_fuel_l
+    _drive(truck, world, 1000.0)
+    assert before - truck.current_fuel_l > empty_used
+
+    _drive(truck, world, 10_000_000.0)
+    assert truck.current_fuel_l == 0.0
+
+
+def test_truck_should_seek_gas_station_starts_at_risk_threshold() -> None:
+    """Test that the seek probability becomes non-zero exactly below the risk threshold."""
+    truck = Truck(
+        id=AgentID("truck-1"),
+        kind="truck",
+        fuel_tank_capacity_l=500.0,
+        risk_factor=0.5,
+    )
+
+    # Threshold at risk 0.5 is 22.5% of the tank (112.5 L)
+    with patch("agents.transports.truck.random.random", return_value=0.0):
+        truck.current_fuel_l = 112.6
+        assert not truck._should_seek_gas_station()
+
+        truck.current_fuel_l = 112.4
+        assert truck._should_seek_gas_station()
 
 
 def test_truck_should_seek_gas_station_at_low_fuel() -> None:
@@ -1305,3 +1627,279 @@ def test_truck_estimate_delivery_times_handles_no_route() -> None:
     # Should return large finite values instead of crashing
     assert est_pickup == world.tick + 99999
     assert est_delivery == world.tick + 99999
+
+
+def test_truck_unloading_batches_delivery_confirmations() -> None:
+    """Test that unloading at a site sends one batched confirmation to the broker."""
+    from core.buildings.site import Site
+    from core.delivery.task import DeliveryTask
+    from core.packages.package import Package
+    from core.types import (
+        DeliveryUrgency,
+        PackageID,
+        PackageStatus,
+        Priority,
+        SiteID,
+        TaskStatus,
+        TaskType,
+    )
+
+    graph = Graph()
+    node = Node(id=NodeID(1), x=0.0, y=0.0)
+    site = Site(id=SiteID("site-1"), name="Site 1", activity_rate=1.0)
+    node.add_building(site)
+    graph.add_node(node)
+    world = World(graph=graph, router=None, traffic=None, dt_s=1.0)
+
+    truck = _make_truck(NodeID(1))
+    truck.broker_id = AgentID("broker-1")
+    pkg_ids = [PackageID("pkg-1"), PackageID("pkg-2")]
+    for pkg_id, deadline in zip(pkg_ids, (100, -1), strict=True):
+        world.add_package(
+            Package(
+                id=pkg_id,
+                origin_site=SiteID("site-0"),
+                destination_site=SiteID("site-1"),
+                size=1.0,
+                value_currency=100.0,
+                priority=Priority.MEDIUM,
+                urgency=DeliveryUrgency.STANDARD,
+                spawn_tick=0,
+                pickup_deadline_tick=100,
+                delivery_deadline_tick=deadline,
+                status=PackageStatus.IN_TRANSIT,
+            )
+        )
+        truck.load_package(pkg_id)
+    task = DeliveryTask(
+        site_id=SiteID("site-1"),
+        task_type=TaskType.DELIVERY,
+        package_ids=list(pkg_ids),
+        status=TaskStatus.IN_PROGRESS,
+    )
+    truck.delivery_queue.append(task)
+    truck.current_delivery_task = task
+
+    truck._complete_unloading(world)
+
+    assert len(truck.outbox) == 1
+    msg = truck.outbox[0]
+    assert msg.typ == "delivery_batch_confirmed"
+    assert msg.dst == AgentID("broker-1")
+    assert isinstance(msg, DeliveryBatchConfirmedMsg)
+    assert msg.delivery_site_id == "site-1"
+    assert msg.packages == [(PackageID("pkg-1"), True), (PackageID("pkg-2"), False)]
+    assert not truck.loaded_packages
+    assert task.status == TaskStatus.COMPLETED
+    assert truck.current_delivery_task is None
+
+
+def test_find_closest_parking_caches_until_graph_changes() -> None:
+    """Test that parking search results are reused until the graph is modified."""
+    graph = Graph()
+    n1 = Node(id=NodeID(1), x=0.0, y=0.0)
+    n2 = Node(id=NodeID(2), x=1.0, y=0.0)
+    n2.add_building(Parking(id=BuildingID("parking-2"), capacity=5))
+    graph.add_node(n1)
+    graph.add_node(n2)
+    graph.add_edge(
+        Edge(
+            id=EdgeID(1),
+            from_node=NodeID(1),
+            to_node=NodeID(2),
+            length_m=1000.0,
+            mode=Mode.ROAD,
+            road_class=RoadClass.G,
+            lanes=2,
+            max_speed_kph=50.0,
+            weight_limit_kg=None,
+        )
+    )
+    world = World(graph=graph, router=Navigator(), traffic=None, dt_s=1.0)
+    truck = _make_truck(NodeID(1))
+
+    parking_id, route = truck._find_closest_parking(world)
+    assert parking_id == BuildingID("parking-2")
+    assert route == [NodeID(1), NodeID(2)]
+    assert len(world.get_closest_parking_cache()) == 1
+
+    # Mutating the returned route must not corrupt the cached entry
+    assert route is not None
+    route.pop()
+    assert truck._find_closest_parking(world) == (BuildingID("parking-2"), [NodeID(1), NodeID(2)])
+
+    # A closer parking added in place bumps the graph version and is picked up
+    n1.add_building(Parking(id=BuildingID("parking-1"), capacity=5))
+    assert truck._find_closest_parking(world) == (BuildingID("parking-1"), [NodeID(1)])
+
+
+def test_closest_parking_cache_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the shared parking cache stays bounded and evicts the stalest search."""
+    monkeypatch.setattr("world.world.CLOSEST_PARKING_CACHE_SIZE", 2)
+    world = World(graph=Graph(), router=Navigator(), traffic=None, dt_s=1.0)
+    keys = [(NodeID(i), None, 80.0, frozenset[BuildingID]()) for i in range(3)]
+
+    world.store_closest_parking(keys[0], (None, None))
+    world.store_closest_parking(keys[1], (BuildingID("parking-1"), (NodeID(1),)))
+    # Reading the oldest entry refreshes it, so the next insert evicts keys[1] instead
+    assert world.lookup_closest_parking(keys[0]) == (None, None)
+    world.store_closest_parking(keys[2], (None, None))
+
+    assert len(world.get_closest_parking_cache()) == 2
+    assert world.lookup_closest_parking(keys[1]) is None
+    assert world.lookup_closest_parking(keys[0]) == (None, None)
+
+
+def test_find_closest_gas_station_ignores_cached_parking_results() -> None:
+    """Test that a cached parking search is never returned as a gas station."""
+    graph = Graph()
+    n1 = Node(id=NodeID(1), x=0.0, y=0.0)
+    n2 = Node(id=NodeID(2), x=1.0, y=0.0)
+    n2.add_building(Parking(id=BuildingID("parking-2"), capacity=5))
+    n2.add_building(GasStation(id=BuildingID("gas-2"), capacity=2, cost_factor=1.0))
+    graph.add_node(n1)
+    graph.add_node(n2)
+    graph.add_edge(
+        Edge(
+            id=EdgeID(1),
+            from_node=NodeID(1),
+            to_node=NodeID(2),
+            length_m=1000.0,
+            mode=Mode.ROAD,
+            road_class=RoadClass.G,
+            lanes=2,
+            max_speed_kph=50.0,
+            weight_limit_kg=None,
+        )
+    )
+    world = World(graph=graph, router=Navigator(), traffic=None, dt_s=1.0)
+    truck = _make_truck(NodeID(1))
+
+    assert truck._find_closest_parking(world)[0] == BuildingID("parking-2")
+    assert truck._find_closest_gas_station(world)[0] == BuildingID("gas-2")
+
+
+def test_find_closest_gas_station_skips_search_without_gas_stations() -> None:
+    """Test that no graph search runs when the map has no gas stations at all."""
+    graph = Graph()
+    graph.add_node(Node(id=NodeID(1), x=0.0, y=0.0))
+    world = World(graph=graph, router=Navigator(), traffic=None, dt_s=1.0)
+    truck = _make_truck(NodeID(1))
+
+    with patch.object(Navigator, "find_closest_node") as search:
+        assert truck._find_closest_gas_station(world) == (None, None)
+    search.assert_not_called()
+
+
+def test_find_closest_gas_station_reuses_search_until_inputs_change() -> None:
+    """Test that a truck repeating its gas station search at one node skips the graph search."""
+    graph = Graph()
+    n1 = Node(id=NodeID(1), x=0.0, y=0.0)
+    n2 = Node(id=NodeID(2), x=1.0, y=0.0)
+    n2.add_building(GasStation(id=BuildingID("gas-2"), capacity=2, cost_factor=1.0))
+    graph.add_node(n1)
+    graph.add_node(n2)
+    graph.add_edge(
+        Edge(EdgeID(1), NodeID(1), NodeID(2), 1000.0, Mode.ROAD, RoadClass.G, 2, 50.0, None)
+    )
+    world = World(graph=graph, router=Navigator(), traffic=None, dt_s=1.0)
+    truck = _make_truck(NodeID(1))
+
+    with patch.object(
+        Navigator, "find_closest_node", wraps=world.router.find_closest_node
+    ) as search:
+        first = truck._find_closest_gas_station(world)
+        assert first == (BuildingID("gas-2"), [NodeID(1), NodeID(2)])
+        # Callers may consume the returned route
+        first[1].pop()
+        assert truck._find_closest_gas_station(world) == (
+            BuildingID("gas-2"),
+            [NodeID(1), NodeID(2)],
+        )
+        assert search.call_count == 1
+
+        truck._tried_gas_stations |= {BuildingID("gas-2")}
+        assert truck._find_closest_gas_station(world) == (None, None)
+        assert search.call_count == 2
+
+        truck.current_node = NodeID(2)
+        truck._find_closest_gas_station(world)
+        assert search.call_count == 3
+
+
+def test_find_closest_gas_station_skips_search_beyond_fuel_range() -> None:
+    """Test that no graph search runs when every gas station is out of straight-line range."""
+    graph = Graph()
+    graph.add_node(Node(id=NodeID(1), x=0.0, y=0.0))
+    n2 = Node(id=NodeID(2), x=5000.0, y=0.0)
+    n2.add_building(GasStation(id=BuildingID("gas-2"), capacity=2, cost_factor=1.0))
+    graph.add_node(n2)
+    graph.add_edge(
+        Edge(EdgeID(1), NodeID(1), NodeID(2), 5000.0, Mode.ROAD, RoadClass.G, 2, 50.0, None)
+    )
+    world = World(graph=graph, router=Navigator(), traffic=None, dt_s=1.0)
+    truck = _make_truck(NodeID(1))
+    truck.current_fuel_l = 0.1
+
+    with patch.object(Navigator, "find_closest_node") as search:
+        assert truck._find_closest_gas_station(world) == (None, None)
+        search.assert_not_called()
+
+
+def test_find_closest_gas_station_searches_when_road_is_shorter_than_coordinates() -> None:
+    """Test that the straight-line skip is not applied when a road undercuts its endpoints."""
+    graph = Graph()
+    graph.add_node(Node(id=NodeID(1), x=0.0, y=0.0))
+    n2 = Node(id=NodeID(2), x=5000.0, y=0.0)
+    n2.add_building(GasStation(id=BuildingID("gas-2"), capacity=2, cost_factor=1.0))
+    graph.add_node(n2)
+    # Coordinates 5 km apart, joined by a 100 m road (e.g. coordinates not in meters)
+    graph.add_edge(
+        Edge(EdgeID(1), NodeID(1), NodeID(2), 100.0, Mode.ROAD, RoadClass.G, 2, 50.0, None)
+    )
+    assert not graph.roads_cover_straight_line()
+    world = World(graph=graph, router=Navigator(), traffic=None, dt_s=1.0)
+    truck = _make_truck(NodeID(1))
+    truck.current_fuel_l = 0.1
+
+    assert truck._find_closest_gas_station(world) == (BuildingID("gas-2"), [NodeID(1), NodeID(2)])
+
+
+def test_route_snapshot_is_reused_until_route_changes() -> None:
+    """Test that serialization reuses the route tuple until the route is modified."""
+    truck = Truck(
+        id=AgentID("truck-1"),
+        kind="truck",
+        current_node=NodeID(1),
+        route=[NodeID(2), NodeID(3)],
+    )
+
+    first = truck._get_route_snapshot()
+    assert first == (NodeID(2), NodeID(3))
+    assert truck._get_route_snapshot() is first
+
+    truck.route.pop(0)
+    assert truck._get_route_snapshot() == (NodeID(3),)
+
+    truck.route = [NodeID(5)]
+    assert truck._get_route_snapshot() == (NodeID(5),)
+
+
+def test_world_step_logs_per_agent_progress_only_at_debug_level(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that per-agent step messages are emitted at DEBUG and skipped otherwise."""
+    graph = Graph()
+    graph.add_node(Node(id=NodeID(1), x=0.0, y=0.0))
+    world = World(graph=graph, router=Navigator(), traffic=None, dt_s=1.0)
+    world.add_agent(AgentID("truck-1"), Truck(id=AgentID("truck-1"), kind="truck"))
+
+    with caplog.at_level(logging.INFO, logger="world.world"):
+        world.step()
+    assert not any("(truck-1) deciding" in r.getMessage() for r in caplog.records)
+
+    with caplog.at_level(logging.DEBUG, logger="world.world"):
+        world.step()
+    assert any("(truck-1) deciding" in r.getMessage() for r in caplog.records)
@@ -0,0 +1,45 @@
+"""Tests for the AliasTable discrete sampler."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from core.sampling.alias import AliasTable
+from core.types import Priority
+
+
+class TestAliasTable:
+    """Tests for AliasTable construction and sampling."""
+
+    def test_empty_weights_raises(self) -> None:
+        """Test that an empty weight mapping is rejected."""
+        with pytest.raises(ValueError, match="at least one item"):
+            AliasTable({})
+
+    def test_single_item_always_sampled(self) -> None:
+        """Test that a single-item table always returns that item."""
+        table = AliasTable({Priority.LOW: 2.5})
+        assert all(table.sample() == Priority.LOW for _ in range(100))
+
+    def test_zero_weight_items_never_sampled(self) -> None:
+        """Test that items with zero weight are never drawn."""
+        table = AliasTable({"a": 1.0, "b": 0.0, "c": 3.0})
+        assert "b" not in {table.sample() for _ in range(1000)}
+
+    def test_all_zero_weights_sample_uniformly(self) -> None:
+        """Test that all-zero weights fall back to a uniform distribution."""
+        table = AliasTable({"a": 0.0, "b": 0.0})
+        assert {table.sample() for _ in range(200)} == {"a", "b"}
+
+    def test_sampling_frequencies_match_weights(self) -> None:
+        """Test that empirical frequencies follow the (unnormalized) weights."""
+        random.seed(1234)
+        weights = {"low": 0.5, "medium": 0.3, "high": 0.15, "urgent": 0.05}
+        table = AliasTable(weights)
+
+        num_samples = 20000
+        counts = Counter(table.sample() for _ in range(num_samples))
+
+        for item, weight in weights.items():
+            assert counts[item] / num_samples == pytest.approx(weight, abs=0.02)
@@ -1,235 +1,238 @@
 """Tests for GasStation building class."""
 
+from collections.abc import Callable
+
 import pytest
 
 from core.buildings.base import Building
 from core.buildings.gas_station import GasStation
 from core.types import AgentID, BuildingID
 
+GasStationFactory = Callable[..., GasStation]
+
+
+@pytest.fixture
+def make_gas_station() -> GasStationFactory:
+    """Return a factory building gas station "gas-1" (capacity 2, cost factor 1.0 by default)."""
+
+    def _make(capacity: int = 2, cost_factor: float = 1.0) -> GasStation:
+        return GasStation(id=BuildingID("gas-1"), capacity=capacity, cost_factor=cost_factor)
+
+    return _make
+
 
 class TestGasStationCreation:
     """Tests for GasStation construction and validation."""
 
-    def test_create_valid_gas_station(self) -> None:
+    def test_create_valid_gas_station(self, make_gas_station: GasStationFactory) -> None:
         """Test creating a valid gas station."""
-        gas_station = GasStation(
-            id=BuildingID("gas-1"),
-            capacity=4,
-            cost_factor=1.15,
-        )
+        gas_station = make_gas_station(capacity=4, cost_factor=1.15)
         assert gas_station.id == BuildingID("gas-1")
         assert gas_station.capacity == 4
         assert gas_station.cost_factor == 1.15
         assert gas_station.TYPE == "gas_station"
 
-    def test_create_with_zero_capacity_raises(self) -> None:
-        """Test that zero capacity raises ValueError."""
-        with pytest.raises(ValueError, match="capacity must be positive"):
+    def test_gas_station_uses_slots(self, make_gas_station: GasStationFactory) -> None:
+        """Test that gas stations store fields in slots instead of a per-instance dict."""
+        gas_station = make_gas_station(capacity=4)
+        assert not hasattr(gas_station, "__dict__")
+        assert gas_station.is_dirty() is False
+
+    @pytest.mark.parametrize(
+        ("capacity", "cost_factor", "match"),
+        [
+            (0, 1.0, "capacity must be positive"),
+            (-5, 1.0, "capacity must be positive"),
+            (4, 0.0, "cost_factor must be positive"),
+            (4, -0.5, "cost_factor must be positive"),
+        ],
+    )
+    def test_create_with_invalid_values_raises(
+        self, capacity: int, cost_factor: float, match: str
+    ) -> None:
+        """Test that non-positive capacity or cost_factor raises ValueError."""
+        with pytest.raises(ValueError, match=match):
             GasStation(
                 id=BuildingID("gas-1"),
-                capacity=0,
-                cost_factor=1.0,
-            )
-
-    def test_create_with_negative_capacity_raises(self) -> None:
-        """Test that negative capacity raises ValueError."""
-        with pytest.raises(ValueError, match="capacity must be positive"):
-            GasStation(
-                id=BuildingID("gas-1"),
-                capacity=-5,
-                cost_factor=1.0,
-            )
-
-    def test_create_with_zero_cost_factor_raises(self) -> None:
-        """Test that zero cost_factor raises ValueError."""
-        with pytest.raises(ValueError, match="cost_factor must be positive"):
-            GasStation(
-                id=BuildingID("gas-1"),
-                capacity=4,
-                cost_factor=0.0,
-            )
-
-    def test_create_with_negative_cost_factor_raises(self) -> None:
-        """Test that negative cost_factor raises ValueError."""
-        with pytest.raises(ValueError, match="cost_factor must be positive"):
-            GasStation(
-                id=BuildingID("gas-1"),
-                capacity=4,
-                cost_factor=-0.5,
+                capacity=capacity,
+                cost_factor=cost_factor,
             )
 
 
 class TestGasStationPricing:
     """Tests for GasStation fuel price calculation."""
 
-    def test_get_fuel_price_base_factor(self) -> None:
-        """Test price calculation with cost_factor of 1.0."""
-        gas_station = GasStation(
-            id=BuildingID("gas-1"),
-            capacity=4,
-            cost_factor=1.0,
-        )
-        assert gas_station.get_fuel_price(5.0) == 5.0
-        assert gas_station.get_fuel_price(10.0) == 10.0
-
-    def test_get_fuel_price_premium(self) -> None:
-        """Test price calculation with premium cost_factor."""
-        gas_station = GasStation(
-            id=BuildingID("gas-1"),
-            capacity=4,
-            cost_factor=1.2,  # 20% premium
-        )
-        assert abs(gas_station.get_fuel_price(5.0) - 6.0) < 0.001
-        assert abs(gas_station.get_fuel_price(10.0) - 12.0) < 0.001
-
-    def test_get_fuel_price_discount(self) -> None:
-        """Test price calculation with discount cost_factor."""
-        gas_station = GasStation(
-            id=BuildingID("gas-1"),
-            capacity=4,
-            cost_factor=0.8,  # 20% discount
-        )
-        assert abs(gas_station.get_fuel_price(5.0) - 4.0) < 0.001
-        assert abs(gas_station.get_fuel_price(10.0) - 8.0) < 0.001
+    @pytest.mark.parametrize(
+        ("cost_factor", "global_price", "expected"),
+        [
+            (1.0, 5.0, 5.0),
+            (1.0, 10.0, 10.0),
+            (1.2, 5.0, 6.0),  # 20% premium
+            (1.2, 10.0, 12.0),
+            (0.8, 5.0, 4.0),  # 20% discount
+            (0.8, 10.0, 8.0),
+        ],
+    )
+    def test_get_fuel_price(
+        self,
+        make_gas_station: GasStationFactory,
+        cost_factor: float,
+        global_price: float,
+        expected: float,
+    ) -> None:
+        """Test that the station price is the global price scaled by cost_factor."""
+        gas_station = make_gas_station(capacity=4, cost_factor=cost_factor)
+        assert gas_station.get_fuel_price(global_price) == pytest.approx(expected, abs=1e-3)
 
 
 class TestGasStationOccupancy:
     """Tests for GasStation occupancy management."""
 
-    def test_has_space_empty(self) -> None:
+    def test_has_space_empty(self, make_gas_station: GasStationFactory) -> None:
         """Test has_space on empty gas station."""
-        gas_station = GasStation(
-            id=BuildingID("gas-1"),
-            capacity=2,
-            cost_factor=1.0,
-        )
+        gas_station = make_gas_station()
         assert gas_station.has_space() is True
 
-    def test_has_space_partial(self) -> None:
+    def test_has_space_partial(self, make_gas_station: GasStationFactory) -> None:
         """Test has_space with partial occupancy."""
-        gas_station = GasStation(
-            id=BuildingID("gas-1"),
-            capacity=2,
-            cost_factor=1.0,
-        )
+        gas_station = make_gas_station()
         gas_station.enter(AgentID("truck-1"))
         assert gas_station.has_space() is True
 
-    def test_has_space_full(self) -> None:
+    def test_has_space_full(self, make_gas_station: GasStationFactory) -> None:
         """Test has_space when at capacity."""
-        gas_station = GasStation(
-            id=BuildingID("gas-1"),
-            capacity=2,
-            cost_factor=1.0,
-        )
+        gas_station = make_gas_station()
         gas_station.enter(AgentID("truck-1"))
         gas_station.enter(AgentID("truck-2"))
         assert gas_station.has_space() is False
 
-    def test_enter_agent(self) -> None:
+    def test_enter_agent(self, make_gas_station: GasStationFactory) -> None:
         """Test entering an agent."""
-        gas_station = GasStation(
-            id=BuildingID("gas-1"),
-            capacity=2,
-            cost_factor=1.0,
-        )
+        gas_station = make_gas_station()
         gas_station.enter(AgentID("truck-1"))
         assert AgentID("truck-1") in gas_station.current_agents
 
-    def test_enter_duplicate_raises(self) -> None:
-        """Test that entering same agent twice raises ValueError."""
-        gas_station = GasStation(
-            id=BuildingID("gas-1"),
-            capacity=2,
-            cost_factor=1.0,
-        )
-        gas_station.enter(AgentID("truck-1"))
-        with pytest.raises(ValueError, match="already in"):
-            gas_station.enter(AgentID("truck-1"))
-
-    def test_enter_at_capacity_raises(self) -> None:
-        """Test that entering when at capacity raises ValueError."""
-        gas_station = GasStation(
-            id=BuildingID("gas-1"),
-            capacity=1,
-            cost_factor=1.0,
-        )
-        gas_station.enter(AgentID("truck-1"))
-        with pytest.raises(ValueError, match="at full capacity"):
-            gas_station.enter(AgentID("truck-2"))
-
-    def test_leave_agent(self) -> None:
+    def test_leave_agent(self, make_gas_station: GasStationFactory) -> None:
         """Test leaving an agent."""
-        gas_station = GasStation(
-            id=BuildingID("gas-1"),
-            capacity=2,
-            cost_factor=1.0,
-        )
+        gas_station = make_gas_station()
         gas_station.enter(AgentID("truck-1"))
         gas_station.leave(AgentID("truck-1"))
         assert AgentID("truck-1") not in gas_station.current_agents
 
-    def test_leave_nonexistent_raises(self) -> None:
-        """Test that leaving nonexistent agent raises ValueError."""
-        gas_station = GasStation(
-            id=BuildingID("gas-1"),
-            capacity=2,
-            cost_factor=1.0,
-        )
-        with pytest.raises(ValueError, match="not in"):
-            gas_station.leave(AgentID("truck-1"))
-
-    def test_assign_occupants(self) -> None:
+    def test_assign_occupants(self, make_gas_station: GasStationFactory) -> None:
         """Test assigning occupants."""
-        gas_station = GasStation(
-            id=BuildingID("gas-1"),
-            capacity=3,
-            cost_factor=1.0,
-        )
+        gas_station = make_gas_station(capacity=3)
         gas_station.assign_occupants([AgentID("truck-1"), AgentID("truck-2")])
         assert AgentID("truck-1") in gas_station.current_agents
         assert AgentID("truck-2") in gas_station.current_agents
         assert len(gas_station.current_agents) == 2
 
-    def test_assign_occupants_exceeds_capacity_raises(self) -> None:
-        """Test that assigning more than capacity raises ValueError."""
-        gas_station = GasStation(
-            id=BuildingID("gas-1"),
-            capacity=2,
-            cost_factor=1.0,
-        )
-        with pytest.raises(ValueError, match="exceeds.*capacity"):
-            gas_station.assign_occupants(
-                [AgentID("truck-1"), AgentID("truck-2"), AgentID("truck-3")]
-            )
+    @pytest.mark.parametrize(
+        ("capacity", "occupants", "action", "match"),
+        [
+            pytest.param(
+                2,
+                ["truck-1"],
+                lambda gas_station: gas_station.enter(AgentID("truck-1")),
+                "already in",
+                id="enter_duplicate",
+            ),
+            pytest.param(
+                1,
+                ["truck-1"],
+                lambda gas_station: gas_station.enter(AgentID("truck-2")),
+                "at full capacity",
+                id="enter_at_capacity",
+            ),
+            pytest.param(
+                2,
+                [],
+                lambda gas_station: gas_station.leave(AgentID("truck-1")),
+                "not in",
+                id="leave_nonexistent",
+            ),
+            pytest.param(
+                2,
+                [],
+                lambda gas_station: gas_station.assign_occupants(
+                    [AgentID("truck-1"), AgentID("truck-2"), AgentID("truck-3")]
+                ),
+                "exceeds.*capacity",
+                id="assign_exceeds_capacity",
+            ),
+        ],
+    )
+    def test_invalid_occupancy_change_raises(
+        self,
+        make_gas_station: GasStationFactory,
+        capacity: int,
+        occupants: list[str],
+        action: Callable[[GasStation], object],
+        match: str,
+    ) -> None:
+        """Test that occupancy changes breaking the station's invariants raise ValueError."""
+        gas_station = make_gas_station(capacity=capacity)
+        for agent_id in occupants:
+            gas_station.enter(AgentID(agent_id))
+        with pytest.raises(ValueError, match=match):
+            action(gas_station)
 
 
 class TestGasStationSerialization:
     """Tests for GasStation serialization."""
 
-    def test_to_dict(self) -> None:
-        """Test serialization to dictionary."""
-        gas_station = GasStation(
-            id=BuildingID("gas-1"),
-            capacity=4,
-            cost_factor=1.15,
-        )
-        gas_station.enter(AgentID("truck-1"))
+    @pytest.mark.parametrize(
+        ("capacity", "cost_factor", "agents"),
+        [
+            (4, 1.15, ["truck-1"]),
+            (4, 1.0, []),
+            (2, 0.5, ["truck-b", "truck-a"]),
+        ],
+    )
+    def test_roundtrip_serialization(
+        self,
+        make_gas_station: GasStationFactory,
+        capacity: int,
+        cost_factor: float,
+        agents: list[str],
+    ) -> None:
+        """Test that to_dict emits the public fields and from_dict restores them."""
+        gas_station = make_gas_station(capacity=capacity, cost_factor=cost_factor)
+        for agent_id in agents:
+            gas_station.enter(AgentID(agent_id))
 
         data = gas_station.to_dict()
-        assert data["id"] == "gas-1"
-        assert data["type"] == "gas_station"
-        assert data["capacity"] == 4
-        assert data["cost_factor"] == 1.15
-        assert data["current_agents"] == ["truck-1"]
+        assert data == {
+            "id": "gas-1",
+            "type": "gas_station",
+            "capacity": capacity,
+            "current_agents": sorted(agents),
+            "cost_factor": cost_factor,
+            "balance_ducats": 0.0,
+        }
+
+        restored = GasStation.from_dict(data)
+        assert restored.current_agents == gas_station.current_agents
+        assert restored.to_dict() == data
+
+    def test_to_dict_skips_internal_fields(self, make_gas_station: GasStationFactory) -> None:
+        """Test that only public fields are serialized, even after dirty tracking ran."""
+        gas_station = make_gas_station(capacity=4)
+        gas_station.enter(AgentID("truck-1"))
+        gas_station.serialize_diff()
+
+        assert set(gas_station.to_dict()) == {
+            "id",
+            "type",
+            "capacity",
+            "current_agents",
+            "cost_factor",
+            "balance_ducats",
+        }
 
-    def test_to_dict_sorted_agents(self) -> None:
+    def test_to_dict_sorted_agents(self, make_gas_station: GasStationFactory) -> None:
         """Test that current_agents are sorted in serialization."""
-        gas_station = GasStation(
-            id=BuildingID("gas-1"),
-            capacity=4,
-            cost_factor=1.0,
-        )
+        gas_station = make_gas_station(capacity=4)
         gas_station.enter(AgentID("truck-c"))
         gas_station.enter(AgentID("truck-a"))
         gas_station.enter(AgentID("truck-b"))
@@ -237,38 +240,30 @@ class TestGasStationSerialization:
         data = gas_station.to_dict()
         assert data["current_agents"] == ["truck-a", "truck-b", "truck-c"]
 
-    def test_from_dict(self) -> None:
-        """Test deserialization from dictionary."""
-        data = {
-            "id": "gas-1",
-            "type": "gas_station",
-            "capacity": 4,
-            "cost_factor": 1.15,
-            "current_agents": ["truck-1", "truck-2"],
-        }
-        gas_station = GasStation.from_dict(data)
-        assert gas_station.id == BuildingID("gas-1")
-        assert gas_station.capacity == 4
-        assert gas_station.cost_factor == 1.15
-        assert AgentID("truck-1") in gas_station.current_agents
-        assert AgentID("truck-2") in gas_station.current_agents
+    def test_to_dict_reflects_occupancy_changes(self, make_gas_station: GasStationFactory) -> None:
+        """Test that the cached occupant order is refreshed after enter/leave."""
+        gas_station = make_gas_station(capacity=4)
+        gas_station.enter(AgentID("truck-b"))
+        assert gas_station.to_dict()["current_agents"] == ["truck-b"]
 
-    def test_roundtrip_serialization(self) -> None:
-        """Test roundtrip serialization."""
-        original = GasStation(
-            id=BuildingID("gas-1"),
-            capacity=4,
-            cost_factor=1.15,
-        )
-        original.enter(AgentID("truck-1"))
+        gas_station.enter(AgentID("truck-a"))
+        assert gas_station.to_dict()["current_agents"] == ["truck-a", "truck-b"]
 
-        data = original.to_dict()
-        restored = GasStation.from_dict(data)
+        gas_station.leave(AgentID("truck-b"))
+        assert gas_station.to_dict()["current_agents"] == ["truck-a"]
 
-        assert restored.id == original.id
-        assert restored.capacity == original.capacity
-        assert restored.cost_factor == original.cost_factor
-        assert restored.current_agents == original.current_agents
+    def test_serialize_full_reuses_cached_state_when_clean(
+        self, make_gas_station: GasStationFactory
+    ) -> None:
+        """Test that serialize_full memoizes state until the building is marked dirty."""
+        gas_station = make_gas_station(capacity=4)
+        first = gas_station.serialize_full()
+        assert gas_station.serialize_full() is first
+
+        gas_station.enter(AgentID("truck-1"))
+        updated = gas_station.serialize_full()
+        assert updated is not first
+        assert updated["current_agents"] == ["truck-1"]
 
     def test_building_factory_creates_gas_station(self) -> None:
         """Test that Building.from_dict creates GasStation for gas_station type."""
@@ -283,3 +278,4 @@ class TestGasStationSerialization:
         assert isinstance(building, GasStation)
         assert building.id == BuildingID("gas-1")
         assert building.cost_factor == 1.0
+        assert building.balance_ducats == 0.0
@@ -1,21 +1,21 @@
 """Tests for core ID types."""
 
-from core.types import AgentID, EdgeID, LegID
-
+from collections.abc import Callable
+from typing import Any
 
-def test_agent_id_creation() -> None:
-    """Test AgentID creation."""
-    agent_id = AgentID("agent_1")
-    assert agent_id == "agent_1"
+import pytest
 
-
-def test_edge_id_creation() -> None:
-    """Test EdgeID creation."""
-    edge_id = EdgeID(42)
-    assert edge_id == 42
+from core.types import AgentID, EdgeID, LegID
 
 
-def test_leg_id_creation() -> None:
-    """Test LegID creation."""
-    leg_id = LegID("leg_1")
-    assert leg_id == "leg_1"
+@pytest.mark.parametrize(
+    ("ctor", "value"),
+    [
+        pytest.param(AgentID, "agent_1", id="AgentID"),
+        pytest.param(EdgeID, 42, id="EdgeID"),
+        pytest.param(LegID, "leg_1", id="LegID"),
+    ],
+)
+def test_id_creation(ctor: Callable[[Any], Any], value: Any) -> None:
+    """Test that ID types wrap their underlying value unchanged."""
+    assert ctor(value) == value
@@ -0,0 +1,48 @@
+"""Tests for agent message types."""
+
+from core.messages import DeliveryBatchConfirmedMsg, Msg, PickupConfirmedMsg
+from core.types import AgentID, PackageID, SiteID
+
+
+class TestMessages:
+    """Test generic and typed messages."""
+
+    def test_typed_message_fixes_type_and_uses_slots(self) -> None:
+        """Test that typed messages carry their payload as slotted attributes."""
+        msg = PickupConfirmedMsg(
+            src=AgentID("truck-1"), dst=AgentID("broker-1"), package_id=PackageID("pkg-1")
+        )
+
+        assert msg.typ == "pickup_confirmed"
+        assert msg.package_id == PackageID("pkg-1")
+        assert msg.body == {}
+        assert not hasattr(msg, "__dict__")
+
+    def test_typed_message_roundtrip_through_wire_form(self) -> None:
+        """Test that to_dict/from_dict keep the generic shape and restore the class."""
+        msg = DeliveryBatchConfirmedMsg(
+            src=AgentID("truck-1"),
+            dst=AgentID("broker-1"),
+            delivery_tick=42,
+            delivery_site_id=SiteID("site-1"),
+            packages=[(PackageID("pkg-1"), True)],
+        )
+
+        data = msg.to_dict()
+        assert data["typ"] == "delivery_batch_confirmed"
+        assert data["body"] == {
+            "delivery_tick": 42,
+            "delivery_site_id": "site-1",
+            "packages": [("pkg-1", True)],
+        }
+        assert Msg.from_dict(data) == msg
+
+    def test_unknown_type_stays_generic(self) -> None:
+        """Test that messages without a typed class keep their body dict."""
+        data = {"src": "a", "dst": None, "topic": "t", "typ": "signal", "body": {"x": 1}}
+
+        msg = Msg.from_dict(data)
+
+        assert type(msg) is Msg
+        assert msg.body == {"x": 1}
+        assert msg.to_dict() == data
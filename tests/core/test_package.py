@@ -1,5 +1,9 @@
 """Tests for Package data structure."""
 
+from dataclasses import fields
+
+import pytest
+
 from core.packages.package import Package
 from core.types import (
     DeliveryUrgency,
@@ -10,6 +14,26 @@ from core.types import (
 )
 
 
+@pytest.fixture(scope="module")
+def package() -> Package:
+    """Standard package spawned at tick 0 with 1 h pickup and 2 h delivery deadlines.
+
+    Shared by the module, so tests must only read it.
+    """
+    return Package(
+        id=PackageID("pkg-123"),
+        origin_site=SiteID("site-1"),
+        destination_site=SiteID("site-2"),
+        size=10.0,
+        value_currency=100.0,
+        priority=Priority.MEDIUM,
+        urgency=DeliveryUrgency.STANDARD,
+        spawn_tick=0,
+        pickup_deadline_tick=3600,  # 1 hour
+        delivery_deadline_tick=7200,  # 2 hours
+    )
+
+
 class TestPackage:
     """Test Package data structure."""
 
@@ -40,21 +64,8 @@ class TestPackage:
         assert package.delivery_deadline_tick == 8200
         assert package.status == PackageStatus.WAITING_PICKUP
 
-    def test_package_default_status(self) -> None:
+    def test_package_default_status(self, package: Package) -> None:
         """Test that package defaults to WAITING_PICKUP status."""
-        package = Package(
-            id=PackageID("pkg-123"),
-            origin_site=SiteID("site-1"),
-            destination_site=SiteID("site-2"),
-            size=10.0,
-            value_currency=100.0,
-            priority=Priority.MEDIUM,
-            urgency=DeliveryUrgency.STANDARD,
-            spawn_tick=0,
-            pickup_deadline_tick=3600,
-            delivery_deadline_tick=7200,
-        )
-
         assert package.status == PackageStatus.WAITING_PICKUP
 
     def test_package_serialization(self) -> None:
@@ -80,6 +91,7 @@ class TestPackage:
         assert package_dict["priority"] == "HIGH"
         assert package_dict["urgency"] == "EXPRESS"
         assert package_dict["status"] == "IN_TRANSIT"
+        assert list(package_dict) == [f.name for f in fields(Package)]
 
         # Deserialize from dict
         restored_package = Package.from_dict(package_dict)
@@ -95,77 +107,62 @@ class TestPackage:
         assert restored_package.delivery_deadline_tick == original_package.delivery_deadline_tick
         assert restored_package.status == original_package.status
 
-    def test_package_expiry_check(self) -> None:
-        """Test package expiry checking."""
-        package = Package(
-            id=PackageID("pkg-123"),
-            origin_site=SiteID("site-1"),
-            destination_site=SiteID("site-2"),
-            size=10.0,
-            value_currency=100.0,
-            priority=Priority.MEDIUM,
-            urgency=DeliveryUrgency.STANDARD,
-            spawn_tick=0,
-            pickup_deadline_tick=3600,  # 1 hour
-            delivery_deadline_tick=7200,  # 2 hours
-        )
-
-        # Before expiry
-        assert not package.is_expired(1800)  # 30 minutes
-        assert not package.is_expired(3599)  # just before deadline
-
-        # At and after expiry
-        assert package.is_expired(3600)  # exactly at deadline
-        assert package.is_expired(3601)  # 1 tick after deadline
-        assert package.is_expired(7200)  # 2 hours
-
-    def test_package_delivery_overdue_check(self) -> None:
-        """Test package delivery overdue checking."""
-        package = Package(
-            id=PackageID("pkg-123"),
-            origin_site=SiteID("site-1"),
-            destination_site=SiteID("site-2"),
-            size=10.0,
-            value_currency=100.0,
-            priority=Priority.MEDIUM,
-            urgency=DeliveryUrgency.STANDARD,
-            spawn_tick=0,
-            pickup_deadline_tick=3600,  # 1 hour
-            delivery_deadline_tick=7200,  # 2 hours
-        )
-
-        # Before delivery deadline
-        assert not package.is_delivery_overdue(3600)  # 1 hour
-        assert not package.is_delivery_overdue(7199)  # just before deadline
-
-        # At and after delivery deadline
-        assert not package.is_delivery_overdue(7200)  # exactly at deadline (not overdue yet)
-        assert package.is_delivery_overdue(7201)  # 1 tick after deadline
-        assert package.is_delivery_overdue(14400)  # 4 hours
-
-    def test_package_remaining_time_calculations(self) -> None:
-        """Test remaining time calculations."""
-        package = Package(
-            id=PackageID("pkg-123"),
-            origin_site=SiteID("site-1"),
-            destination_site=SiteID("site-2"),
-            size=10.0,
-            value_currency=100.0,
-            priority=Priority.MEDIUM,
-            urgency=DeliveryUrgency.STANDARD,
-            spawn_tick=0,
-            pickup_deadline_tick=3600,  # 1 hour
-            delivery_deadline_tick=7200,  # 2 hours
-        )
-
-        # Test remaining pickup time
-        assert package.get_remaining_pickup_time_ticks(0) == 3600
-        assert package.get_remaining_pickup_time_ticks(1800) == 1800
-        assert package.get_remaining_pickup_time_ticks(3600) == 0
-        assert package.get_remaining_pickup_time_ticks(7200) == 0  # Should not go negative
-
-        # Test remaining delivery time
-        assert package.get_remaining_delivery_time_ticks(0) == 7200
-        assert package.get_remaining_delivery_time_ticks(3600) == 3600
-        assert package.get_remaining_delivery_time_ticks(7200) == 0
-        assert package.get_remaining_delivery_time_ticks(14400) == 0  # Should not go negative
+    @pytest.mark.parametrize(
+        ("tick", "expected"),
+        [
+            pytest.param(1800, False, id="half_hour"),
+            pytest.param(3599, False, id="just_before"),
+            pytest.param(3600, True, id="at_deadline"),
+            pytest.param(3601, True, id="just_after"),
+            pytest.param(7200, True, id="two_hours"),
+        ],
+    )
+    def test_package_expiry_check(self, package: Package, tick: int, expected: bool) -> None:
+        """Test that a package expires once the pickup deadline tick is reached."""
+        assert package.is_expired(tick) is expected
+
+    @pytest.mark.parametrize(
+        ("tick", "expected"),
+        [
+            pytest.param(3600, False, id="one_hour"),
+            pytest.param(7199, False, id="just_before"),
+            pytest.param(7200, False, id="at_deadline"),
+            pytest.param(7201, True, id="just_after"),
+            pytest.param(14400, True, id="four_hours"),
+        ],
+    )
+    def test_package_delivery_overdue_check(
+        self, package: Package, tick: int, expected: bool
+    ) -> None:
+        """Test that delivery is overdue only after the delivery deadline tick."""
+        assert package.is_delivery_overdue(tick) is expected
+
+    @pytest.mark.parametrize(
+        ("tick", "expected"),
+        [
+            pytest.param(0, 3600, id="spawn"),
+            pytest.param(1800, 1800, id="half_way"),
+            pytest.param(3600, 0, id="at_deadline"),
+            pytest.param(7200, 0, id="past_deadline"),
+        ],
+    )
+    def test_package_remaining_pickup_time(
+        self, package: Package, tick: int, expected: int
+    ) -> None:
+        """Test remaining pickup time, which never goes negative."""
+        assert package.get_remaining_pickup_time_ticks(tick) == expected
+
+    @pytest.mark.parametrize(
+        ("tick", "expected"),
+        [
+            pytest.param(0, 7200, id="spawn"),
+            pytest.param(3600, 3600, id="half_way"),
+            pytest.param(7200, 0, id="at_deadline"),
+            pytest.param(14400, 0, id="past_deadline"),
+        ],
+    )
+    def test_package_remaining_delivery_time(
+        self, package: Package, tick: int, expected: int
+    ) -> None:
+        """Test remaining delivery time, which never goes negative."""
+        assert package.get_remaining_delivery_time_ticks(tick) == expected
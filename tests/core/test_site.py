@@ -1,9 +1,13 @@
 """Tests for Site building and SiteStatistics."""
 
+import math
+from dataclasses import fields
+from typing import Any
+
 import pytest
 
 from core.buildings.site import Site, SiteStatistics
-from core.types import BuildingID, PackageID, SiteID
+from core.types import BuildingID, DeliveryUrgency, PackageID, Priority, SiteID
 
 
 class TestSiteStatistics:
@@ -20,31 +24,54 @@ class TestSiteStatistics:
         assert stats.total_value_delivered == 0.0
         assert stats.total_value_expired == 0.0
 
-    def test_site_statistics_serialization(self) -> None:
-        """Test site statistics serialization and deserialization."""
-        original_stats = SiteStatistics(
-            packages_generated=10,
-            packages_picked_up=8,
-            packages_delivered=7,
-            packages_expired=1,
-            total_value_delivered=5000.0,
-            total_value_expired=200.0,
-        )
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param(
+                {
+                    "packages_generated": 10,
+                    "packages_picked_up": 8,
+                    "packages_delivered": 7,
+                    "packages_expired": 1,
+                    "total_value_delivered": 5000.0,
+                    "total_value_expired": 200.0,
+                },
+                id="typical",
+            ),
+            pytest.param({}, id="defaults"),
+            pytest.param(
+                {"packages_generated": 2**31 - 1, "total_value_delivered": 1e12},
+                id="large",
+            ),
+            pytest.param(
+                {
+                    "packages_generated": 5,
+                    "packages_picked_up": 5,
+                    "packages_delivered": 5,
+                    "packages_expired": 5,
+                    "total_value_delivered": 5.0,
+                    "total_value_expired": 5.0,
+                },
+                id="all_same",
+            ),
+        ],
+    )
+    def test_site_statistics_serialization(self, kwargs: dict[str, Any]) -> None:
+        """Test that statistics survive a to_dict/from_dict roundtrip unchanged."""
+        original_stats = SiteStatistics(**kwargs)
 
-        # Serialize to dict
         stats_dict = original_stats.to_dict()
-        assert isinstance(stats_dict, dict)
-        assert stats_dict["packages_generated"] == 10
-        assert stats_dict["total_value_delivered"] == 5000.0
+        for name, value in kwargs.items():
+            assert stats_dict[name] == value
 
-        # Deserialize from dict
-        restored_stats = SiteStatistics.from_dict(stats_dict)
-        assert restored_stats.packages_generated == original_stats.packages_generated
-        assert restored_stats.packages_picked_up == original_stats.packages_picked_up
-        assert restored_stats.packages_delivered == original_stats.packages_delivered
-        assert restored_stats.packages_expired == original_stats.packages_expired
-        assert restored_stats.total_value_delivered == original_stats.total_value_delivered
-        assert restored_stats.total_value_expired == original_stats.total_value_expired
+        assert SiteStatistics.from_dict(stats_dict) == original_stats
+
+    def test_site_statistics_to_dict_covers_all_fields(self) -> None:
+        """Test that the hand-built stats dict stays in sync with the dataclass fields."""
+        stats = SiteStatistics(packages_generated=3)
+
+        assert not hasattr(stats, "__dict__")
+        assert list(stats.to_dict()) == [f.name for f in fields(SiteStatistics)]
 
 
 class TestSite:
@@ -92,6 +119,34 @@ class TestSite:
         urgency_weights = site.package_config["urgency_weights"]
         assert sum(urgency_weights.values()) == pytest.approx(1.0, abs=0.01)
 
+    def test_sites_without_config_share_the_default_parse(self) -> None:
+        """Test that default-configured sites share one config dict and its parsed form."""
+        first = Site(id=BuildingID("site-1"), name="First", activity_rate=1.0)
+        second = Site(id=BuildingID("site-2"), name="Second", activity_rate=1.0)
+
+        assert first.package_config is second.package_config
+        assert first.get_package_config() is second.get_package_config()
+
+        second.package_config = {**second.package_config, "size_range": (5.0, 5.0)}
+        assert second.get_package_config().size_min == 5.0
+        assert first.get_package_config().size_min == 1.0
+
+    def test_editing_serialized_config_leaves_shared_default_untouched(self) -> None:
+        """Test that to_dict hands out a copy of the shared default package_config."""
+        first = Site(id=BuildingID("site-1"), name="First", activity_rate=1.0)
+        second = Site(id=BuildingID("site-2"), name="Second", activity_rate=1.0)
+        parsed = second.get_package_config()
+
+        config = first.to_dict()["package_config"]
+        config["priority_weights"][Priority.LOW] = 99.0
+        config["size_range"] = (5.0, 5.0)
+
+        assert second.package_config["priority_weights"][Priority.LOW] == 0.4
+        assert second.package_config["size_range"] == (1.0, 30.0)
+        assert first.to_dict()["package_config"]["priority_weights"][Priority.LOW] == 0.4
+        assert second.get_package_config() is parsed
+        assert parsed.size_min == 1.0
+
     def test_site_serialization(self) -> None:
         """Test site serialization and deserialization."""
         original_site = Site(
@@ -146,137 +201,282 @@ class TestSite:
         # Try to remove non-existent package (should not raise error)
         site.remove_package(PackageID("non-existent"))
 
-    def test_site_statistics_updates(self) -> None:
-        """Test site statistics updates."""
+    @pytest.mark.parametrize(
+        ("event", "value", "attr", "expected"),
+        [
+            ("generated", None, "packages_generated", 1),
+            ("picked_up", None, "packages_picked_up", 1),
+            ("delivered", 500.0, "packages_delivered", 1),
+            ("delivered", 500.0, "total_value_delivered", 500.0),
+            ("expired", 100.0, "packages_expired", 1),
+            ("expired", 100.0, "total_value_expired", 100.0),
+        ],
+    )
+    def test_site_statistics_updates(
+        self, event: str, value: float | None, attr: str, expected: float
+    ) -> None:
+        """Test that each statistics event updates its counter on a fresh site."""
         site = Site(
             id=BuildingID("site-1"),
             name="Test Site",
             activity_rate=1.0,
         )
 
-        # Test generated
-        site.update_statistics("generated")
-        assert site.statistics.packages_generated == 1
+        if value is None:
+            site.update_statistics(event)
+        else:
+            site.update_statistics(event, value)
 
-        # Test picked up
-        site.update_statistics("picked_up")
-        assert site.statistics.packages_picked_up == 1
-
-        # Test delivered with value
-        site.update_statistics("delivered", 500.0)
-        assert site.statistics.packages_delivered == 1
-        assert site.statistics.total_value_delivered == 500.0
-
-        # Test expired with value
-        site.update_statistics("expired", 100.0)
-        assert site.statistics.packages_expired == 1
-        assert site.statistics.total_value_expired == 100.0
+        assert getattr(site.statistics, attr) == expected
 
-    def test_site_destination_selection(self) -> None:
-        """Test destination site selection."""
+    def test_site_record_methods_mark_dirty(self) -> None:
+        """Test the direct statistics recorders used on hot paths."""
         site = Site(
             id=BuildingID("site-1"),
             name="Test Site",
             activity_rate=1.0,
-            destination_weights={
-                SiteID("site-2"): 0.6,
-                SiteID("site-3"): 0.4,
-            },
         )
 
-        available_sites = [SiteID("site-2"), SiteID("site-3")]
+        site.record_delivered(250.0)
+        assert site.is_dirty()
+        site.clear_dirty()
+        site.record_expired(50.0)
+        assert site.is_dirty()
 
-        # Test with weights
-        selected = site.select_destination(available_sites)
-        assert selected in available_sites
-
-        # Test with no weights (should select randomly)
-        site_no_weights = Site(
+        assert site.statistics.packages_delivered == 1
+        assert site.statistics.total_value_delivered == 250.0
+        assert site.statistics.packages_expired == 1
+        assert site.statistics.total_value_expired == 50.0
+
+    @pytest.mark.parametrize(
+        ("weights", "available", "expect_selection"),
+        [
+            pytest.param(
+                {SiteID("site-2"): 0.6, SiteID("site-3"): 0.4},
+                [SiteID("site-2"), SiteID("site-3")],
+                True,
+                id="weighted",
+            ),
+            pytest.param(None, [SiteID("site-2"), SiteID("site-3")], True, id="unweighted"),
+            pytest.param({SiteID("site-2"): 0.6}, [], False, id="no_candidates"),
+        ],
+    )
+    def test_site_destination_selection(
+        self,
+        weights: dict[SiteID, float] | None,
+        available: list[SiteID],
+        expect_selection: bool,
+    ) -> None:
+        """Test that a destination comes from the candidates, or None without any."""
+        site = Site(
             id=BuildingID("site-1"),
             name="Test Site",
             activity_rate=1.0,
+            destination_weights=weights or {},
         )
-        selected = site_no_weights.select_destination(available_sites)
-        assert selected in available_sites
 
-        # Test with empty available sites
-        selected = site.select_destination([])
-        assert selected is None
-
-    def test_site_package_parameter_generation(self) -> None:
-        """Test package parameter generation."""
+        selected = site.select_destination(available)
+
+        if expect_selection:
+            assert selected in available
+        else:
+            assert selected is None
+
+    @pytest.mark.parametrize(
+        ("draw", "bound"),
+        [
+            pytest.param(0.0, 0, id="lowest_draw"),
+            pytest.param(1.0 - 1e-12, 1, id="highest_draw"),
+        ],
+    )
+    def test_site_package_parameter_generation(
+        self, monkeypatch: pytest.MonkeyPatch, draw: float, bound: int
+    ) -> None:
+        """Test that extreme draws map to the configured range endpoints."""
         site = Site(
             id=BuildingID("site-1"),
             name="Test Site",
             activity_rate=1.0,
         )
+        monkeypatch.setattr(site._rng, "random", lambda: draw)
 
         params = site.generate_package_parameters()
 
-        # Check required parameters
-        assert "size" in params
-        assert "value_currency" in params
-        assert "priority" in params
-        assert "urgency" in params
-        assert "pickup_deadline_tick" in params
-        assert "delivery_deadline_tick" in params
-
-        # Check value ranges
+        assert set(params) == {
+            "size",
+            "value_currency",
+            "priority",
+            "urgency",
+            "pickup_deadline_tick",
+            "delivery_deadline_tick",
+        }
         config = site.package_config
-        size_min, size_max = config["size_range"]
-        assert size_min <= params["size"] <= size_max
+        assert params["priority"] in config["priority_weights"]
+        assert params["urgency"] in config["urgency_weights"]
+        assert params["size"] == pytest.approx(config["size_range"][bound])
+        # Priority and urgency scale the drawn base value; LOW and STANDARD leave it as is
+        priority_multiplier = {Priority.HIGH: 1.5, Priority.URGENT: 2.0}.get(
+            params["priority"], 1.0
+        )
+        urgency_multiplier = {DeliveryUrgency.EXPRESS: 1.3, DeliveryUrgency.SAME_DAY: 1.8}.get(
+            params["urgency"], 1.0
+        )
+        assert params["value_currency"] == pytest.approx(
+            config["value_range_currency"][bound] * priority_multiplier * urgency_multiplier
+        )
+        assert params["pickup_deadline_tick"] == config["pickup_deadline_range_ticks"][bound]
+        assert params["delivery_deadline_tick"] == config["delivery_deadline_range_ticks"][bound]
+        assert params["delivery_deadline_tick"] > params["pickup_deadline_tick"]
+
+    def test_site_package_deadlines_are_integers_within_inclusive_ranges(self) -> None:
+        """Test that deadline draws are ints covering both configured endpoints."""
+        site = Site(
+            id=BuildingID("site-1"),
+            name="Test Site",
+            activity_rate=1.0,
+        )
+        site.package_config = {
+            **site.package_config,
+            "pickup_deadline_range_ticks": (10, 12),
+            "delivery_deadline_range_ticks": (5000, 5000),
+        }
+
+        pickups = set()
+        for _ in range(200):
+            params = site.generate_package_parameters()
+            assert isinstance(params["pickup_deadline_tick"], int)
+            assert params["delivery_deadline_tick"] == 5000
+            pickups.add(params["pickup_deadline_tick"])
+
+        assert pickups == {10, 11, 12}
+
+    def test_site_rejects_incomplete_package_config(self) -> None:
+        """Test that a package_config missing required keys fails at construction."""
+        with pytest.raises(ValueError, match="missing urgency_weights"):
+            Site(
+                id=BuildingID("site-1"),
+                name="Test Site",
+                activity_rate=1.0,
+                package_config={
+                    "size_range": (1.0, 30.0),
+                    "value_range_currency": (10.0, 1000.0),
+                    "pickup_deadline_range_ticks": (1800, 7200),
+                    "delivery_deadline_range_ticks": (3600, 14400),
+                    "priority_weights": {"LOW": 1.0},
+                },
+            )
+
+    def test_site_seed_gives_reproducible_stream(self) -> None:
+        """Test that sites with the same seed draw the same packages and destinations."""
+        candidates = (SiteID("site-2"), SiteID("site-3"))
+
+        def draws(seed: int) -> list[object]:
+            site = Site(id=BuildingID("site-1"), name="Seeded", activity_rate=1.0, seed=seed)
+            return [
+                (site.generate_package_parameters(), site.select_destination(candidates))
+                for _ in range(5)
+            ]
+
+        assert draws(7) == draws(7)
+        assert draws(7) != draws(8)
+
+    def test_site_package_value_multipliers(self) -> None:
+        """Test that priority and urgency multipliers apply, including string-keyed weights."""
+        site = Site(
+            id=BuildingID("site-1"),
+            name="Test Site",
+            activity_rate=1.0,
+        )
+        site.package_config = {
+            **site.package_config,
+            "value_range_currency": (100.0, 100.0),
+            "priority_weights": {"URGENT": 1.0},
+            "urgency_weights": {"SAME_DAY": 1.0},
+        }
 
-        value_min, value_max = config["value_range_currency"]
-        # Value can exceed value_max due to priority/urgency multipliers
-        # Maximum multiplier: URGENT (2.0) * SAME_DAY (1.8) = 3.6
-        max_possible_value = value_max * 3.6
-        assert value_min <= params["value_currency"] <= max_possible_value
+        params = site.generate_package_parameters()
 
-        # Check delivery deadline is after pickup deadline
-        assert params["delivery_deadline_tick"] > params["pickup_deadline_tick"]
+        assert params["value_currency"] == pytest.approx(360.0)
 
-    def test_site_poisson_spawning_probability(self) -> None:
-        """Test Poisson spawning probability calculation."""
+    def test_site_poisson_spawning_probability(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a spawn happens exactly when the draw is below 1 - exp(-rate * dt)."""
         site = Site(
             id=BuildingID("site-1"),
             name="Test Site",
             activity_rate=10.0,  # 10 packages/hour
         )
+        prob_small = 1.0 - math.exp(-10.0 / 3600.0 * 0.05)
+        prob_large = 1.0 - math.exp(-10.0 / 3600.0 * 1.0)
 
-        # Test with different time deltas
-        dt_small = 0.05  # Small time step
-        dt_large = 1.0  # Large time step
-
-        # With small dt, probability should be low
-        # Use more samples to reduce variance in probabilistic test
-        prob_small: float = 0.0
-        num_samples = 10000
-        for _ in range(num_samples):
-            if site.should_spawn_package(dt_small):
-                prob_small += 1.0
-        prob_small /= float(num_samples)
-
-        # With large dt, probability should be higher
-        prob_large: float = 0.0
-        for _ in range(num_samples):
-            if site.should_spawn_package(dt_large):
-                prob_large += 1.0
-        prob_large /= float(num_samples)
-
-        # Large dt should have higher probability (with tolerance for stochastic variance)
-        # With 10000 samples, the probability of both being 0 is extremely small
-        # Theoretical values: dt_small ~0.000139, dt_large ~0.00278
-        assert (
-            prob_large >= prob_small
-        ), f"Large dt probability ({prob_large}) should be >= small dt probability ({prob_small})"
-
-        # Test with zero activity rate
+        # A draw between the two probabilities spawns with the large step only
+        monkeypatch.setattr(site._rng, "random", lambda: (prob_small + prob_large) / 2.0)
+        assert not site.should_spawn_package(0.05)
+        assert site.should_spawn_package(1.0)
+
+        # The comparison is strict: a draw equal to the probability does not spawn
+        monkeypatch.setattr(site._rng, "random", lambda: prob_large)
+        assert not site.should_spawn_package(1.0)
+
+        # With zero activity rate even the lowest draw never spawns
         site_zero = Site(
             id=BuildingID("site-2"),
             name="Inactive Site",
             activity_rate=0.0,
         )
+        monkeypatch.setattr(site_zero._rng, "random", lambda: 0.0)
+        assert not site_zero.should_spawn_package(1.0)
 
-        # Should never spawn with zero activity rate
-        for _ in range(100):
-            assert not site_zero.should_spawn_package(1.0)
+    def test_site_seeded_spawning_is_reproducible(self) -> None:
+        """Test the spawn count of a seeded site against a recorded reference run."""
+        site = Site(
+            id=BuildingID("site-1"),
+            name="Busy Site",
+            activity_rate=3600.0,  # 1 package/second, so p = 1 - e^-1 per 1 s tick
+            seed=42,
+        )
+
+        spawned = sum(site.should_spawn_package(1.0) for _ in range(500))
+
+        # Recorded from a reference run; the expected mean is 500 * (1 - e^-1) ~ 316
+        assert spawned == 314
+
+    def test_site_scheduled_spawning_matches_poisson_rate(self) -> None:
+        """Test that next-event spawn scheduling fires at the per-tick Poisson rate."""
+        site = Site(
+            id=BuildingID("site-1"),
+            name="Busy Site",
+            activity_rate=3600.0,  # 1 package/second
+        )
+
+        num_ticks = 10000
+        spawns = sum(site.is_spawn_due(tick, 1.0) for tick in range(1, num_ticks + 1))
+
+        # Expected per-tick probability: 1 - exp(-1) ~ 0.632
+        assert 0.60 < spawns / num_ticks < 0.66
+
+        site_zero = Site(
+            id=BuildingID("site-2"),
+            name="Inactive Site",
+            activity_rate=0.0,
+        )
+        assert not any(site_zero.is_spawn_due(tick, 1.0) for tick in range(1, 101))
+
+    def test_site_spawn_schedule_follows_tick_length_change(self) -> None:
+        """Test that a pending spawn keeps its simulated time when dt changes mid-wait."""
+        site = Site(id=BuildingID("site-1"), name="Test Site", activity_rate=10.0, seed=7)
+        first = site.next_spawn_tick(1, 0.05)
+        remaining_s = (first - 100) * 0.05
+        assert remaining_s > 0
+
+        # From tick 100 on each tick lasts 1 s, so the remaining wait shrinks 20-fold
+        rescaled = site.next_spawn_tick(100, 1.0)
+        assert rescaled == 100 + math.ceil(remaining_s / 1.0)
+        assert site.next_spawn_tick(100, 1.0) == rescaled
+
+        # Averaged over seeds, the first spawn still comes after ~1/λ = 360 simulated seconds
+        waits_s: list[float] = []
+        for seed in range(500):
+            site = Site(id=BuildingID("site-1"), name="Test Site", activity_rate=10.0, seed=seed)
+            site.next_spawn_tick(1, 0.05)
+            waits_s.append(site.next_spawn_tick(1, 1.0))  # 1 s ticks, so the tick is the time
+        assert 300.0 < sum(waits_s) / len(waits_s) < 420.0
@@ -1,8 +1,10 @@
 """Tests for Site building serialization and type system."""
 
+import orjson
+
 from core.buildings.base import Building
 from core.buildings.site import Site, SiteStatistics
-from core.types import BuildingID, SiteID
+from core.types import AgentID, BuildingID, SiteID
 
 
 def test_site_has_correct_type() -> None:
@@ -84,6 +86,7 @@ def test_site_deserialization_via_site_class() -> None:
     assert site.name == "Direct Site"
     assert site.activity_rate == 20.0
     assert len(site.active_packages) == 2
+    assert site.to_dict()["active_packages"] == ["pkg-1", "pkg-2"]
     assert site.statistics.packages_delivered == 7
 
 
@@ -127,3 +130,36 @@ def test_site_type_distinguishes_from_other_buildings() -> None:
     assert site.TYPE != parking.TYPE
     assert site.TYPE == "site"
     assert parking.TYPE == "parking"
+
+
+def test_site_from_dict_leaves_payload_untouched() -> None:
+    """Test that Site.from_dict reads fields without copying or mutating the payload."""
+    original = Site(id=SiteID("site-1"), name="Test Site", activity_rate=10.0, capacity=5)
+    original.enter(AgentID("truck-1"))
+    data = original.serialize_full()
+    snapshot = dict(data)
+
+    restored = Site.from_dict(data)
+
+    assert data == snapshot
+    assert restored.capacity == 5
+    assert restored.current_agents == {AgentID("truck-1")}
+
+
+def test_site_to_dict_roundtrips_through_orjson() -> None:
+    """Test that Site.to_dict output encodes with orjson and restores an equivalent Site."""
+    original = Site(
+        id=SiteID("site-1"),
+        name="Test Site",
+        activity_rate=10.0,
+        destination_weights={SiteID("site-2"): 0.7, SiteID("site-3"): 0.3},
+        seed=7,
+    )
+    original.statistics.packages_generated = 3
+
+    encoded = orjson.dumps(original.to_dict(), option=orjson.OPT_NON_STR_KEYS)
+    restored = Site.from_dict(orjson.loads(encoded))
+
+    assert restored.to_dict() == orjson.loads(encoded)
+    assert restored.destination_weights == original.destination_weights
+    assert restored.statistics.packages_generated == 3
@@ -107,7 +107,7 @@ def test_truck_create_dto_to_truck() -> None:
     assert truck.edge_progress_m == 0.0
     assert truck.route == []
     assert truck.destination is None
-    assert truck.loaded_packages == []
+    assert truck.loaded_packages == {}
 
 
 def test_truck_create_dto_accepts_numeric_types() -> None:
@@ -577,7 +577,7 @@ def test_handle_create_gas_station_price_calculation() -> None:
     global_price = 5.0
     expected_price = 5.0 * 1.2  # 6.0
     actual_price = building.get_fuel_price(global_price)
-    assert abs(actual_price - expected_price) < 0.001
+    assert actual_price == pytest.approx(expected_price, abs=0.001)
 
 
 def test_handle_create_gas_station_occupancy() -> None:
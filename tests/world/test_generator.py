@@ -2,6 +2,8 @@
 
 import unittest
 
+import pytest
+
 from core.buildings.site import Site
 from world.generation import GenerationParams, MapGenerator
 from world.graph.edge import Mode, RoadClass
@@ -294,6 +296,7 @@ class TestMapGenerator(unittest.TestCase):
         collector_roads = [e for e in graph.edges.values() if e.road_class == RoadClass.Z]
         assert len(collector_roads) > 0
 
+    @pytest.mark.slow
     def test_generate_with_rural_settlements(self) -> None:
         """Test generating a map with rural settlements."""
         params = GenerationParams(
@@ -731,6 +734,7 @@ class TestMapGenerator(unittest.TestCase):
             # Nodes should not be the same
             assert edge.from_node != edge.to_node
 
+    @pytest.mark.slow
     def test_large_map_generation(self) -> None:
         """Test generating a moderately sized map."""
         params = GenerationParams(
@@ -176,6 +176,98 @@ def test_find_closest_node_caching() -> None:
     assert route1 == route2
 
 
+def test_find_closest_node_respects_max_cost() -> None:
+    """Test find_closest_node ignores matches beyond the cost bound, cached or not."""
+    graph = create_linear_graph()
+    parking = Parking(id=BuildingID("p4"), capacity=10)
+    graph.nodes[NodeID(4)].add_building(parking)
+
+    navigator = Navigator()
+    criteria = BuildingTypeCriteria(Parking)
+
+    # n4 is 3000m away at 50 kph: 0.06h
+    assert navigator.find_closest_node(NodeID(1), graph, 100.0, criteria, max_cost=0.05) == (
+        None,
+        None,
+        None,
+    )
+
+    # Populate the cache with an unbounded search, then bound it again
+    node_id, _, _ = navigator.find_closest_node(NodeID(1), graph, 100.0, criteria)
+    assert node_id == NodeID(4)
+    node_id, _, _ = navigator.find_closest_node(NodeID(1), graph, 100.0, criteria, max_cost=0.05)
+    assert node_id is None
+    node_id, _, _ = navigator.find_closest_node(NodeID(1), graph, 100.0, criteria, max_cost=0.06)
+    assert node_id == NodeID(4)
+
+
+def test_graph_min_edge_speed_follows_graph_changes() -> None:
+    """Test the slowest edge speed used to bound searches is refreshed on graph changes."""
+    graph = create_linear_graph()
+    assert graph.get_min_edge_speed_kph() == 50.0
+
+    slow = Edge(EdgeID(4), NodeID(4), NodeID(1), 500.0, Mode.ROAD, RoadClass.L, 1, 20.0, None)
+    graph.add_edge(slow)
+    assert graph.get_min_edge_speed_kph() == 20.0
+
+    graph.remove_edge(EdgeID(4))
+    assert graph.get_min_edge_speed_kph() == 50.0
+    assert Graph().get_min_edge_speed_kph() is None
+
+
+def test_graph_edge_log_reports_additions_until_a_removal() -> None:
+    """Test the edge-addition log used to patch edge-derived caches."""
+    graph = create_linear_graph()
+    position = graph.get_edge_log_position()
+    assert graph.get_edges_added_since(position) == []
+
+    edge = Edge(EdgeID(4), NodeID(4), NodeID(1), 500.0, Mode.ROAD, RoadClass.G, 2, 50.0, None)
+    graph.add_edge(edge)
+    graph.mark_changed()
+    assert graph.get_edges_added_since(position) == [edge]
+
+    graph.remove_edge(EdgeID(4))
+    assert graph.get_edges_added_since(position) is None
+    assert graph.get_edges_added_since(graph.get_edge_log_position()) == []
+
+
+def test_graph_edge_log_starts_new_epoch_when_full(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the edge log stays bounded and far-behind consumers are told to rebuild."""
+    monkeypatch.setattr("world.graph.graph.EDGE_LOG_SIZE", 2)
+    graph = create_linear_graph()
+    position = graph.get_edge_log_position()
+    navigator = Navigator()
+    navigator._get_cost_adjacency(graph, 50.0)
+
+    def road(edge_id: int, from_node: int, to_node: int) -> Edge:
+        return Edge(
+            EdgeID(edge_id),
+            NodeID(from_node),
+            NodeID(to_node),
+            500.0,
+            Mode.ROAD,
+            RoadClass.G,
+            2,
+            50.0,
+            None,
+        )
+
+    edge4 = road(4, 4, 1)
+    graph.add_edge(edge4)
+    assert graph.get_edges_added_since(position) == [edge4]
+
+    # The log is full, so the next edge starts a new epoch holding only that edge
+    edge5 = road(5, 1, 4)
+    graph.add_edge(edge5)
+    assert graph.get_edges_added_since(position) is None
+    assert graph._added_edges == [edge5]
+
+    # The navigator's cached adjacency falls back to a full rebuild that sees every edge
+    adjacency = navigator._get_cost_adjacency(graph, 50.0)
+    assert {node_id for node_id, _ in adjacency[NodeID(1)]} == {NodeID(2), NodeID(4)}
+    assert [node_id for node_id, _ in adjacency[NodeID(4)]] == [NodeID(1)]
+
+
 def create_waypoint_graph() -> Graph:
     """Create a graph for testing waypoint routing.
 
@@ -345,6 +437,28 @@ def test_find_closest_node_on_route_with_exclusion() -> None:
     assert route == [NodeID(1), NodeID(3)]
 
 
+def test_find_closest_node_on_route_respects_max_cost() -> None:
+    """Test waypoint search skips candidates whose start cost exceeds the bound."""
+    graph = create_waypoint_graph()
+    parking3 = Parking(id=BuildingID("p3"), capacity=10)
+    graph.nodes[NodeID(3)].add_building(parking3)
+
+    navigator = Navigator()
+    criteria = BuildingTypeCriteria(Parking)
+
+    # n1 -> n3 is 2000m at 50 kph: 0.04h
+    node_id, matched_item, route = navigator.find_closest_node_on_route(
+        NodeID(1), NodeID(4), graph, 100.0, criteria, max_cost=0.03
+    )
+    assert (node_id, matched_item, route) == (None, None, None)
+
+    node_id, matched_item, _ = navigator.find_closest_node_on_route(
+        NodeID(1), NodeID(4), graph, 100.0, criteria, max_cost=0.04
+    )
+    assert node_id == NodeID(3)
+    assert matched_item == parking3
+
+
 def test_reverse_dijkstra() -> None:
     """Test _reverse_dijkstra computes correct distances."""
     graph = create_linear_graph()
@@ -367,3 +481,143 @@ def test_reverse_dijkstra() -> None:
     assert NodeID(1) in dist_to_dest
     # n1 -> n2 -> n3 -> n4 = 3000m at 50kph = 0.06 hours
     assert dist_to_dest[NodeID(1)] == pytest.approx(0.06, rel=1e-6)
+
+
+def test_reverse_dijkstra_cached_until_graph_changes() -> None:
+    """Test reverse costs are reused per destination and recomputed after graph changes."""
+    graph = create_linear_graph()
+    navigator = Navigator()
+
+    first = navigator._get_dist_to_dest(NodeID(4), graph, 100.0)
+    assert navigator._get_dist_to_dest(NodeID(4), graph, 100.0) is first
+    assert navigator._get_dist_to_dest(NodeID(4), graph, 80.0) is not first
+
+    graph.add_node(Node(id=NodeID(5), x=4.0, y=0.0))
+    graph.add_edge(
+        Edge(EdgeID(4), NodeID(5), NodeID(4), 1000.0, Mode.ROAD, RoadClass.G, 2, 50.0, None)
+    )
+    refreshed = navigator._get_dist_to_dest(NodeID(4), graph, 100.0)
+    assert refreshed is not first
+    assert refreshed[NodeID(5)] == pytest.approx(0.02, rel=1e-6)
+
+
+def test_reverse_dijkstra_cache_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the per-destination cost cache stays bounded and keeps recent entries."""
+    monkeypatch.setattr("world.routing.navigator.DIST_TO_DEST_CACHE_SIZE", 2)
+    graph = create_linear_graph()
+    navigator = Navigator()
+
+    to_4 = navigator._get_dist_to_dest(NodeID(4), graph, 100.0)
+    navigator._get_dist_to_dest(NodeID(3), graph, 100.0)
+    # Reading the oldest entry refreshes it, so the next miss evicts destination 3
+    assert navigator._get_dist_to_dest(NodeID(4), graph, 100.0) is to_4
+    navigator._get_dist_to_dest(NodeID(2), graph, 100.0)
+
+    assert list(navigator._dist_to_dest_cache) == [(NodeID(4), 100.0), (NodeID(2), 100.0)]
+    assert navigator._get_dist_to_dest(NodeID(4), graph, 100.0) is to_4
+
+
+def test_estimate_travel_times_to_matches_single_estimates() -> None:
+    """Test many-to-one travel times agree with per-pair A* estimates."""
+    graph = create_waypoint_graph()
+    navigator = Navigator()
+    starts = [NodeID(1), NodeID(2), NodeID(3), NodeID(4)]
+
+    times = navigator.estimate_travel_times_to_s(starts, NodeID(4), graph, 100.0)
+
+    expected = [navigator.estimate_travel_time_s(s, NodeID(4), graph, 100.0) for s in starts]
+    assert times == pytest.approx(expected, rel=1e-9)
+    assert times[0] == pytest.approx(2000.0 / 50_000.0 * 3600.0, rel=1e-9)
+
+
+def test_estimate_travel_times_to_unreachable_is_inf() -> None:
+    """Test starts without a route to the goal, and missing goals, give infinity."""
+    graph = create_linear_graph()
+    navigator = Navigator()
+
+    # Edges only lead away from n1
+    assert navigator.estimate_travel_times_to_s([NodeID(4)], NodeID(1), graph, 100.0) == [
+        float("inf")
+    ]
+    assert navigator.estimate_travel_times_to_s([NodeID(1)], NodeID(99), graph, 100.0) == [
+        float("inf")
+    ]
+
+
+def test_find_route_memoized_until_graph_changes() -> None:
+    """Test repeated routes come from the cache as copies and are dropped on graph changes."""
+    graph = create_linear_graph()
+    navigator = Navigator()
+
+    first = navigator.find_route(NodeID(1), NodeID(4), graph, 100.0)
+    first.append(NodeID(99))
+    second = navigator.find_route(NodeID(1), NodeID(4), graph, 100.0)
+    assert second == [NodeID(1), NodeID(2), NodeID(3), NodeID(4)]
+    assert navigator.route_cache_stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    # A shortcut added after caching must be picked up
+    graph.add_edge(
+        Edge(EdgeID(4), NodeID(1), NodeID(4), 500.0, Mode.ROAD, RoadClass.G, 2, 50.0, None)
+    )
+    assert navigator.find_route(NodeID(1), NodeID(4), graph, 100.0) == [NodeID(1), NodeID(4)]
+    assert navigator.route_cache_stats() == {"hits": 1, "misses": 2, "size": 1}
+
+
+def test_find_route_cache_evicts_least_recently_used(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the route cache stays bounded and keeps recently used routes."""
+    monkeypatch.setattr("world.routing.navigator.ROUTE_CACHE_SIZE", 2)
+    graph = create_linear_graph()
+    navigator = Navigator()
+
+    navigator.find_route(NodeID(1), NodeID(2), graph, 100.0)
+    navigator.find_route(NodeID(1), NodeID(3), graph, 100.0)
+    navigator.find_route(NodeID(1), NodeID(2), graph, 100.0)  # refresh 1 -> 2
+    navigator.find_route(NodeID(1), NodeID(4), graph, 100.0)  # evicts 1 -> 3
+
+    assert navigator.route_cache_stats()["size"] == 2
+    navigator.find_route(NodeID(1), NodeID(2), graph, 100.0)
+    assert navigator.route_cache_stats()["hits"] == 2
+    navigator.find_route(NodeID(1), NodeID(3), graph, 100.0)
+    assert navigator.route_cache_stats()["misses"] == 4
+
+
+def test_cost_adjacency_matches_edges_and_follows_graph_changes() -> None:
+    """Test precomputed neighbor costs mirror the edges in both directions until edited."""
+    graph = create_linear_graph()
+    navigator = Navigator()
+
+    forward = navigator._get_cost_adjacency(graph, 100.0)
+    assert forward[NodeID(1)] == [(NodeID(2), pytest.approx(0.02))]
+    assert forward[NodeID(4)] == []
+    assert navigator._get_cost_adjacency(graph, 100.0) is forward
+    reverse = navigator._get_cost_adjacency(graph, 100.0, reverse=True)
+    assert reverse[NodeID(2)] == [(NodeID(1), pytest.approx(0.02))]
+    assert reverse[NodeID(1)] == []
+
+    # Truck slower than the road limit
+    assert navigator._get_cost_adjacency(graph, 25.0)[NodeID(1)] == [
+        (NodeID(2), pytest.approx(0.04))
+    ]
+
+    # Building changes leave edge costs alone
+    graph.mark_changed()
+    assert navigator._get_cost_adjacency(graph, 100.0) is forward
+
+    # New edges are patched into every cached adjacency in place
+    graph.add_node(Node(id=NodeID(5), x=4.0, y=0.0))
+    graph.add_edge(
+        Edge(EdgeID(4), NodeID(4), NodeID(5), 1000.0, Mode.ROAD, RoadClass.G, 2, 50.0, None)
+    )
+    assert navigator._get_cost_adjacency(graph, 100.0) is forward
+    assert forward[NodeID(4)] == [(NodeID(5), pytest.approx(0.02))]
+    assert navigator._get_cost_adjacency(graph, 100.0, reverse=True) is reverse
+    assert reverse[NodeID(5)] == [(NodeID(4), pytest.approx(0.02))]
+    assert navigator.find_route(NodeID(1), NodeID(5), graph, 100.0)[-1] == NodeID(5)
+
+    # Removing an edge forces a rebuild
+    graph.remove_edge(EdgeID(1))
+    refreshed = navigator._get_cost_adjacency(graph, 100.0)
+    assert refreshed is not forward
+    assert refreshed[NodeID(1)] == []
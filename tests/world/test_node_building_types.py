@@ -1,5 +1,7 @@
 """Tests for Node building type lookups and Navigator building search."""
 
+import pytest
+
 from core.buildings.parking import Parking
 from core.buildings.site import Site
 from core.types import BuildingID, EdgeID, NodeID, SiteID
@@ -9,6 +11,14 @@ from world.graph.node import Node
 from world.routing.navigator import Navigator
 
 
+def test_node_and_edge_use_slots() -> None:
+    """Test that graph nodes and edges store fields in slots instead of a per-instance dict."""
+    node = Node(id=NodeID(1), x=0.0, y=0.0)
+    edge = Edge(EdgeID(1), NodeID(1), NodeID(2), 100.0, Mode.ROAD, RoadClass.L, 1, 50.0, None)
+    assert not hasattr(node, "__dict__")
+    assert not hasattr(edge, "__dict__")
+
+
 def test_node_get_buildings_by_type_parking() -> None:
     """Test Node can retrieve Parking buildings by type."""
     node = Node(id=NodeID(1), x=0.0, y=0.0)
@@ -77,6 +87,40 @@ def test_node_has_building_type_site() -> None:
     assert node.has_building_type(Site)
 
 
+def test_node_get_building_by_id() -> None:
+    """Test that buildings are retrievable by ID until they are removed."""
+    node = Node(id=NodeID(1), x=0.0, y=0.0)
+    parking = Parking(id=BuildingID("parking-1"), capacity=5)
+    site = Site(id=SiteID("site-1"), name="Test Site", activity_rate=10.0)
+    node.add_building(parking)
+    node.add_building(site)
+
+    assert node.get_building(BuildingID("parking-1")) is parking
+    assert node.get_building(SiteID("site-1")) is site
+    assert node.get_building(BuildingID("missing")) is None
+
+    node.remove_building(BuildingID("parking-1"))
+    assert node.get_building(BuildingID("parking-1")) is None
+    assert node.get_buildings() == [site]
+
+
+def test_node_indexes_buildings_passed_to_constructor() -> None:
+    """Test that buildings given at construction are indexed like added ones."""
+    parking = Parking(id=BuildingID("parking-1"), capacity=5)
+    node = Node(id=NodeID(1), x=0.0, y=0.0, buildings=[parking])
+
+    assert node.get_building(BuildingID("parking-1")) is parking
+    assert node.get_buildings_by_type(Parking) == [parking]
+    assert node.get_building_count_by_type(Parking) == 1
+    assert node.has_building_type(Parking)
+
+    node.remove_building(BuildingID("parking-1"))
+    assert node.get_buildings() == []
+    assert not node.has_building_type(Parking)
+    with pytest.raises(KeyError):
+        node.remove_building(BuildingID("parking-1"))
+
+
 def test_node_remove_building_updates_type_index() -> None:
     """Test that removing a building updates the type index."""
     node = Node(id=NodeID(1), x=0.0, y=0.0)
@@ -417,3 +461,79 @@ def test_navigator_no_buildings_of_type() -> None:
 
     assert building_id is None
     assert route is None
+
+
+def test_graph_get_building_nodes_follows_graph_changes() -> None:
+    """Test that the building-type node index is rebuilt after the graph changes."""
+    graph = Graph()
+    node1 = Node(id=NodeID(1), x=0.0, y=0.0)
+    node1.add_building(Parking(id=BuildingID("parking-1"), capacity=5))
+    graph.add_node(node1)
+    graph.add_node(Node(id=NodeID(2), x=1.0, y=0.0))
+
+    assert graph.get_building_nodes(Parking) == (NodeID(1),)
+    assert graph.get_building_nodes(Site) == ()
+
+    graph.nodes[NodeID(2)].add_building(Parking(id=BuildingID("parking-2"), capacity=5))
+    assert graph.get_building_nodes(Parking) == (NodeID(1), NodeID(2))
+
+    graph.remove_node(NodeID(1))
+    assert graph.get_building_nodes(Parking) == (NodeID(2),)
+
+
+def test_graph_has_building_within_uses_straight_line_distance() -> None:
+    """Test that the radius check only counts nodes holding the building type."""
+    graph = Graph()
+    graph.add_node(Node(id=NodeID(1), x=0.0, y=0.0))
+    node2 = Node(id=NodeID(2), x=300.0, y=400.0)
+    node2.add_building(Parking(id=BuildingID("parking-2"), capacity=5))
+    graph.add_node(node2)
+
+    assert graph.has_building_within(Parking, 0.0, 0.0, 500.0)
+    assert not graph.has_building_within(Parking, 0.0, 0.0, 499.0)
+    assert not graph.has_building_within(Site, 300.0, 400.0, 1000.0)
+
+
+def test_graph_roads_cover_straight_line_tracks_edge_lengths() -> None:
+    """Test that a road shorter than the distance between its nodes is detected."""
+    graph = Graph()
+    graph.add_node(Node(id=NodeID(1), x=0.0, y=0.0))
+    graph.add_node(Node(id=NodeID(2), x=300.0, y=400.0))
+    assert graph.roads_cover_straight_line()
+
+    graph.add_edge(
+        Edge(EdgeID(1), NodeID(1), NodeID(2), 500.0, Mode.ROAD, RoadClass.G, 2, 50.0, None)
+    )
+    assert graph.roads_cover_straight_line()
+
+    graph.add_edge(
+        Edge(EdgeID(2), NodeID(2), NodeID(1), 499.0, Mode.ROAD, RoadClass.G, 2, 50.0, None)
+    )
+    assert not graph.roads_cover_straight_line()
+
+    graph.remove_edge(EdgeID(2))
+    assert graph.roads_cover_straight_line()
+
+
+def test_node_building_changes_bump_owning_graph_version() -> None:
+    """Test that adding or removing a building invalidates the graph's caches by itself."""
+    graph = Graph()
+    node = Node(id=NodeID(1), x=0.0, y=0.0)
+    node.add_building(Parking(id=BuildingID("parking-1"), capacity=5))  # not in a graph yet
+    graph.add_node(node)
+    assert graph.get_building_nodes(Parking) == (NodeID(1),)
+
+    version = graph.version
+    node.remove_building(BuildingID("parking-1"))
+    assert graph.version == version + 1
+    assert graph.get_building_nodes(Parking) == ()
+
+    node.add_building(Parking(id=BuildingID("parking-2"), capacity=5))
+    assert graph.version == version + 2
+    assert graph.get_building_nodes(Parking) == (NodeID(1),)
+
+    # A removed node no longer touches the graph
+    graph.remove_node(NodeID(1))
+    version = graph.version
+    node.add_building(Parking(id=BuildingID("parking-3"), capacity=5))
+    assert graph.version == version
@@ -1,14 +1,18 @@
 """Tests for simulation controller."""
 
 import contextlib
+import queue
 import time
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+
+import pytest
 
 from agents.base import AgentBase
-from core.types import AgentID
+from core.types import AgentID, NodeID
 from world.sim.actions.action_parser import ActionRequest
 from world.sim.controller import SimulationController
+from world.sim.dto.truck_dto import TruckStateDTO
 from world.sim.queues import (
     ActionQueue,
     ActionType,
@@ -267,8 +271,8 @@ class TestSimulationController:
         assert self.controller.state.tick_rate == 30.0
         assert self.controller.state.speed == 0.2
         # dt_s should be calculated as speed / tick_rate = 0.2 / 30 = 0.006666...
-        assert abs(self.controller.state.dt_s - (0.2 / 30.0)) < 0.0001
-        assert abs(self.world.dt_s - (0.2 / 30.0)) < 0.0001
+        assert self.controller.state.dt_s == pytest.approx(0.2 / 30.0, abs=0.0001)
+        assert self.world.dt_s == pytest.approx(0.2 / 30.0, abs=0.0001)
 
         # Verify signal was emitted
         assert not self.signal_queue.empty()
@@ -389,6 +393,32 @@ class TestSimulationController:
         assert retrieved_signal.data["time"] == 12.0
         assert retrieved_signal.data["day"] == 1
 
+    def test_dropped_agent_update_requests_full_diff(self) -> None:
+        """Test that a truck resends its complete state after its delta was dropped."""
+        from agents.transports.truck import Truck
+        from world.sim.dto.step_result_dto import StepResultDTO, TickDataDTO
+
+        truck = Truck(id=AgentID("truck-1"), kind="truck", current_node=NodeID(1))
+        truck.serialize_diff()
+        truck.current_node = NodeID(2)
+        delta = truck.serialize_diff()
+        assert delta is not None
+        self.world.agents = {AgentID("truck-1"): truck}
+
+        step_result = StepResultDTO(
+            events=[],
+            agent_diffs=[delta],
+            building_updates=[],
+            tick_data=TickDataDTO(tick=1, time=0.0, day=1),
+        )
+        with patch.object(self.signal_queue, "put", side_effect=queue.Full):
+            self.controller._process_step_result(step_result)
+
+        resync = truck.serialize_diff()
+        assert resync is not None
+        assert list(resync) == list(TruckStateDTO.model_fields)
+        assert resync["current_node"] == NodeID(2)
+
     def test_error_handling(self) -> None:
         """Test error handling in action processing."""
         # Mock world to raise exception
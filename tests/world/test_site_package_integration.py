@@ -333,3 +333,119 @@ class TestSitePackageIntegration:
         site1.update_statistics("expired", 200.0)
         assert site1.statistics.packages_expired == 1
         assert site1.statistics.total_value_expired == 200.0
+
+    def test_building_updates_only_include_dirty_buildings(self) -> None:
+        """Test that building updates are collected from the world's dirty registry."""
+        world = self.create_test_world()
+        site1 = world.graph.nodes[NodeID(1)].buildings[0]
+        assert isinstance(site1, Site)
+
+        # Initial collection registers all buildings; nothing is dirty yet
+        assert world._collect_building_updates() == []
+
+        site1.update_statistics("delivered", 100.0)
+        assert BuildingID("site-1") in world.dirty_buildings
+
+        updates = world._collect_building_updates()
+        assert [update["id"] for update in updates] == ["site-1"]
+        assert world.dirty_buildings == {}
+        assert world._collect_building_updates() == []
+
+    def test_destination_candidates_are_cached_per_site(self) -> None:
+        """Test that spawn destinations reuse one candidate tuple per site."""
+        world = self.create_test_world()
+        site1 = world.graph.nodes[NodeID(1)].buildings[0]
+        assert isinstance(site1, Site)
+
+        candidates = world._get_destination_candidates(site1)
+        assert site1.id not in candidates
+        assert world._get_destination_candidates(site1) is candidates
+
+        # Graph changes rebuild the site cache and drop stale candidates
+        world.graph.mark_changed()
+        assert world._get_destination_candidates(site1) is not candidates
+
+    def test_spawn_packages_creates_one_package_per_due_site(self) -> None:
+        """Test that a spawn batch creates one package per site with a destination."""
+        world = self.create_test_world()
+        sites = world._get_sites()
+
+        world._spawn_packages(sites, current_tick=10)
+
+        origins = sorted(package.origin_site for package in world.packages.values())
+        assert origins == sorted(site.id for site in sites)
+        for site in sites:
+            assert len(site.active_packages) == 1
+            assert site.statistics.packages_generated == 1
+
+    def test_expiry_heap_expires_due_packages_and_skips_stale_entries(self) -> None:
+        """Test that expiry pops due deadlines, drops stale entries and defers orphans."""
+        world = self.create_test_world()
+
+        def make_package(package_id: str, origin: str, deadline: int) -> Package:
+            return Package(
+                id=PackageID(package_id),
+                origin_site=SiteID(origin),
+                destination_site=SiteID("site-2"),
+                size=5.0,
+                value_currency=100.0,
+                priority=Priority.LOW,
+                urgency=DeliveryUrgency.STANDARD,
+                spawn_tick=0,
+                pickup_deadline_tick=deadline,
+                delivery_deadline_tick=deadline + 100,
+            )
+
+        world.add_package(make_package("due", "site-1", 5))
+        world.add_package(make_package("later", "site-1", 50))
+        world.add_package(make_package("orphan", "site-x", 5))
+        # Re-added under the same ID with a later deadline: the old entry is stale
+        world.add_package(make_package("replaced", "site-1", 5))
+        world.packages.pop(PackageID("replaced"))
+        world.add_package(make_package("replaced", "site-1", 60))
+
+        world._expire_packages(current_tick=10)
+
+        assert set(world.packages) == {
+            PackageID("later"),
+            PackageID("orphan"),
+            PackageID("replaced"),
+        }
+        # Orphans stay scheduled; stale and expired entries are gone
+        assert sorted(world._expiry_heap) == [
+            (5, PackageID("orphan")),
+            (50, PackageID("later")),
+            (60, PackageID("replaced")),
+        ]
+
+    def test_spawn_queue_pops_exactly_the_due_sites(self) -> None:
+        """Test that the spawn heap returns the same sites as checking every site."""
+        world = self.create_test_world()
+        sites = world._get_sites()
+        world._pop_due_sites(0)  # builds the queue and first schedules
+
+        for tick in range(1, 300):
+            expected = sorted(site.id for site in sites if site.next_spawn_tick(tick, 1.0) <= tick)
+            due = sorted(site.id for site in world._pop_due_sites(tick))
+            assert due == expected
+            assert all(site.next_spawn_tick(tick, 1.0) > tick for site in sites)
+
+    def test_spawn_queue_is_rebuilt_when_dt_changes(self) -> None:
+        """Test that changing dt_s requeues sites at their rescaled spawn ticks."""
+        world = self.create_test_world()
+        sites = world._get_sites()
+        world.dt_s = 0.05
+        world._pop_due_sites(0)
+
+        world.dt_s = 1.0
+        assert world._spawn_queue is None
+        world._pop_due_sites(1)
+        assert world._spawn_queue is not None
+        assert sorted(entry[0] for entry in world._spawn_queue) == sorted(
+            site.next_spawn_tick(1, 1.0) for site in sites
+        )
+
+        # Setting the same value keeps the queue
+        queue = world._spawn_queue
+        world.dt_s = 1.0
+        assert world._spawn_queue is queue
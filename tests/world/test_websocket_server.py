@@ -6,7 +6,8 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from world.io.websocket_server import ConnectionManager, WebSocketServer
+from core.types import DeliveryUrgency, Priority
+from world.io.websocket_server import ConnectionManager, WebSocketServer, _encode_signal
 from world.sim.actions.action_parser import ActionRequest
 from world.sim.dto.step_result_dto import TickDataDTO
 from world.sim.queues import ActionQueue, ActionType, SignalQueue, create_tick_start_signal
@@ -58,6 +59,44 @@ class TestConnectionManager:
         websocket2.send_text.assert_called_once_with("broadcast message")
 
 
+class TestEncodeSignal:
+    """Test signal JSON encoding."""
+
+    def test_encode_signal_stringifies_non_str_keys(self) -> None:
+        """Test that int keys are stringified at every nesting level."""
+        message = _encode_signal({"signal": "agent.updated", "data": {"agents": [{1: {2: "x"}}]}})
+        assert json.loads(message) == {
+            "signal": "agent.updated",
+            "data": {"agents": [{"1": {"2": "x"}}]},
+        }
+
+    def test_encode_signal_keeps_str_key_format(self) -> None:
+        """Test that enum, None and bool keys are written as str(k), not as orjson renders them."""
+        message = _encode_signal(
+            {
+                "signal": "map.created",
+                "data": {
+                    "priority_weights": {Priority.LOW: 0.4, Priority.URGENT: 0.1},
+                    "urgency_weights": {DeliveryUrgency.STANDARD: 0.6},
+                    "flags": {None: 0, True: 1},
+                },
+            }
+        )
+        assert json.loads(message) == {
+            "signal": "map.created",
+            "data": {
+                "priority_weights": {"Priority.LOW": 0.4, "Priority.URGENT": 0.1},
+                "urgency_weights": {"DeliveryUrgency.STANDARD": 0.6},
+                "flags": {"None": 0, "True": 1},
+            },
+        }
+
+    def test_encode_signal_falls_back_for_unsupported_keys(self) -> None:
+        """Test that keys orjson rejects are converted with str()."""
+        message = _encode_signal({"signal": "event.created", "data": {(1, 2): "edge"}})
+        assert json.loads(message) == {"signal": "event.created", "data": {"(1, 2)": "edge"}}
+
+
 class TestWebSocketServer:
     """Test WebSocketServer functionality."""
 
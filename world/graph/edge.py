@@ -20,7 +20,7 @@ class RoadClass(str, Enum):
     D = "D"  # Droga dojazdowa (Access road)
 
 
-@dataclass
+@dataclass(slots=True)
 class Edge:
     id: EdgeID
     from_node: NodeID
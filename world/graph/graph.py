@@ -1,4 +1,5 @@
 import json
+import math
 import xml.etree.ElementTree as ET
 from typing import Any
 
@@ -7,6 +8,10 @@ from core.types import EdgeID, NodeID
 from world.graph.edge import Edge, Mode, RoadClass
 from world.graph.node import Node
 
+# Edges kept in the edge-addition log before it starts a new epoch; consumers further
+# behind than this rebuild their edge-derived data instead of patching it
+EDGE_LOG_SIZE = 1024
+
 
 class Graph:
     """Graph class that manages nodes and edges for the logistics network."""
@@ -16,6 +21,30 @@ class Graph:
         self.edges: dict[EdgeID, Edge] = {}
         self.out_adj: dict[NodeID, list[EdgeID]] = {}  # node -> outgoing edges
         self.in_adj: dict[NodeID, list[EdgeID]] = {}  # node -> incoming edges
+        self.version = 0  # Bumped on every structural change, used to invalidate search caches
+        # Nodes holding each building type, valid for _building_nodes_version
+        self._building_nodes: dict[type[Building], tuple[NodeID, ...]] = {}
+        self._building_nodes_version = -1
+        # Slowest edge speed limit, valid for _min_edge_speed_version
+        self._min_edge_speed_kph: float | None = None
+        self._min_edge_speed_version = -1
+        # Whether no edge is shorter than the straight line between its nodes,
+        # valid for _roads_cover_straight_line_version
+        self._roads_cover_straight_line = True
+        self._roads_cover_straight_line_version = -1
+        # Edges added since the last edge removal or log overflow (the epoch), so caches
+        # derived from edges can patch in new ones instead of rebuilding while the road
+        # network only grows; capped at EDGE_LOG_SIZE entries
+        self._edge_epoch = 0
+        self._added_edges: list[Edge] = []
+
+    def mark_changed(self) -> None:
+        """Bump the graph version after mutating a node in place.
+
+        Nodes call this themselves when buildings are added or removed; call it after other
+        in-place changes, such as moving a node.
+        """
+        self.version += 1
 
     def add_node(self, node: Node) -> None:
         """Add a node to the graph."""
@@ -25,6 +54,8 @@ class Graph:
         self.nodes[node.id] = node
         self.out_adj[node.id] = []
         self.in_adj[node.id] = []
+        node._graph = self
+        self.version += 1
 
     def add_edge(self, edge: Edge) -> None:
         """Add an edge to the graph."""
@@ -40,6 +71,11 @@ class Graph:
         self.edges[edge.id] = edge
         self.out_adj[edge.from_node].append(edge.id)
         self.in_adj[edge.to_node].append(edge.id)
+        if len(self._added_edges) >= EDGE_LOG_SIZE:
+            self._edge_epoch += 1
+            self._added_edges = []
+        self._added_edges.append(edge)
+        self.version += 1
 
     def remove_node(self, node_id: NodeID) -> None:
         """Remove a node and all its associated edges."""
@@ -56,9 +92,12 @@ class Graph:
             self.remove_edge(edge_id)
 
         # Remove the node
-        del self.nodes[node_id]
+        node = self.nodes.pop(node_id)
+        if node._graph is self:
+            node._graph = None
         del self.out_adj[node_id]
         del self.in_adj[node_id]
+        self.version += 1
 
     def remove_edge(self, edge_id: EdgeID) -> None:
         """Remove an edge from the graph."""
@@ -74,6 +113,9 @@ class Graph:
             self.in_adj[edge.to_node].remove(edge_id)
 
         del self.edges[edge_id]
+        self._edge_epoch += 1
+        self._added_edges = []
+        self.version += 1
 
     def get_node(self, node_id: NodeID) -> Node | None:
         """Get a node by ID."""
@@ -102,6 +144,125 @@ class Graph:
             neighbors.add(edge.from_node)
         return list(neighbors)
 
+    def get_building_nodes(self, building_type: type[Building]) -> tuple[NodeID, ...]:
+        """Get the IDs of nodes that hold at least one building of the given type.
+
+        The index is built lazily per building type and rebuilt after the graph version
+        changes, so repeated queries cost a dictionary lookup.
+
+        Args:
+            building_type: The type of building to look for (e.g., Parking, GasStation)
+
+        Returns:
+            Node IDs in graph insertion order (empty tuple if none)
+        """
+        if self._building_nodes_version != self.version:
+            self._building_nodes.clear()
+            self._building_nodes_version = self.version
+
+        node_ids = self._building_nodes.get(building_type)
+        if node_ids is None:
+            node_ids = tuple(
+                node_id
+                for node_id, node in self.nodes.items()
+                if node.has_building_type(building_type)
+            )
+            self._building_nodes[building_type] = node_ids
+        return node_ids
+
+    def get_min_edge_speed_kph(self) -> float | None:
+        """Get the lowest edge speed limit in the graph.
+
+        Cached until the graph version changes.
+
+        Returns:
+            Slowest ``max_speed_kph`` over all edges, or None if the graph has no edges
+        """
+        if self._min_edge_speed_version != self.version:
+            self._min_edge_speed_kph = min(
+                (edge.max_speed_kph for edge in self.edges.values()), default=None
+            )
+            self._min_edge_speed_version = self.version
+        return self._min_edge_speed_kph
+
+    def roads_cover_straight_line(self) -> bool:
+        """Check that no edge is shorter than the straight line between its nodes.
+
+        Neither ``from_dict`` nor ``from_graphml`` enforces this, e.g. for coordinates that
+        are not in meters. When it holds, no road path is shorter than the straight line
+        between its ends, so ``has_building_within`` can rule out road searches.
+        Cached until the graph version changes.
+
+        Returns:
+            True if every edge's ``length_m`` is at least the distance between its nodes
+        """
+        if self._roads_cover_straight_line_version != self.version:
+            nodes = self.nodes
+            covered = True
+            for edge in self.edges.values():
+                start = nodes[edge.from_node]
+                end = nodes[edge.to_node]
+                if math.hypot(end.x - start.x, end.y - start.y) > edge.length_m:
+                    covered = False
+                    break
+            self._roads_cover_straight_line = covered
+            self._roads_cover_straight_line_version = self.version
+        return self._roads_cover_straight_line
+
+    def has_building_within(
+        self, building_type: type[Building], x: float, y: float, radius_m: float
+    ) -> bool:
+        """Check whether a node holding a building of the type lies within a radius.
+
+        Distance is measured in a straight line. It only bounds the road distance when
+        ``roads_cover_straight_line()`` holds; then a False answer means no such node is
+        reachable by road within ``radius_m`` either.
+
+        Args:
+            building_type: The type of building to look for (e.g., Parking, GasStation)
+            x: X coordinate of the center in meters
+            y: Y coordinate of the center in meters
+            radius_m: Search radius in meters
+
+        Returns:
+            True if at least one matching node lies within the radius
+        """
+        radius_sq = radius_m * radius_m
+        nodes = self.nodes
+        for node_id in self.get_building_nodes(building_type):
+            node = nodes[node_id]
+            dx = node.x - x
+            dy = node.y - y
+            if dx * dx + dy * dy <= radius_sq:
+                return True
+        return False
+
+    def get_edge_log_position(self) -> tuple[int, int]:
+        """Return the current position in the edge-addition log as (epoch, count).
+
+        Pass it to ``get_edges_added_since`` later to learn which edges were added.
+        """
+        return self._edge_epoch, len(self._added_edges)
+
+    def get_edges_added_since(self, position: tuple[int, int]) -> list[Edge] | None:
+        """Get the edges added after a position from ``get_edge_log_position``.
+
+        Node additions and building changes leave existing edges untouched and keep the
+        log going; any edge removal (including through ``remove_node``) starts a new epoch,
+        as does adding an edge once the log holds ``EDGE_LOG_SIZE`` edges.
+
+        Args:
+            position: Earlier (epoch, count) log position
+
+        Returns:
+            Edges added since, in insertion order, or None if a new epoch started since
+            and edge-derived data must be rebuilt
+        """
+        epoch, count = position
+        if epoch != self._edge_epoch:
+            return None
+        return self._added_edges[count:]
+
     def get_node_count(self) -> int:
         """Get the number of nodes in the graph."""
         return len(self.nodes)
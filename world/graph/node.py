@@ -1,10 +1,14 @@
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 from core.buildings.base import Building
 from core.types import BuildingID, NodeID
 
+if TYPE_CHECKING:
+    from world.graph.graph import Graph
 
-@dataclass
+
+@dataclass(slots=True)
 class Node:
     id: NodeID
     x: float
@@ -16,13 +20,31 @@ class Node:
     _building_counts_by_type: dict[type[Building], int] = field(
         default_factory=dict, init=False, repr=False
     )
+    _buildings_by_id: dict[BuildingID, Building] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # Graph this node was added to, whose version is bumped when buildings change
+    _graph: "Graph | None" = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index the buildings passed to the constructor."""
+        for building in self.buildings:
+            self._index_building(building)
 
     def add_building(self, building: Building) -> None:
         """Add a building to this node.
 
-        Maintains the flat list, type-indexed dictionary, and count index for O(1) lookups.
+        Maintains the flat list, type-indexed dictionary, count index, and ID index for
+        O(1) lookups, and bumps the owning graph's version so its search caches reset.
         """
         self.buildings.append(building)
+        self._index_building(building)
+        if self._graph is not None:
+            self._graph.mark_changed()
+
+    def _index_building(self, building: Building) -> None:
+        """Add a building that is already in the flat list to the ID, type and count indices."""
+        self._buildings_by_id[building.id] = building
         # Update type index
         building_type = type(building)
         if building_type not in self._buildings_by_type:
@@ -82,9 +104,13 @@ class Node:
     def remove_building(self, building_id: BuildingID) -> None:
         """Remove a building from this node by ID.
 
-        Updates the flat list, type index, and count index.
+        Updates the flat list, type index, count index, and ID index, and bumps the owning
+        graph's version so its search caches reset.
+
+        Raises:
+            KeyError: If no building with that ID is on this node
         """
-        building = next(b for b in self.buildings if b.id == building_id)
+        building = self._buildings_by_id.pop(building_id)
         self.buildings.remove(building)
         # Update type index
         building_type = type(building)
@@ -99,7 +125,18 @@ class Node:
             # Clean up zero counts
             if self._building_counts_by_type[building_type] <= 0:
                 del self._building_counts_by_type[building_type]
+        if self._graph is not None:
+            self._graph.mark_changed()
 
-    def get_building(self, building_id: BuildingID) -> Building:
-        """Get a building by ID."""
-        return next(building for building in self.buildings if building.id == building_id)
+    def get_building(self, building_id: BuildingID) -> Building | None:
+        """Get a building by ID.
+
+        O(1) access using ID index.
+
+        Args:
+            building_id: ID of the building to retrieve
+
+        Returns:
+            The building, or None if no building with that ID is on this node
+        """
+        return self._buildings_by_id.get(building_id)
@@ -85,6 +85,28 @@ def _ensure_str_keys(obj: Any) -> Any:
     return obj
 
 
+def _has_non_str_keys(obj: Any) -> bool:
+    """Check whether any dict at any nesting level has a key that is not a ``str``."""
+    if isinstance(obj, dict):
+        return any(type(k) is not str or _has_non_str_keys(v) for k, v in obj.items())
+    if isinstance(obj, list | tuple):
+        return any(_has_non_str_keys(v) for v in obj)
+    return False
+
+
+def _encode_signal(signal_dict: dict[str, Any]) -> str:
+    """Encode a dumped signal to JSON text.
+
+    Non-str keys are written as ``str(k)`` (e.g. ``"Priority.LOW"``, ``"None"``, ``"True"``),
+    which is part of the wire protocol. orjson's OPT_NON_STR_KEYS would write enum values and
+    JSON literals instead, so payloads with such keys still go through the ``_ensure_str_keys``
+    copy; the common all-str payload is checked without copying and encoded as-is.
+    """
+    if _has_non_str_keys(signal_dict):
+        signal_dict = _ensure_str_keys(signal_dict)
+    return orjson.dumps(signal_dict).decode()
+
+
 class WebSocketServer:
     """WebSocket server for Frontend-Backend communication (Actions ↔ Signals)."""
 
@@ -249,11 +271,8 @@ class WebSocketServer:
                     await asyncio.sleep(0.01)  # Short sleep to avoid busy waiting
                     continue
 
-                # Convert signal to JSON (ensure all dict keys are strings)
-                # Signal.model_dump() already returns {"signal": "...", "data": {...}}
-                signal_dict = signal.model_dump()
-                safe_signal_dict = _ensure_str_keys(signal_dict)
-                message = orjson.dumps(safe_signal_dict, option=orjson.OPT_NON_STR_KEYS).decode()
+                # Convert signal to JSON; Signal.model_dump() returns {"signal": "...", "data": {...}}
+                message = _encode_signal(signal.model_dump())
 
                 # Broadcast to all connected clients
                 await self.manager.broadcast(message)
@@ -365,10 +384,7 @@ class WebSocketServer:
                 )
             map_signal = create_map_created_signal(map_data)
             await self.manager.send_personal_message(
-                orjson.dumps(
-                    _ensure_str_keys(map_signal.model_dump()),
-                    option=orjson.OPT_NON_STR_KEYS,
-                ).decode(),
+                _encode_signal(map_signal.model_dump()),
                 websocket,
             )
             self.logger.info("Sent map.created signal")
@@ -383,10 +399,7 @@ class WebSocketServer:
                 tick=self.controller.state.current_tick,
             )
             await self.manager.send_personal_message(
-                orjson.dumps(
-                    _ensure_str_keys(agent_listed_signal.model_dump()),
-                    option=orjson.OPT_NON_STR_KEYS,
-                ).decode(),
+                _encode_signal(agent_listed_signal.model_dump()),
                 websocket,
             )
             self.logger.info(f"Sent agent.listed signal with {len(agents_data)} agents")
@@ -1,5 +1,6 @@
 """Node matching criteria for generalized graph search."""
 
+from collections.abc import Set
 from enum import Enum
 from typing import Any, Protocol
 
@@ -54,7 +55,7 @@ class BuildingTypeCriteria:
     """
 
     def __init__(
-        self, building_type: type[Building], exclude_buildings: set[BuildingID] | None = None
+        self, building_type: type[Building], exclude_buildings: Set[BuildingID] | None = None
     ) -> None:
         """Initialize building type criteria.
 
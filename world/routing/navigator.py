@@ -2,6 +2,8 @@
 
 import heapq
 import math
+from collections import OrderedDict
+from collections.abc import Iterable
 from typing import Any
 
 from core.buildings.base import Building
@@ -10,6 +12,11 @@ from world.graph.edge import Edge
 from world.graph.graph import Graph
 from world.routing.criteria import NodeCriteria
 
+# Upper bound on memoized point-to-point routes; least recently used ones are evicted first
+ROUTE_CACHE_SIZE = 10_000
+# Upper bound on memoized per-destination cost maps, each holding one entry per node
+DIST_TO_DEST_CACHE_SIZE = 256
+
 
 class Navigator:
     """Provides A* pathfinding for agents navigating the graph network."""
@@ -24,6 +31,24 @@ class Navigator:
         self._node_cache: dict[
             tuple[str, NodeID], list[tuple[NodeID, Any, list[NodeID], float]]
         ] = {}
+        # LRU cache: (destination, max_speed_kph) -> reverse Dijkstra costs to that
+        # destination, valid for the graph identity and version recorded alongside it
+        self._dist_to_dest_cache: OrderedDict[tuple[NodeID, float], dict[NodeID, float]] = (
+            OrderedDict()
+        )
+        self._dist_to_dest_graph: tuple[Graph, int] | None = None
+        # LRU cache: (start, goal, max_speed_kph) -> A* route, valid for the graph identity
+        # and version recorded alongside it
+        self._route_cache: OrderedDict[tuple[NodeID, NodeID, float], list[NodeID]] = OrderedDict()
+        self._route_cache_graph: tuple[Graph, int] | None = None
+        self._route_cache_hits = 0
+        self._route_cache_misses = 0
+        # Cache: (max_speed_kph, reverse) -> per-node (neighbor, edge cost) lists for the
+        # graph recorded alongside it, current as of the recorded version and edge log position
+        self._adjacency_cache: dict[
+            tuple[float, bool], dict[NodeID, list[tuple[NodeID, float]]]
+        ] = {}
+        self._adjacency_graph: tuple[Graph, int, tuple[int, int]] | None = None
 
     def find_route(
         self, start: NodeID, goal: NodeID, graph: Graph, max_speed_kph: float
@@ -44,6 +69,49 @@ class Navigator:
             - Cost function: edge.length_m / min(edge.max_speed_kph, max_speed_kph)
             - Heuristic: Euclidean distance / max_speed_kph
             - Time-based routing that respects both edge and agent speed limits
+            - Routes are memoized in a bounded LRU cache until the graph changes;
+              callers receive their own copy
+        """
+        cached_for = self._route_cache_graph
+        if cached_for is None or cached_for[0] is not graph or cached_for[1] != graph.version:
+            self._route_cache.clear()
+            self._route_cache_graph = (graph, graph.version)
+
+        key = (start, goal, max_speed_kph)
+        route = self._route_cache.get(key)
+        if route is not None:
+            self._route_cache.move_to_end(key)
+            self._route_cache_hits += 1
+            return list(route)
+
+        self._route_cache_misses += 1
+        route = self._a_star(start, goal, graph, max_speed_kph)
+        self._route_cache[key] = route
+        if len(self._route_cache) > ROUTE_CACHE_SIZE:
+            self._route_cache.popitem(last=False)
+        return list(route)
+
+    def route_cache_stats(self) -> dict[str, int]:
+        """Return hit, miss and size counters of the point-to-point route cache."""
+        return {
+            "hits": self._route_cache_hits,
+            "misses": self._route_cache_misses,
+            "size": len(self._route_cache),
+        }
+
+    def _a_star(
+        self, start: NodeID, goal: NodeID, graph: Graph, max_speed_kph: float
+    ) -> list[NodeID]:
+        """Run A* from start to goal without consulting the route cache.
+
+        Args:
+            start: Starting node ID
+            goal: Destination node ID
+            graph: Graph to navigate
+            max_speed_kph: Maximum speed of the agent
+
+        Returns:
+            List of NodeIDs from start to goal (inclusive), or empty list if no path exists
         """
         # Edge case: start equals goal
         if start == goal:
@@ -79,6 +147,7 @@ class Navigator:
 
         # Track nodes in open set for efficient membership testing
         open_set_members: set[NodeID] = {start}
+        adjacency = self._get_cost_adjacency(graph, max_speed_kph)
 
         while open_set:
             # Get node with lowest f_score
@@ -97,11 +166,8 @@ class Navigator:
 
             # Explore neighbors
             current_g = g_score[current]
-            for edge in graph.get_outgoing_edges(current):
-                neighbor = edge.to_node
-
-                # Calculate cost to reach neighbor through current
-                edge_cost = self._calculate_edge_cost(edge, max_speed_kph)
+            for neighbor, edge_cost in adjacency.get(current, ()):
+                # Cost to reach neighbor through current
                 tentative_g = current_g + edge_cost
 
                 # If this path to neighbor is better than any previous one
@@ -210,6 +276,31 @@ class Navigator:
         time_hours = self._calculate_route_cost(route, graph, max_speed_kph)
         return time_hours * 3600.0
 
+    def estimate_travel_times_to_s(
+        self, starts: Iterable[NodeID], goal: NodeID, graph: Graph, max_speed_kph: float
+    ) -> list[float]:
+        """Estimate travel times from several start nodes to one goal in seconds.
+
+        All starts share one reverse Dijkstra from the goal, which stays cached until the
+        graph changes, so repeated estimates toward the same site are dictionary lookups
+        instead of an A* search each.
+
+        Args:
+            starts: Starting node IDs
+            goal: Destination node ID
+            graph: Graph to navigate
+            max_speed_kph: Maximum speed of the agent
+
+        Returns:
+            Travel time in seconds per start, in order. float('inf') where no route exists.
+        """
+        if goal not in graph.nodes:
+            return [float("inf") for _ in starts]
+
+        dist_to_goal = self._get_dist_to_dest(goal, graph, max_speed_kph)
+        inf = float("inf")
+        return [dist_to_goal.get(start, inf) * 3600.0 for start in starts]
+
     def estimate_route_travel_time_s(
         self, route: list[NodeID], graph: Graph, max_speed_kph: float
     ) -> float:
@@ -234,17 +325,20 @@ class Navigator:
         graph: Graph,
         max_speed_kph: float,
         criteria: NodeCriteria,
+        max_cost: float | None = None,
     ) -> tuple[NodeID | None, Any | None, list[NodeID] | None]:
         """Find the closest node that satisfies the given criteria using Dijkstra.
 
         Performs single shortest-path tree expansion from start, stopping at the
-        first node that matches the criteria.
+        first node that matches the criteria or once the search frontier passes
+        ``max_cost``.
 
         Args:
             start: Starting node ID
             graph: Graph to navigate
             max_speed_kph: Maximum speed of the agent
             criteria: Node matching criteria
+            max_cost: Optional cost bound in hours; matches beyond it are not returned
 
         Returns:
             Tuple of (node_id, matched_item, route) or (None, None, None) if no match found
@@ -254,6 +348,7 @@ class Navigator:
 
         Complexity:
             O(E log V) in worst case, typically much faster as it stops at first match
+            or at the cost bound
         """
         # Validate start node exists
         if start not in graph.nodes:
@@ -268,7 +363,9 @@ class Navigator:
         cache_key = (criteria.cache_key(), start)
         if cache_key in self._node_cache:
             # Try cached nodes in order of cost
-            for node_id, _cached_item, route, _ in self._node_cache[cache_key]:
+            for node_id, _cached_item, route, cached_cost in self._node_cache[cache_key]:
+                if max_cost is not None and cached_cost > max_cost:
+                    break
                 # Re-validate the match (criteria might have changed exclude sets)
                 matches, matched_item = criteria.matches(graph.nodes[node_id], graph)
                 if matches:
@@ -288,11 +385,16 @@ class Navigator:
 
         # Track visited nodes
         visited: set[NodeID] = set()
+        adjacency = self._get_cost_adjacency(graph, max_speed_kph)
 
         while open_set:
             # Get node with lowest cost
             current_cost, _, current = heapq.heappop(open_set)
 
+            # Every remaining node is at least this far away
+            if max_cost is not None and current_cost > max_cost:
+                break
+
             # Skip if already visited
             if current in visited:
                 continue
@@ -320,14 +422,11 @@ class Navigator:
                 return current, matched_item, path
 
             # Explore neighbors
-            for edge in graph.get_outgoing_edges(current):
-                neighbor = edge.to_node
-
+            for neighbor, edge_cost in adjacency.get(current, ()):
                 if neighbor in visited:
                     continue
 
-                # Calculate cost to reach neighbor
-                edge_cost = self._calculate_edge_cost(edge, max_speed_kph)
+                # Cost to reach neighbor
                 tentative_cost = current_cost + edge_cost
 
                 # If this path is better than any previous one
@@ -347,6 +446,7 @@ class Navigator:
         graph: Graph,
         max_speed_kph: float,
         criteria: NodeCriteria,
+        max_cost: float | None = None,
     ) -> tuple[NodeID | None, Any | None, list[NodeID] | None]:
         """Find the closest node satisfying criteria that minimizes S→node→destination cost.
 
@@ -359,6 +459,8 @@ class Navigator:
             graph: Graph to navigate
             max_speed_kph: Maximum speed of the agent
             criteria: Node matching criteria
+            max_cost: Optional bound in hours on the start→node cost; nodes beyond it
+                are not considered
 
         Returns:
             Tuple of (node_id, matched_item, route) or (None, None, None) if no match found
@@ -367,7 +469,9 @@ class Navigator:
             - route: List of NodeIDs from start to node_id (inclusive)
 
         Complexity:
-            O(E log V) for two Dijkstra runs (forward + backward)
+            O(E log V) for two Dijkstra runs (forward + backward); the backward run is
+            cached per destination and speed, so repeated searches toward the same
+            destination only pay for the forward run
         """
         # Validate nodes exist
         if start not in graph.nodes or destination not in graph.nodes:
@@ -375,7 +479,7 @@ class Navigator:
 
         # Phase A: Reverse Dijkstra from destination
         # Build dist_to_dest[v] = optimal cost from node v to destination
-        dist_to_dest = self._reverse_dijkstra(destination, graph, max_speed_kph)
+        dist_to_dest = self._get_dist_to_dest(destination, graph, max_speed_kph)
 
         # Phase B: Forward Dijkstra from start, evaluating total cost S→node→dest
         # Priority queue: (cost_from_start, counter, node_id)
@@ -396,6 +500,8 @@ class Navigator:
         best_node: NodeID | None = None
         best_matched_item: Any | None = None
         best_total_cost = float("inf")
+        cost_limit = float("inf") if max_cost is None else max_cost
+        adjacency = self._get_cost_adjacency(graph, max_speed_kph)
 
         # Check if start node matches
         if start in dist_to_dest:
@@ -412,8 +518,9 @@ class Navigator:
             current_g, _, current = heapq.heappop(open_set)
 
             # Early stopping: if current g_score >= best total cost found,
-            # remaining nodes can't improve the solution
-            if current_g >= best_total_cost:
+            # remaining nodes can't improve the solution; past the cost limit
+            # no remaining node may be considered
+            if current_g >= best_total_cost or current_g > cost_limit:
                 break
 
             # Skip if already visited
@@ -433,14 +540,11 @@ class Navigator:
                         best_total_cost = total_cost
 
             # Explore neighbors
-            for edge in graph.get_outgoing_edges(current):
-                neighbor = edge.to_node
-
+            for neighbor, edge_cost in adjacency.get(current, ()):
                 if neighbor in visited:
                     continue
 
-                # Calculate cost from start to neighbor
-                edge_cost = self._calculate_edge_cost(edge, max_speed_kph)
+                # Cost from start to neighbor
                 tentative_g = current_g + edge_cost
 
                 # If this path is better than any previous one
@@ -464,6 +568,39 @@ class Navigator:
 
         return best_node, best_matched_item, path
 
+    def _get_dist_to_dest(
+        self, destination: NodeID, graph: Graph, max_speed_kph: float
+    ) -> dict[NodeID, float]:
+        """Return cached reverse Dijkstra costs to destination, recomputing after graph changes.
+
+        At most ``DIST_TO_DEST_CACHE_SIZE`` cost maps are kept; the least recently used
+        one is evicted first.
+
+        Args:
+            destination: Destination node ID
+            graph: Graph to navigate
+            max_speed_kph: Maximum speed of the agent
+
+        Returns:
+            Dictionary mapping node_id -> cost to reach destination (read-only)
+        """
+        cached_for = self._dist_to_dest_graph
+        if cached_for is None or cached_for[0] is not graph or cached_for[1] != graph.version:
+            self._dist_to_dest_cache.clear()
+            self._dist_to_dest_graph = (graph, graph.version)
+
+        key = (destination, max_speed_kph)
+        dist_to_dest = self._dist_to_dest_cache.get(key)
+        if dist_to_dest is not None:
+            self._dist_to_dest_cache.move_to_end(key)
+            return dist_to_dest
+
+        dist_to_dest = self._reverse_dijkstra(destination, graph, max_speed_kph)
+        self._dist_to_dest_cache[key] = dist_to_dest
+        if len(self._dist_to_dest_cache) > DIST_TO_DEST_CACHE_SIZE:
+            self._dist_to_dest_cache.popitem(last=False)
+        return dist_to_dest
+
     def _reverse_dijkstra(
         self, destination: NodeID, graph: Graph, max_speed_kph: float
     ) -> dict[NodeID, float]:
@@ -489,6 +626,7 @@ class Navigator:
 
         # Track visited nodes
         visited: set[NodeID] = set()
+        adjacency = self._get_cost_adjacency(graph, max_speed_kph, reverse=True)
 
         while open_set:
             current_cost, _, current = heapq.heappop(open_set)
@@ -499,14 +637,11 @@ class Navigator:
             visited.add(current)
 
             # Explore incoming edges (reverse direction)
-            for edge in graph.get_incoming_edges(current):
-                neighbor = edge.from_node
-
+            for neighbor, edge_cost in adjacency.get(current, ()):
                 if neighbor in visited:
                     continue
 
-                # Calculate cost from neighbor to destination (through current)
-                edge_cost = self._calculate_edge_cost(edge, max_speed_kph)
+                # Cost from neighbor to destination (through current)
                 tentative_cost = current_cost + edge_cost
 
                 # If this path is better than any previous one
@@ -517,6 +652,77 @@ class Navigator:
 
         return dist_to_dest
 
+    def _get_cost_adjacency(
+        self, graph: Graph, max_speed_kph: float, reverse: bool = False
+    ) -> dict[NodeID, list[tuple[NodeID, float]]]:
+        """Return each node's neighbors with precomputed edge costs for the search loops.
+
+        Built once per agent speed and direction, so relaxing an edge is a tuple unpack
+        instead of resolving the Edge objects and recomputing their cost on every search.
+        Edges added to the graph afterwards are appended in place; only an edge removal
+        or a different graph forces a rebuild.
+
+        Args:
+            graph: Graph to navigate
+            max_speed_kph: Maximum speed of the agent
+            reverse: Follow incoming edges (neighbor is the edge's source) instead
+
+        Returns:
+            Dictionary mapping node_id -> list of (neighbor, cost in hours) (read-only)
+        """
+        cached_for = self._adjacency_graph
+        if cached_for is None or cached_for[0] is not graph or cached_for[1] != graph.version:
+            added_edges = (
+                graph.get_edges_added_since(cached_for[2])
+                if cached_for is not None and cached_for[0] is graph
+                else None
+            )
+            if added_edges is None:
+                self._adjacency_cache.clear()
+            elif added_edges:
+                self._patch_cost_adjacency(added_edges)
+            self._adjacency_graph = (graph, graph.version, graph.get_edge_log_position())
+
+        key = (max_speed_kph, reverse)
+        adjacency = self._adjacency_cache.get(key)
+        if adjacency is None:
+            calculate_edge_cost = self._calculate_edge_cost
+            if reverse:
+                adjacency = {
+                    node_id: [
+                        (edge.from_node, calculate_edge_cost(edge, max_speed_kph))
+                        for edge in graph.get_incoming_edges(node_id)
+                    ]
+                    for node_id in graph.nodes
+                }
+            else:
+                adjacency = {
+                    node_id: [
+                        (edge.to_node, calculate_edge_cost(edge, max_speed_kph))
+                        for edge in graph.get_outgoing_edges(node_id)
+                    ]
+                    for node_id in graph.nodes
+                }
+            self._adjacency_cache[key] = adjacency
+        return adjacency
+
+    def _patch_cost_adjacency(self, added_edges: list[Edge]) -> None:
+        """Append newly added edges to every cached cost adjacency.
+
+        Edges are appended in insertion order, matching the adjacency a full rebuild
+        would produce.
+
+        Args:
+            added_edges: Edges added to the graph since the adjacencies were current
+        """
+        for (max_speed_kph, reverse), adjacency in self._adjacency_cache.items():
+            for edge in added_edges:
+                edge_cost = self._calculate_edge_cost(edge, max_speed_kph)
+                if reverse:
+                    adjacency.setdefault(edge.to_node, []).append((edge.from_node, edge_cost))
+                else:
+                    adjacency.setdefault(edge.from_node, []).append((edge.to_node, edge_cost))
+
     def _calculate_edge_cost(self, edge: Edge, max_speed_kph: float) -> float:
         """Calculate the time cost to traverse an edge.
 
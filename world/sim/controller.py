@@ -247,11 +247,15 @@ class SimulationController:
         # Emit agent updates
         if step_result.has_agent_updates():
             for agent_diff in step_result.get_agent_diffs():
-                self._emit_signal(
-                    create_agent_update_signal(
-                        agent_diff.get("id", "unknown"), agent_diff, self.state.current_tick
-                    )
-                )
+                agent_id = agent_diff.get("id", "unknown")
+                if not self._emit_signal(
+                    create_agent_update_signal(agent_id, agent_diff, self.state.current_tick)
+                ):
+                    # Agents sending deltas resend their complete state next tick, so a
+                    # dropped delta does not leave clients stale
+                    agent = self.world.agents.get(agent_id)
+                    if agent is not None and hasattr(agent, "request_full_diff"):
+                        agent.request_full_diff()
 
         # Emit building updates
         if step_result.has_building_updates():
@@ -321,12 +325,18 @@ class SimulationController:
             # Generic world event
             self._emit_signal(create_world_event_signal(event, self.state.current_tick))
 
-    def _emit_signal(self, signal: Signal) -> None:
-        """Emit a signal to the signal queue."""
+    def _emit_signal(self, signal: Signal) -> bool:
+        """Emit a signal to the signal queue.
+
+        Returns:
+            True if the signal was queued, False if it was dropped
+        """
         try:
             self.signal_queue.put(signal, timeout=1.0)
         except Exception as e:
             self.logger.error(f"Failed to emit signal: {e}")
+            return False
+        return True
 
     def _emit_error(self, error_message: str) -> None:
         """Emit an error signal."""
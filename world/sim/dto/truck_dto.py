@@ -8,7 +8,7 @@ This module defines DTOs for truck management:
 Only changes to watch fields trigger diff emission, but diffs always contain all fields.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -95,7 +95,7 @@ class TruckCreateDTO(BaseModel):
         )
 
 
-class TruckWatchFieldsDTO(BaseModel):
+class TruckWatchFieldsDTO(NamedTuple):
     """DTO for truck fields that trigger serialization when changed.
 
     These are position and navigation fields that represent meaningful state
@@ -114,9 +114,12 @@ class TruckWatchFieldsDTO(BaseModel):
 
     Note: fuel_level is NOT a watch field - it changes continuously but updates
     are only sent when other watch fields change.
-    """
 
-    model_config = ConfigDict(frozen=True)
+    A NamedTuple rather than a Pydantic model: it documents the layout of the plain
+    tuple Truck.serialize_diff builds and compares for every truck on every tick, where
+    tuple equality runs in C with identity short-circuits for the memoized route and
+    package tuples.
+    """
 
     current_node: NodeID | None
     current_edge: EdgeID | None
@@ -133,7 +136,10 @@ class TruckStateDTO(BaseModel):
 
     Contains all truck fields including watch fields (position/navigation)
     and non-watch fields (tachograph counters, fuel levels, metadata). This is the
-    complete state snapshot sent to the frontend when watch fields change.
+    complete state snapshot sent to the frontend with a truck's first diff; later diffs
+    carry id, kind and only the fields that changed since, for the client to merge.
+    Truck.serialize_diff emits the payload as a plain dict in this field order
+    instead of validating and dumping the model on every diff.
 
     Fields:
         id: Agent unique identifier
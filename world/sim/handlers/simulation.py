@@ -5,6 +5,8 @@ import binascii
 import json
 from typing import Any
 
+import orjson
+
 from world.sim.dto.simulation_dto import SimulationParamsDTO
 
 from ..queues import (
@@ -174,9 +176,11 @@ class SimulationActionHandler:
             # Export complete world state
             state_data = context.world.get_full_state()
 
-            # Convert to JSON and encode to base64
-            json_str = json.dumps(state_data, indent=2)
-            file_content_base64 = base64.b64encode(json_str.encode("utf-8")).decode("ascii")
+            # Convert to JSON and encode to base64; orjson emits UTF-8 bytes directly
+            json_bytes = orjson.dumps(
+                state_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+            file_content_base64 = base64.b64encode(json_bytes).decode("ascii")
 
             _emit_signal(
                 context,
@@ -1,4 +1,6 @@
+import heapq
 import random
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
@@ -8,7 +10,7 @@ if TYPE_CHECKING:
 from core.buildings.base import Building
 from core.buildings.site import Site
 from core.packages.package import Package
-from core.types import AgentID, NodeID, PackageID, SiteID
+from core.types import AgentID, BuildingID, NodeID, PackageID, SiteID
 from world.io import map_manager
 from world.routing.navigator import Navigator
 from world.sim.dto.step_result_dto import StepResultDTO, TickDataDTO
@@ -22,6 +24,12 @@ DEFAULT_FUEL_VOLATILITY = 0.1  # ±10% daily change
 SIMULATION_START_HOUR = 12  # Simulation starts at 12:00 (noon)
 SIMULATION_START_SECONDS = SIMULATION_START_HOUR * 3600  # 43200 seconds (12:00)
 
+# (start node, destination, max speed, excluded parkings) -> (parking ID, route)
+ParkingSearchKey = tuple[NodeID, NodeID | None, float, frozenset[BuildingID]]
+ParkingSearchResult = tuple[BuildingID | None, tuple[NodeID, ...] | None]
+# Upper bound on shared closest-parking results; least recently used ones are evicted first
+CLOSEST_PARKING_CACHE_SIZE = 10_000
+
 
 class World:
     def __init__(
@@ -38,18 +46,53 @@ class World:
         # Ensure router is Navigator instance
         self.router = router if router is not None else Navigator()
         self.traffic = traffic
-        self.dt_s = dt_s
+        self._dt_s = dt_s
         self.tick = 0
         self.agents: dict[AgentID, AgentBase] = {}  # AgentID -> AgentBase
         self.packages: dict[PackageID, Package] = {}  # PackageID -> Package
+        # Min-heap of (pickup_deadline_tick, package_id); stale entries are skipped on pop
+        self._expiry_heap: list[tuple[int, PackageID]] = []
         self._events: list[Any] = []
         self.generation_params = generation_params  # Store generation params if available
 
+        # Buildings marked dirty since the last diff collection, filled by Building.mark_dirty
+        self.dirty_buildings: dict[BuildingID, Building] = {}
+        self._dirty_tracking_graph: tuple[Any, int] | None = None
+
+        # All sites in the graph, valid for one graph object at one version
+        self._site_cache: tuple[Any, int, list[Site]] | None = None
+        # Per-site destination candidates (all other sites), reset with the site cache
+        self._destination_candidates: dict[BuildingID, tuple[SiteID, ...]] = {}
+        # Sites keyed by ID (first occurrence wins), rebuilt with the site cache
+        self._sites_by_id: dict[SiteID, Site] = {}
+        # Min-heap of (next_spawn_tick, site index, site), rebuilt with the site cache
+        # and whenever dt_s changes
+        self._spawn_queue: list[tuple[float, int, Site]] | None = None
+
+        # LRU of closest-parking search results, valid for one graph object at one version
+        self._closest_parking_cache: OrderedDict[ParkingSearchKey, ParkingSearchResult] = (
+            OrderedDict()
+        )
+        self._closest_parking_cache_graph: tuple[Any, int] | None = None
+
         # Global fuel price management
         self.global_fuel_price = global_fuel_price
         self.fuel_price_volatility = fuel_price_volatility
         self._last_fuel_price_day = -1  # Initialize to -1 so first tick triggers update
 
+    @property
+    def dt_s(self) -> float:
+        """Simulated seconds per tick."""
+        return self._dt_s
+
+    @dt_s.setter
+    def dt_s(self, value: float) -> None:
+        # The spawn queue is keyed by ticks computed with the old tick length; rebuilding
+        # it lets each site rescale its pending spawn (Site.next_spawn_tick)
+        if value != self._dt_s:
+            self._spawn_queue = None
+        self._dt_s = value
+
     def now_s(self) -> int:
         return int(self.tick * self.dt_s)
 
@@ -92,6 +135,9 @@ class World:
         import logging
 
         logger = logging.getLogger(__name__)
+        # Per-agent debug messages are only formatted when debug logging is on; with many
+        # trucks the f-strings alone cost more than an idle agent's decide()
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         try:
             logger.debug(f"World.step() starting for tick {self.tick + 1}")
@@ -103,11 +149,17 @@ class World:
 
             # 1) sense (optional)
             logger.debug(f"Tick {self.tick}: Starting perceive phase for {len(self.agents)} agents")
-            for idx, (agent_id, a) in enumerate(self.agents.items()):
+            # The per-agent loops run for the whole fleet every tick, so the position
+            # counter for debug output is only maintained when debug logging is on
+            idx = 0
+            for agent_id, a in self.agents.items():
                 try:
-                    logger.debug(
-                        f"Tick {self.tick}: Agent {idx + 1}/{len(self.agents)} ({agent_id}) perceiving"
-                    )
+                    if debug:
+                        idx += 1
+                        logger.debug(
+                            f"Tick {self.tick}: Agent {idx}/{len(self.agents)} ({agent_id}) "
+                            "perceiving"
+                        )
                     a.perceive(self)
                 except Exception as e:
                     logger.error(
@@ -129,13 +181,18 @@ class World:
 
             # 4) decide/act
             logger.debug(f"Tick {self.tick}: Starting decide phase for {len(self.agents)} agents")
-            for idx, (agent_id, a) in enumerate(self.agents.items()):
+            idx = 0
+            for agent_id, a in self.agents.items():
                 try:
-                    logger.debug(
-                        f"Tick {self.tick}: Agent {idx + 1}/{len(self.agents)} ({agent_id}) deciding"
-                    )
+                    if debug:
+                        idx += 1
+                        logger.debug(
+                            f"Tick {self.tick}: Agent {idx}/{len(self.agents)} ({agent_id}) "
+                            "deciding"
+                        )
                     a.decide(self)
-                    logger.debug(f"Tick {self.tick}: Agent {agent_id} decide completed")
+                    if debug:
+                        logger.debug(f"Tick {self.tick}: Agent {agent_id} decide completed")
                 except Exception as e:
                     logger.error(
                         f"Tick {self.tick}: Error in agent {agent_id}.decide(): {e}", exc_info=True
@@ -146,9 +203,10 @@ class World:
             # 5) collect UI diffs
             logger.debug(f"Tick {self.tick}: Collecting agent diffs")
             diffs = [a.serialize_diff() for a in self.agents.values()]
-            logger.debug(
-                f"Tick {self.tick}: Collected {len([d for d in diffs if d])} non-None diffs"
-            )
+            if debug:
+                logger.debug(
+                    f"Tick {self.tick}: Collected {len([d for d in diffs if d])} non-None diffs"
+                )
 
             # 6) collect building updates (only dirty buildings)
             logger.debug(f"Tick {self.tick}: Collecting building updates")
@@ -198,7 +256,10 @@ class World:
 
         agent = self.agents[agent_id]
         for key, value in modifications.items():
-            if hasattr(agent, key):
+            if key == "loaded_packages" and hasattr(agent, "set_loaded_packages"):
+                # Raw JSON list; trucks keep a dict and a running loaded size
+                agent.set_loaded_packages(value)
+            elif hasattr(agent, key):
                 setattr(agent, key, value)
             else:
                 # Store in tags for arbitrary metadata
@@ -213,6 +274,7 @@ class World:
         if package.id in self.packages:
             raise ValueError(f"Package {package.id} already exists")
         self.packages[package.id] = package
+        heapq.heappush(self._expiry_heap, (package.pickup_deadline_tick, package.id))
         self.emit_event(
             {"type": "package_created", "package_id": package.id, "data": package.to_dict()}
         )
@@ -240,6 +302,41 @@ class World:
             raise ValueError(f"Package {package_id} does not exist")
         return self.packages[package_id]
 
+    def get_closest_parking_cache(self) -> OrderedDict[ParkingSearchKey, ParkingSearchResult]:
+        """Get the closest-parking search cache, clearing it if the graph has changed.
+
+        Read and write it through ``lookup_closest_parking`` and ``store_closest_parking``,
+        which keep it within ``CLOSEST_PARKING_CACHE_SIZE`` entries.
+
+        Returns:
+            Cache shared by all trucks, keyed by search parameters, oldest entries first
+        """
+        graph = self.graph
+        cached_for = self._closest_parking_cache_graph
+        if cached_for is None or cached_for[0] is not graph or cached_for[1] != graph.version:
+            self._closest_parking_cache.clear()
+            self._closest_parking_cache_graph = (graph, graph.version)
+        return self._closest_parking_cache
+
+    def lookup_closest_parking(self, key: ParkingSearchKey) -> ParkingSearchResult | None:
+        """Get a cached closest-parking search result, marking it as recently used.
+
+        Returns:
+            The stored (parking ID, route) result, or None if the search is not cached
+        """
+        cache = self.get_closest_parking_cache()
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+        return result
+
+    def store_closest_parking(self, key: ParkingSearchKey, result: ParkingSearchResult) -> None:
+        """Cache a closest-parking search result, evicting the least recently used one if full."""
+        cache = self.get_closest_parking_cache()
+        cache[key] = result
+        if len(cache) > CLOSEST_PARKING_CACHE_SIZE:
+            cache.popitem(last=False)
+
     def get_site_node(self, site_id: SiteID) -> NodeID | None:
         """Get the node ID where a site is located.
 
@@ -250,8 +347,8 @@ class World:
             NodeID where the site is located, or None if not found
         """
         for node_id_raw, node in self.graph.nodes.items():
-            for building in node.buildings:
-                if isinstance(building, Site) and building.id == site_id:
+            for building in node.get_buildings_by_type(Site):
+                if building.id == site_id:
                     return cast(NodeID, node_id_raw)
         return None
 
@@ -367,6 +464,10 @@ class World:
             for package_data in state_data["packages"]:
                 package = Package.from_dict(package_data)
                 self.packages[package.id] = package
+            self._expiry_heap = [
+                (package.pickup_deadline_tick, package.id) for package in self.packages.values()
+            ]
+            heapq.heapify(self._expiry_heap)
 
             # Restore agents
             # Import here to avoid circular import
@@ -395,109 +496,158 @@ class World:
         except Exception as e:
             raise ValueError(f"Failed to restore state: {e}") from e
 
+    def _get_sites(self) -> list[Site]:
+        """Get all sites in the graph, rebuilt only when the graph changes."""
+        graph = self.graph
+        cached = self._site_cache
+        if cached is None or cached[0] is not graph or cached[1] != graph.version:
+            sites: list[Site] = []
+            for node in graph.nodes.values():
+                sites.extend(cast(list[Site], node.get_buildings_by_type(Site)))
+            cached = (graph, graph.version, sites)
+            self._site_cache = cached
+            self._destination_candidates.clear()
+            self._spawn_queue = None
+            self._sites_by_id = {}
+            for site in sites:
+                self._sites_by_id.setdefault(site.id, site)
+        return cached[2]
+
+    def _get_destination_candidates(self, site: Site) -> tuple[SiteID, ...]:
+        """Get the IDs of all other sites, built once per site and graph version."""
+        sites = self._get_sites()
+        candidates = self._destination_candidates.get(site.id)
+        if candidates is None:
+            candidates = tuple(other.id for other in sites if other.id != site.id)
+            self._destination_candidates[site.id] = candidates
+        return candidates
+
     def _process_sites(self, current_tick: int) -> None:
         """Process all sites for package spawning and expiry checking."""
-        # Get all sites from graph nodes
-        sites: list[Site] = []
-        for node in self.graph.nodes.values():
-            for building in node.buildings:
-                if isinstance(building, Site):
-                    sites.append(building)
+        due_sites = self._pop_due_sites(current_tick)
+        if due_sites:
+            self._spawn_packages(due_sites, current_tick)
 
-        # Process each site
-        for site in sites:
-            # Check for package spawning
-            if site.should_spawn_package(self.dt_s):
-                self._spawn_package_at_site(site, current_tick)
-
-            # Check for package expiry
-            self._check_package_expiry_at_site(site, current_tick)
+        # Check for package expiry
+        self._expire_packages(current_tick)
 
-    def _spawn_package_at_site(self, site: "Site", current_tick: int) -> None:
-        """Spawn a new package at a site."""
+    def _pop_due_sites(self, current_tick: int) -> list[Site]:
+        """Return the sites that spawn a package this tick.
 
-        from core.buildings.site import Site as SiteType
-        from core.packages.package import Package
-        from core.types import PackageID, SiteID
+        Sites wait in a min-heap keyed by their next scheduled spawn tick, so a tick
+        only touches sites that are due rather than checking every site. Each popped
+        site is rescheduled by ``Site.is_spawn_due``; an entry made stale by an
+        outside call to it is simply re-queued at the site's current schedule.
+        """
+        dt_s = self.dt_s
+        sites = self._get_sites()  # drops the queue if the graph changed
+        queue = self._spawn_queue
+        if queue is None:
+            queue = [
+                (site.next_spawn_tick(current_tick, dt_s), index, site)
+                for index, site in enumerate(sites)
+            ]
+            heapq.heapify(queue)
+            self._spawn_queue = queue
+
+        due_sites: list[Site] = []
+        while queue and queue[0][0] <= current_tick:
+            _, index, site = queue[0]
+            if site.is_spawn_due(current_tick, dt_s):
+                due_sites.append(site)
+            heapq.heapreplace(queue, (site.next_spawn_tick(current_tick, dt_s), index, site))
+        return due_sites
+
+    def _spawn_packages(self, sites: list[Site], current_tick: int) -> None:
+        """Spawn one new package at each of ``sites``.
+
+        Sites without any available destination are skipped.
+        """
+        get_candidates = self._get_destination_candidates
+        add_package = self.add_package
 
-        # Get available destination sites
-        available_sites: list[SiteID] = []
-        for node in self.graph.nodes.values():
-            for building in node.buildings:
-                if isinstance(building, SiteType) and building.id != site.id:
-                    available_sites.append(building.id)
+        for site in sites:
+            available_sites = get_candidates(site)
+            if not available_sites:
+                continue  # No destinations available
+
+            destination_site = site.select_destination(available_sites)
+            if not destination_site:
+                continue
+
+            params = site.generate_package_parameters()
+            package_id = PackageID(f"pkg-{site.id}-{current_tick}-{len(site.active_packages)}")
+            package = Package(
+                id=package_id,
+                origin_site=site.id,
+                destination_site=destination_site,
+                size=params["size"],
+                value_currency=params["value_currency"],
+                priority=params["priority"],
+                urgency=params["urgency"],
+                spawn_tick=current_tick,
+                pickup_deadline_tick=current_tick + params["pickup_deadline_tick"],
+                delivery_deadline_tick=current_tick + params["delivery_deadline_tick"],
+            )
 
-        if not available_sites:
-            return  # No destinations available
+            # Add to world and site
+            add_package(package)
+            site.add_package(package_id)
+            site.record_generated()
 
-        # Select destination
-        destination_site = site.select_destination(available_sites)
-        if not destination_site:
-            return
+    def _expire_packages(self, current_tick: int) -> None:
+        """Expire packages whose pickup deadline has passed.
 
-        # Generate package parameters
-        params = site.generate_package_parameters()
-
-        # Create package ID
-        package_id = PackageID(f"pkg-{site.id}-{current_tick}-{len(site.active_packages)}")
-
-        # Create package
-        package = Package(
-            id=package_id,
-            origin_site=site.id,
-            destination_site=destination_site,
-            size=params["size"],
-            value_currency=params["value_currency"],
-            priority=params["priority"],
-            urgency=params["urgency"],
-            spawn_tick=current_tick,
-            pickup_deadline_tick=current_tick + params["pickup_deadline_tick"],
-            delivery_deadline_tick=current_tick + params["delivery_deadline_tick"],
+        Only heap entries with a deadline at or before ``current_tick`` are visited.
+        Entries for packages that are gone or were replaced are dropped; packages whose
+        origin site is not in the graph are kept and checked again next tick.
+        """
+        heap = self._expiry_heap
+        packages = self.packages
+        self._get_sites()  # refresh the site index if the graph changed
+        sites_by_id = self._sites_by_id
+        deferred: list[tuple[int, PackageID]] = []
+
+        while heap and heap[0][0] <= current_tick:
+            entry = heapq.heappop(heap)
+            package = packages.get(entry[1])
+            if package is None or package.pickup_deadline_tick > current_tick:
+                continue  # Removed, or re-added under the same ID with a later deadline
+            site = sites_by_id.get(package.origin_site)
+            if site is None:
+                deferred.append(entry)
+                continue
+            self._expire_package(site, package)
+
+        for entry in deferred:
+            heapq.heappush(heap, entry)
+
+    def _expire_package(self, site: Site, package: Package) -> None:
+        """Mark a package expired, update its origin site and remove it from the world."""
+        package_id = package.id
+        package.status = package.status.__class__("EXPIRED")
+
+        # Store package data before removal
+        package_data = package.to_dict()
+        value_lost = package.value_currency
+
+        # Update site statistics
+        site.record_expired(value_lost)
+        site.remove_package(package_id)
+
+        # Emit expiry event before removal
+        self.emit_event(
+            {
+                "type": "package_expired",
+                "package_id": package_id,
+                "site_id": site.id,
+                "value_lost": value_lost,
+                "data": package_data,
+            }
         )
 
-        # Add to world and site
-        self.add_package(package)
-        site.add_package(package_id)
-        site.update_statistics("generated")
-
-    def _check_package_expiry_at_site(self, site: "Site", current_tick: int) -> None:
-        """Check for expired packages at a site."""
-
-        expired_packages = []
-        # Check all packages that originated from this site
-        from core.types import SiteID
-
-        site_id: SiteID = site.id
-        for package_id, package in self.packages.items():
-            if package.origin_site == site_id and package.is_expired(current_tick):
-                expired_packages.append(package_id)
-
-        # Process expired packages
-        for package_id in expired_packages:
-            package = self.packages[package_id]
-            package.status = package.status.__class__("EXPIRED")
-
-            # Store package data before removal
-            package_data = package.to_dict()
-            value_lost = package.value_currency
-
-            # Update site statistics
-            site.update_statistics("expired", value_lost)
-            site.remove_package(package_id)
-
-            # Emit expiry event before removal
-            self.emit_event(
-                {
-                    "type": "package_expired",
-                    "package_id": package_id,
-                    "site_id": site.id,
-                    "value_lost": value_lost,
-                    "data": package_data,
-                }
-            )
-
-            # Remove package from world (directly without emitting event)
-            del self.packages[package_id]
+        # Remove package from world (directly without emitting event)
+        del self.packages[package_id]
 
     def _update_daily_fuel_price(self) -> None:
         """Update global fuel price once per simulation day.
@@ -533,11 +683,34 @@ class World:
         Returns:
             List of serialized building states for buildings that have changed.
         """
+        self._track_building_dirtiness()
+        dirty = self.dirty_buildings
+        if not dirty:
+            return []
+
         updates: list[dict[str, Any]] = []
-        for node in self.graph.nodes.values():
-            for building in node.buildings:
-                if isinstance(building, Building) and building.is_dirty():
-                    diff = building.serialize_diff()
-                    if diff is not None:
-                        updates.append(diff)
+        for building in dirty.values():
+            diff = building.serialize_diff()
+            if diff is not None:
+                updates.append(diff)
+        dirty.clear()
         return updates
+
+    def _track_building_dirtiness(self) -> None:
+        """Point every building's dirty reports at ``dirty_buildings``.
+
+        Walks the graph only when it is replaced or its version changes, so the
+        per-tick cost of collecting building updates is proportional to the number
+        of dirty buildings rather than to all buildings.
+        """
+        graph = self.graph
+        tracked = self._dirty_tracking_graph
+        if tracked is not None and tracked[0] is graph and tracked[1] == graph.version:
+            return
+
+        dirty = self.dirty_buildings
+        dirty.clear()
+        for node in graph.nodes.values():
+            for building in node.buildings:
+                building.track_dirty(dirty)
+        self._dirty_tracking_graph = (graph, graph.version)